@@ -0,0 +1,107 @@
+"""
+قياس الحمل للنشر المتزامن وغير المتزامن - منصة نائبك.كوم
+
+يرسل نفس مزيج طلبات القراءة الساخنة بتوازٍ ثابت إلى كل نشر (gunicorn
+بعمال WSGI، وgunicorn بعمال uvicorn مع CONTENT_ASYNC_VIEWS=True) ويطبع
+الطلبات في الثانية وزمن الاستجابة (p50/p95/p99) والأخطاء.
+
+التشغيل (بعد docker compose up: المتزامن على 8000 وغير المتزامن على 8001):
+    python benchmarks/async_views.py \\
+        --target sync=http://localhost:8000 --target async=http://localhost:8001 \\
+        --concurrency 64 --requests 3000
+
+--cold يطلب صفحات نواب ومعاملات بحث مختلفة في كل طلب فلا تُخدم من
+الـ cache، لقياس أثر الاستعلامات البطيئة على العمال.
+"""
+
+import argparse
+import itertools
+import statistics
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+HOT_PATHS = [
+    '/api/representatives/',
+    '/api/representatives/?governorate=القاهرة',
+    '/api/statistics/',
+    '/api/search/?q=محمد',
+    '/api/filter-options/',
+    '/api/colors/scheme/',
+    '/api/settings/',
+]
+
+
+def request_paths(base_url, count, cold):
+    """مسارات الطلبات بالترتيب (مزيج دوري من المسارات الساخنة)"""
+    paths = itertools.cycle(HOT_PATHS)
+    for index in range(count):
+        path = next(paths)
+        if cold:
+            # معامل مختلف في كل طلب يتجاوز الـ cache
+            separator = '&' if '?' in path else '?'
+            path = f'{path}{separator}page_size={index % 50 + 1}&page={index // 50 % 5 + 1}'
+        yield base_url.rstrip('/') + urllib.parse.quote(path, safe='/?=&')
+
+
+def fetch(url, timeout):
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            response.read()
+            ok = response.status < 500
+    except urllib.error.HTTPError as e:
+        ok = e.code < 500
+    except (urllib.error.URLError, TimeoutError):
+        ok = False
+    return time.perf_counter() - started, ok
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def run(label, base_url, args):
+    urls = list(request_paths(base_url, args.requests, args.cold))
+    # إحماء الاتصالات والـ cache قبل القياس
+    for url in urls[:len(HOT_PATHS)]:
+        fetch(url, args.timeout)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda url: fetch(url, args.timeout), urls))
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency * 1000 for latency, _ in results]
+    errors = sum(1 for _, ok in results if not ok)
+    print(
+        f'{label:<8} rps={len(results) / elapsed:<8.1f} '
+        f'p50={statistics.median(latencies):<7.1f} p95={percentile(latencies, 0.95):<7.1f} '
+        f'p99={percentile(latencies, 0.99):<7.1f} errors={errors}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--target', action='append', required=True, metavar='LABEL=URL',
+        help='النشر المقاس، مثل sync=http://localhost:8000 (يتكرر)'
+    )
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=3000)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--cold', action='store_true', help='تجاوز الـ cache بمعاملات مختلفة')
+    args = parser.parse_args()
+
+    for target in args.target:
+        label, separator, base_url = target.partition('=')
+        if not separator:
+            parser.error(f'هدف غير صالح: {target} (الصيغة LABEL=URL)')
+        run(label, base_url, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+قياس استعلامات صفحة قائمة النواب - منصة نائبك.كوم
+
+يقارن بين الـ queryset الكامل (كل الأعمدة ودون JOIN) والـ queryset
+المشكل للقوائم (select_related + only) عند تحويل صفحة من النواب بـ
+RepresentativeListSerializer: عدد الاستعلامات والبايتات المنقولة من
+قاعدة البيانات والزمن.
+
+التشغيل (قاعدة SQLite في الذاكرة):
+    python benchmarks/list_queries.py --rows 500 --page-size 100
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'content_service.test_settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext, setup_test_environment  # noqa: E402
+
+
+def seed(rows):
+    from content.models import Governorate, District, PoliticalParty, Representative
+
+    governorates = Governorate.objects.bulk_create([
+        Governorate(name=f'محافظة {index}', code=f'G{index}') for index in range(10)
+    ])
+    districts = District.objects.bulk_create([
+        District(name=f'دائرة {index}', governorate=governorates[index % 10], number=index)
+        for index in range(50)
+    ])
+    parties = PoliticalParty.objects.bulk_create([
+        PoliticalParty(name=f'حزب {index}') for index in range(10)
+    ])
+    Representative.objects.bulk_create([
+        Representative(
+            name=f'نائب رقم {index}', slug=f'rep-{index}', gender='male',
+            district=districts[index % 50], party=parties[index % 10],
+            bio='سيرة ذاتية طويلة ' * 150, electoral_program='برنامج انتخابي ' * 150,
+            admin_approved=True, rating=index % 5,
+        )
+        for index in range(rows)
+    ])
+
+
+def transferred_bytes(queries):
+    """حجم البيانات التي تعيدها الاستعلامات الملتقطة (بإعادة تنفيذها)"""
+    total = 0
+    with connection.cursor() as cursor:
+        for query in queries:
+            cursor.execute(query['sql'])
+            for row in cursor.fetchall():
+                total += sum(len(str(value).encode('utf-8')) for value in row if value is not None)
+    return total
+
+
+def measure(label, queryset, page_size):
+    from content.serializers import RepresentativeListSerializer
+
+    with CaptureQueriesContext(connection) as captured:
+        started = time.perf_counter()
+        data = RepresentativeListSerializer(list(queryset[:page_size]), many=True).data
+        elapsed = (time.perf_counter() - started) * 1000
+    print(
+        f'{label:<10} rows={len(data):<5} queries={len(captured.captured_queries):<5} '
+        f'bytes={transferred_bytes(captured.captured_queries):<10} ms={elapsed:.1f}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+    seed(args.rows)
+
+    from content.querysets import public_representatives, representative_list_queryset
+
+    measure('baseline', public_representatives(), args.page_size)
+    measure('shaped', representative_list_queryset(), args.page_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+قياس تكلفة تحويل الصفوف في الـ serializers - منصة نائبك.كوم
+
+يقارن زمن تحويل الصف الواحد بين الـ serializer العادي (كائنات النموذج
+عبر ModelSerializer) والمسار السريع (صفوف values() وخطة الحقول)
+لـ RepresentativeListSerializer وGovernorateSerializer وDistrictSerializer
+وPoliticalPartySerializer. الصفوف تُجلب مرة واحدة قبل القياس، فالأرقام
+تكلفة المعالج فقط دون قاعدة البيانات.
+
+التشغيل:
+    python benchmarks/serializers.py --rows 1000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'content_service.test_settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+from list_queries import seed  # noqa: E402
+
+
+def best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+    seed(args.rows)
+
+    from content.models import Governorate, District, PoliticalParty
+    from content.querysets import representative_list_queryset
+    from content.serializers import (
+        GovernorateSerializer, DistrictSerializer, PoliticalPartySerializer,
+        RepresentativeListSerializer
+    )
+
+    cases = [
+        (RepresentativeListSerializer, representative_list_queryset()),
+        (GovernorateSerializer, Governorate.objects.all()),
+        (DistrictSerializer, District.objects.select_related('governorate')),
+        (PoliticalPartySerializer, PoliticalParty.objects.all()),
+    ]
+    print(f'{"serializer":<30} {"rows":>6} {"drf us/row":>11} {"fast us/row":>12} {"speedup":>8}')
+    for serializer_class, queryset in cases:
+        instances = list(queryset)
+        rows = list(serializer_class.fast_values(queryset))
+        drf = best_of(args.repeat, lambda: serializer_class(instances, many=True).data)
+        fast = best_of(args.repeat, lambda: serializer_class.fast_serialize(rows))
+        count = len(rows)
+        print(
+            f'{serializer_class.__name__:<30} {count:>6} {drf / count * 1e6:>11.1f} '
+            f'{fast / count * 1e6:>12.1f} {drf / fast:>7.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -4,12 +4,16 @@
 
 import os
 import django
+import pytest
 from django.conf import settings
 from django.test.utils import get_runner
 
 def pytest_configure():
     """إعداد Django للاختبارات"""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'content_service.settings')
+    # pytest.ini يحدد test_settings تحت قسم [tool:pytest] الذي لا يقرؤه pytest
+    # من pytest.ini، فكانت الاختبارات تعمل بـ settings (Redis من REDIS_URL وقاعدة
+    # DATABASE_URL). test_settings: SQLite في الذاكرة وLocMemCache لـ default وlocal.
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'content_service.test_settings')
     django.setup()
     
     # إعداد قاعدة بيانات الاختبار
@@ -31,3 +35,23 @@ def pytest_configure():
             SECRET_KEY='test-secret-key',
             USE_TZ=True,
         )
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    تفريغ الـ cache بين الاختبارات حتى لا تتسرب الاستجابات المخزنة: قاعدة
+    الاختبار تُعاد لكل اختبار، أما الـ cache وحالة العملية (الطبقة المحلية
+    وفهرس الاقتراحات وعدادات الزيارات) فتبقى، فيخدم اختبار استجابة خزنها
+    اختبار سابق لبيانات لم تعد موجودة.
+    """
+    from django.core.cache import caches
+    from content.cache import local_cache
+    from content.suggest import reset_suggestion_index
+    from content.warming import traffic
+    for alias in settings.CACHES:
+        caches[alias].clear()
+    local_cache.clear()
+    reset_suggestion_index()
+    traffic.clear()
+    yield
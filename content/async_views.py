@@ -0,0 +1,247 @@
+"""
+Views غير متزامنة لخدمة المحتوى - منصة نائبك.كوم
+
+نسخ async من مسارات القراءة الساخنة (قائمة النواب وتفاصيلهم، البحث،
+الإحصائيات، خيارات الفلاتر، نظام الألوان، إعدادات الموقع) للتشغيل تحت
+ASGI (uvicorn): الاستعلام البطيء ينتظر دون أن يحجز العامل كله كما في
+عمال gunicorn المتزامنين.
+
+تُفعل بـ CONTENT_ASYNC_VIEWS=True فتحل محل الـ views المتزامنة على نفس
+المسارات (use_async_routes). تقرأ وتكتب نفس مفاتيح الـ cache وتنتج نفس
+JSON، فيمكن تشغيل النوعين معاً. قراءة Redis تنتظر في thread دون أن توقف
+حلقة الأحداث؛ وعند الإخفاق تُستخدم استعلامات ORM غير المتزامنة (aget،
+aaggregate، async for). ما بقي متزامناً يُنفذ بـ sync_to_async: طرق العد
+والترقيم بالمؤشر، وبناء فلاتر القائمة (البحث التقريبي دون PostgreSQL
+يقرأ الجدول). الطلبات غير GET تُحول إلى الـ view المتزامن.
+"""
+
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.urls import path
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.request import Request
+from rest_framework.views import exception_handler
+
+from . import views, warming
+from .cache import aget_singleton, aserve_cached
+from .filter_options import aget_bundle
+from .models import ColorSettings, PlatformStatsSnapshot, SiteSettings
+from .pagination import KeysetPagination, count_queryset, uses_cursor_pagination
+from .querysets import aprefetch_detail
+from .renderers import dumps
+from .serializers import RepresentativeListSerializer, SiteSettingsSerializer, StatisticsSerializer
+from .stats import aget_statistics
+
+
+def json_response(data, status=200):
+    return HttpResponse(dumps(data), status=status, content_type='application/json')
+
+
+def error_response(exc):
+    """نفس استجابة معالج أخطاء DRF (ValidationError، NotFound ...)"""
+    response = exception_handler(exc, {})
+    return json_response(response.data, response.status_code)
+
+
+def read_only(sync_view):
+    """
+    Decorator: طلبات GET للـ view غير المتزامن، والبقية (التعديل، HEAD،
+    OPTIONS) للـ view المتزامن على نفس المسار
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        async def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return await sync_to_async(sync_view)(request, *args, **kwargs)
+            return await view_func(request, *args, **kwargs)
+        # مثل views الـ DRF؛ csrf_exempt في Django 4.2 لا يدعم الدوال async
+        wrapper.csrf_exempt = True
+        wrapper.sync_view = sync_view
+        return wrapper
+    return decorator
+
+
+def drf_view(view_class, request, **kwargs):
+    """نسخة من view الـ DRF لإعادة استخدام فلاترها وترقيمها و serializer"""
+    view = view_class()
+    view.args, view.kwargs, view.format_kwarg, view.headers = (), kwargs, None, {}
+    view.request = view.initialize_request(request)
+    return view
+
+
+# ========== النواب ==========
+
+@read_only(views.RepresentativeListView.as_view())
+async def representative_list_view(request):
+    """قائمة النواب مع الفلاتر والبحث"""
+    view = drf_view(views.RepresentativeListView, request)
+    filtered = {}
+
+    async def queryset():
+        if 'queryset' not in filtered:
+            filtered['queryset'] = await sync_to_async(view.filter_queryset)(view.get_queryset())
+        return filtered['queryset']
+
+    async def validators():
+        return await view.aget_validators(await queryset())
+
+    async def compute():
+        rows = RepresentativeListSerializer.fast_values(await queryset())
+        page = await sync_to_async(view.paginate_queryset)(rows)
+        data = RepresentativeListSerializer.fast_serialize(page, view.get_serializer_context())
+        return view.get_paginated_response(data).data
+
+    try:
+        return await aserve_cached(
+            request, 'RepresentativeListView', view.cache_models, compute, view.cache_timeout, validators
+        )
+    except APIException as exc:
+        return error_response(exc)
+
+
+@read_only(views.RepresentativeDetailView.as_view())
+async def representative_detail_view(request, slug):
+    """تفاصيل النائب بالرابط العربي"""
+    view = drf_view(views.RepresentativeDetailView, request, slug=slug)
+
+    async def compute():
+        try:
+            representative = await view.get_queryset().aget(slug=slug)
+        except view.queryset.model.DoesNotExist:
+            raise NotFound()
+        return view.get_serializer(await aprefetch_detail(representative)).data
+
+    try:
+        response = await aserve_cached(
+            request, 'RepresentativeDetailView', view.cache_models, compute, view.cache_timeout,
+            view.aget_validators
+        )
+    except APIException as exc:
+        return error_response(exc)
+    if response.status_code in (200, 304) and not getattr(request, 'cache_warming', False):
+        await warming.traffic.ahit(slug)
+    return response
+
+
+# ========== الإحصائيات والبحث ==========
+
+@read_only(views.statistics_view)
+async def statistics_view(request):
+    """إحصائيات شاملة للمنصة"""
+    async def compute():
+        try:
+            return StatisticsSerializer(await aget_statistics()).data
+        except Exception as e:
+            return json_response({'error': str(e)}, 500)
+
+    return await aserve_cached(
+        request, 'statistics_view', views.REPRESENTATIVE_LIST_MODELS + (PlatformStatsSnapshot,), compute
+    )
+
+
+@read_only(views.search_view)
+async def search_view(request):
+    """البحث المتقدم في النواب"""
+    async def compute():
+        try:
+            query, fuzzy, page, page_size = views.search_params(request)
+            if not query:
+                return json_response({'error': 'يجب إدخال كلمة البحث'}, 400)
+
+            # البحث التقريبي دون PostgreSQL يقرأ الجدول أثناء بناء الاستعلام
+            representatives = await sync_to_async(views.search_queryset)(query, fuzzy)
+            rows = RepresentativeListSerializer.fast_values(representatives)
+            drf_request = Request(request)
+            context = {'request': drf_request}
+
+            if uses_cursor_pagination(drf_request):
+                paginator = KeysetPagination()
+                page_representatives = await sync_to_async(paginator.paginate_queryset)(rows, drf_request)
+                return views.cursor_search_data(paginator, page_representatives, context)
+
+            total_count, count_exact = await sync_to_async(count_queryset)(representatives)
+            start = (page - 1) * page_size
+            page_representatives = [row async for row in rows[start:start + page_size + 1]]
+            return views.search_page_data(
+                page_representatives, total_count, count_exact, page, page_size, context
+            )
+        except APIException:
+            raise
+        except Exception as e:
+            return json_response({'error': str(e)}, 500)
+
+    try:
+        return await aserve_cached(request, 'search_view', views.REPRESENTATIVE_LIST_MODELS, compute)
+    except APIException as exc:
+        return error_response(exc)
+
+
+# ========== الموارد شبه الثابتة ==========
+
+@read_only(views.filter_options_view)
+async def filter_options_view(request):
+    """خيارات الفلاتر المتاحة (?districts=lazy: الدوائر في أجزاء لكل محافظة)"""
+    bundle = await aget_bundle()
+    variants = bundle['lazy'] if request.GET.get('districts') == 'lazy' else bundle['full']
+    return views.encoded_response(request, variants)
+
+
+@read_only(views.filter_options_districts_view)
+async def filter_options_districts_view(request, governorate_id):
+    """دوائر محافظة واحدة من حزمة خيارات الفلاتر"""
+    chunk = (await aget_bundle())['districts'].get(str(governorate_id))
+    if chunk is None:
+        return json_response({'error': 'المحافظة غير موجودة'}, 404)
+    return views.encoded_response(request, chunk)
+
+
+async def _load_color_scheme():
+    return views.build_color_scheme([row async for row in views.active_colors()])
+
+
+@read_only(views.get_color_scheme)
+async def color_scheme_view(request):
+    """الحصول على نظام الألوان الكامل"""
+    try:
+        return json_response(await aget_singleton('color_scheme', (ColorSettings,), _load_color_scheme))
+    except Exception as e:
+        return json_response({'error': str(e)}, 500)
+
+
+@read_only(views.SiteSettingsView.as_view())
+async def site_settings_view(request):
+    """إعدادات الموقع (التعديل عبر الـ view المتزامن)"""
+    async def load():
+        site_settings, _ = await SiteSettings.objects.aget_or_create(defaults=views.SITE_SETTINGS_DEFAULTS)
+        return dict(SiteSettingsSerializer(site_settings, context={'request': Request(request)}).data)
+
+    return json_response(await aget_singleton(
+        f'site_settings:{request.build_absolute_uri("/")}', (SiteSettings,), load
+    ))
+
+
+# ========== المسارات ==========
+
+# اسم المسار في content/urls.py: الـ view غير المتزامن البديل
+ASYNC_ROUTES = {
+    'representative-list': representative_list_view,
+    'representative-detail': representative_detail_view,
+    'representative-page-arabic': representative_detail_view,
+    'statistics': statistics_view,
+    'search': search_view,
+    'filter-options': filter_options_view,
+    'filter-options-districts': filter_options_districts_view,
+    'color-scheme': color_scheme_view,
+    'site-settings': site_settings_view,
+}
+
+
+def use_async_routes(urlpatterns):
+    """نفس المسارات مع استبدال views القراءة الساخنة بنسخها غير المتزامنة"""
+    return [
+        path(str(pattern.pattern), ASYNC_ROUTES[pattern.name], name=pattern.name)
+        if getattr(pattern, 'name', None) in ASYNC_ROUTES else pattern
+        for pattern in urlpatterns
+    ]
@@ -0,0 +1,729 @@
+"""
+طبقة التخزين المؤقت لخدمة المحتوى - منصة نائبك.كوم
+
+تخزن الاستجابات بعد تحويلها إلى JSON، بمفتاح يتكون من المسار
+ومعاملات الاستعلام بعد ترتيبها ورقم "جيل" لكل نموذج تعتمد عليه
+الاستجابة. أي حفظ أو حذف على النموذج يرفع رقم جيله، فتتغير كل
+المفاتيح المعتمدة عليه دفعة واحدة دون البحث عنها أو حذفها.
+
+تحمل الاستجابات ETag وLast-Modified؛ الطلب الشرطي (If-None-Match أو
+If-Modified-Since) يحصل على 304 قبل تحويل أي بيانات.
+
+الحماية من التدافع: عند انتهاء مفتاح ساخن لا يعيد كل عمال gunicorn
+حسابه معاً. عامل واحد يأخذ عقد إيجار (SETNX في Redis) ويحسب القيمة،
+والبقية تخدم القيمة القديمة حتى يكتمل الحساب (stale-while-revalidate)،
+أو تنتظره قليلاً إن لم توجد قيمة قديمة. ويبدأ التحديث قبل الانتهاء
+باحتمال يزيد كلما اقترب الانتهاء وطال زمن الحساب (XFetch).
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.db.models import Max
+from django.utils.http import http_date, parse_http_date
+from rest_framework.response import Response
+
+from .renderers import dumps
+
+logger = logging.getLogger(__name__)
+
+# مدة تخزين الاستجابات (بالثواني)
+RESPONSE_CACHE_TIMEOUT = getattr(settings, 'CONTENT_CACHE_TIMEOUT', 300)
+
+# مدة تجاوز Redis بعد فشل الاتصال قبل المحاولة مرة أخرى
+FALLBACK_RETRY_SECONDS = getattr(settings, 'CONTENT_CACHE_FALLBACK_RETRY', 30)
+
+# الطبقة المحلية للموارد شبه الثابتة: الحجم والصلاحية وفترة مراجعة الأجيال
+LOCAL_CACHE_SIZE = getattr(settings, 'CONTENT_LOCAL_CACHE_SIZE', 256)
+LOCAL_CACHE_TTL = getattr(settings, 'CONTENT_LOCAL_CACHE_TTL', 60)
+LOCAL_CACHE_RECHECK = getattr(settings, 'CONTENT_LOCAL_CACHE_RECHECK', 1.0)
+
+# مدة خدمة القيمة بعد انتهائها أثناء تحديثها، ومدة عقد الإيجار، وأقصى
+# انتظار لمن لا يجد قيمة قديمة (بالثواني)
+STALE_TTL = getattr(settings, 'CONTENT_CACHE_STALE_TTL', 300)
+LEASE_TIMEOUT = getattr(settings, 'CONTENT_CACHE_LEASE_TIMEOUT', 30)
+LEASE_WAIT = getattr(settings, 'CONTENT_CACHE_LEASE_WAIT', 5.0)
+LEASE_POLL_INTERVAL = 0.05
+
+# معامل XFetch: أكبر من 1 يبدأ التحديث المبكر أبكر
+XFETCH_BETA = getattr(settings, 'CONTENT_CACHE_XFETCH_BETA', 1.0)
+
+
+async def _acache_call(cache, method, *args, **kwargs):
+    """
+    استدعاء async لـ backend الـ cache. backends في Django 4.2 (Redis)
+    لا تملك تنفيذ async حقيقياً، فيُنفذ الأصل المتزامن في thread حتى لا
+    يوقف انتظار الشبكة (أو مهلة الاتصال عند تعطل Redis) حلقة الأحداث.
+    الـ cache المحلي في الذاكرة بلا I/O فيُستدعى مباشرة دون الانتقال.
+    """
+    if getattr(type(cache), method) is not getattr(BaseCache, method):
+        return await getattr(cache, method)(*args, **kwargs)
+    sync_method = getattr(cache, method[1:])
+    if isinstance(cache, LocMemCache):
+        return sync_method(*args, **kwargs)
+    return await sync_to_async(sync_method, thread_sensitive=False)(*args, **kwargs)
+
+
+class ResilientCache:
+    """
+    غلاف حول الـ cache المشترك (Redis) يتحول إلى cache محلي في الذاكرة
+    عند تعذر الاتصال، ويعيد المحاولة بعد FALLBACK_RETRY_SECONDS.
+    """
+
+    def __init__(self, alias='default', fallback_alias='local'):
+        self.alias = alias
+        self.fallback_alias = fallback_alias
+        self._down_until = 0.0
+
+    @property
+    def is_degraded(self):
+        return time.monotonic() < self._down_until
+
+    def _call(self, method, *args, **kwargs):
+        if not self.is_degraded:
+            try:
+                return getattr(caches[self.alias], method)(*args, **kwargs)
+            except ValueError:
+                raise
+            except Exception as e:
+                logger.warning('تعذر الوصول إلى الـ cache المشترك، استخدام الذاكرة المحلية: %s', e)
+                self._down_until = time.monotonic() + FALLBACK_RETRY_SECONDS
+        return getattr(caches[self.fallback_alias], method)(*args, **kwargs)
+
+    async def _acall(self, method, *args, **kwargs):
+        if not self.is_degraded:
+            try:
+                return await _acache_call(caches[self.alias], method, *args, **kwargs)
+            except ValueError:
+                raise
+            except Exception as e:
+                logger.warning('تعذر الوصول إلى الـ cache المشترك، استخدام الذاكرة المحلية: %s', e)
+                self._down_until = time.monotonic() + FALLBACK_RETRY_SECONDS
+        return await _acache_call(caches[self.fallback_alias], method, *args, **kwargs)
+
+    def get(self, key, default=None):
+        return self._call('get', key, default)
+
+    def get_many(self, keys):
+        return self._call('get_many', keys)
+
+    def set(self, key, value, timeout=RESPONSE_CACHE_TIMEOUT):
+        return self._call('set', key, value, timeout)
+
+    def add(self, key, value, timeout=RESPONSE_CACHE_TIMEOUT):
+        return self._call('add', key, value, timeout)
+
+    def incr(self, key, delta=1):
+        return self._call('incr', key, delta)
+
+    def delete(self, key):
+        return self._call('delete', key)
+
+    # النسخ غير المتزامنة للـ views تحت ASGI
+
+    async def aget(self, key, default=None):
+        return await self._acall('aget', key, default)
+
+    async def aget_many(self, keys):
+        return await self._acall('aget_many', keys)
+
+    async def aset(self, key, value, timeout=RESPONSE_CACHE_TIMEOUT):
+        return await self._acall('aset', key, value, timeout)
+
+    async def aadd(self, key, value, timeout=RESPONSE_CACHE_TIMEOUT):
+        return await self._acall('aadd', key, value, timeout)
+
+    async def adelete(self, key):
+        return await self._acall('adelete', key)
+
+
+shared_cache = ResilientCache()
+
+
+# ========== عدادات الإصابة ==========
+
+_counters = {'hits': 0, 'misses': 0, 'stale': 0}
+_counters_lock = threading.Lock()
+
+
+def _count(name):
+    with _counters_lock:
+        _counters[name] += 1
+
+
+def cache_stats():
+    """عدادات الإصابة والإخفاق لهذه العملية"""
+    with _counters_lock:
+        hits, misses, stale = _counters['hits'], _counters['misses'], _counters['stale']
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'stale': stale,
+        'hit_ratio': round(hits / total, 3) if total else 0.0,
+        'degraded': shared_cache.is_degraded,
+    }
+
+
+def reset_cache_stats():
+    with _counters_lock:
+        _counters['hits'] = _counters['misses'] = _counters['stale'] = 0
+
+
+# ========== أجيال النماذج ==========
+
+def generation_key(model):
+    return f'gen:{model._meta.label_lower}'
+
+
+def get_generations(models):
+    """أرقام الأجيال الحالية لمجموعة نماذج (بترتيبها)"""
+    keys = [generation_key(model) for model in models]
+    found = shared_cache.get_many(keys)
+    generations = []
+    for key in keys:
+        if key not in found:
+            # جيل مفقود (أول استخدام أو حذف من Redis): نبدأ من قيمة زمنية
+            # حتى لا نعود لرقم قديم ما زالت استجاباته مخزنة
+            shared_cache.add(key, time.time_ns(), None)
+            found[key] = shared_cache.get(key, 0)
+        generations.append(found[key])
+    return tuple(generations)
+
+
+def _bump(key):
+    try:
+        shared_cache.incr(key)
+    except ValueError:
+        shared_cache.add(key, time.time_ns(), None)
+
+
+def bump_generation(model):
+    """
+    رفع جيل النموذج فوراً ومرة أخرى بعد تأكيد المعاملة، حتى لا تُخزن
+    قراءة تمت قبل الـ commit تحت الجيل الجديد.
+    """
+    key = generation_key(model)
+    _bump(key)
+    local_cache.discard_model(model)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump(key))
+
+
+# ========== الحماية من التدافع ==========
+
+def store_entry(key, value, generations, timeout, delta):
+    """
+    تخزين القيمة مع أجيالها وموعد انتهائها وزمن حسابها (delta). تبقى في
+    Redis STALE_TTL بعد الانتهاء لتُخدم قديمة أثناء التحديث.
+    """
+    shared_cache.set(key, (value, generations, time.time() + timeout, delta), timeout + STALE_TTL)
+
+
+def is_fresh(entry, generations):
+    """
+    القيمة صالحة إن طابقت الأجيال الحالية ولم يختر XFetch تحديثها مبكراً:
+    يُحدث قبل الانتهاء بـ delta * beta * -log(rand)، فيبدأ عامل واحد غالباً
+    التحديث قبل أن تنتهي القيمة على الجميع.
+    """
+    _, entry_generations, expires_at, delta = entry
+    if entry_generations != tuple(generations):
+        return False
+    return time.time() - delta * XFETCH_BETA * math.log(1.0 - random.random()) < expires_at
+
+
+def lease_key(key):
+    return f'lease:{key}'
+
+
+def acquire_lease(key):
+    """عقد إيجار لتحديث المفتاح (SETNX مع مدة)؛ يعيد رمزه أو None إن كان مع غيره"""
+    token = uuid.uuid4().hex
+    if shared_cache.add(lease_key(key), token, LEASE_TIMEOUT):
+        return token
+    return None
+
+
+def release_lease(key, token):
+    # لا يُحذف عقد أخذه عامل آخر بعد انتهاء عقدنا
+    if token is not None and shared_cache.get(lease_key(key)) == token:
+        shared_cache.delete(lease_key(key))
+
+
+def wait_for_entry(key, generations, wait=None):
+    """انتظار القيمة التي يحسبها صاحب العقد، أو None بعد LEASE_WAIT"""
+    deadline = time.monotonic() + (LEASE_WAIT if wait is None else wait)
+    while time.monotonic() < deadline:
+        time.sleep(LEASE_POLL_INTERVAL)
+        entry = shared_cache.get(key)
+        if entry is not None and entry[1] == tuple(generations):
+            return entry
+        if shared_cache.get(lease_key(key)) is None:
+            break
+    return None
+
+
+def lookup(key, generations):
+    """
+    قراءة المفتاح بحماية التدافع: (entry, token). entry القيمة المخزنة
+    لخدمتها (صالحة، أو قديمة وغيرنا يحدثها)، وإلا token عقد الإيجار
+    (أو None إن لم يكتمل حساب صاحب العقد في وقته) ويجب الحساب.
+    """
+    entry = shared_cache.get(key)
+    if entry is not None and is_fresh(entry, generations):
+        _count('hits')
+        return entry, None
+
+    token = acquire_lease(key)
+    if token is None:
+        if entry is not None:
+            _count('stale')
+            return entry, None
+        entry = wait_for_entry(key, generations)
+        if entry is not None:
+            _count('hits')
+            return entry, None
+
+    _count('misses')
+    return None, token
+
+
+def compute_entry(key, compute, generations=(), timeout=None):
+    """(القيمة، أجيالها): المخزنة إن وُجدت، وإلا محسوبة بعامل واحد ومخزنة"""
+    generations = tuple(generations)
+    entry, token = lookup(key, generations)
+    if entry is not None:
+        return entry[0], entry[1]
+    try:
+        started = time.monotonic()
+        value = compute()
+        store_entry(
+            key, value, generations, RESPONSE_CACHE_TIMEOUT if timeout is None else timeout,
+            time.monotonic() - started
+        )
+    finally:
+        release_lease(key, token)
+    return value, generations
+
+
+def get_or_compute(key, compute, generations=(), timeout=None):
+    """قيمة المفتاح (وقد تكون قديمة أثناء تحديثها)، أو حسابها وتخزينها"""
+    return compute_entry(key, compute, generations, timeout)[0]
+
+
+# ========== تخزين الاستجابات ==========
+
+def normalized_query_string(query_params):
+    """معاملات الاستعلام مرتبة ودون القيم الفارغة"""
+    pairs = sorted(
+        (key, value)
+        for key, values in query_params.lists()
+        for value in values
+        if value != ''
+    )
+    return '&'.join(f'{key}={value}' for key, value in pairs)
+
+
+def response_cache_key(request, namespace, renderer_format=None):
+    """
+    مفتاح الاستجابة دون الأجيال: الأجيال تُحفظ مع القيمة، فتبقى الاستجابة
+    السابقة متاحة لتُخدم قديمة أثناء إعادة حسابها بعد أي تعديل. روابط
+    الصور في الاستجابات مطلقة، لذا يدخل البروتوكول والمضيف في المفتاح.
+    """
+    if renderer_format is None:
+        renderer_format = getattr(getattr(request, 'accepted_renderer', None), 'format', '')
+    raw = '|'.join([
+        request.scheme,
+        request.get_host(),
+        request.path,
+        normalized_query_string(request.GET),
+        renderer_format,
+    ])
+    return f'resp:{namespace}:{hashlib.sha1(raw.encode("utf-8")).hexdigest()}'
+
+
+def validator_headers(key, validators=None):
+    """
+    ترويسات التحقق للاستجابة. validators دالة تعيد (signature, last_modified)
+    من البيانات نفسها (مثل أقصى updated_at)، أو None للاكتفاء
+    بمفتاح الـ cache الذي يحمل أجيال النماذج.
+    """
+    return state_headers(key, validators() if validators is not None else None)
+
+
+def state_headers(key, state):
+    """ETag وLast-Modified من المفتاح وحالة البيانات (أو None)"""
+    signature, last_modified = key, None
+    if state is not None:
+        signature, last_modified = f'{key}|{state[0]}', state[1]
+    headers = {'ETag': quote_etag(hashlib.sha1(signature.encode('utf-8')).hexdigest())}
+    if last_modified is not None:
+        headers['Last-Modified'] = http_date(last_modified.timestamp())
+    return headers
+
+
+def not_modified(request, headers):
+    """استجابة 304 (أو 412) إن طابقت ترويسات الطلب الشرطية، وإلا None"""
+    last_modified = headers.get('Last-Modified')
+    response = get_conditional_response(
+        request,
+        etag=headers['ETag'],
+        last_modified=parse_http_date(last_modified) if last_modified else None,
+    )
+    if response is not None:
+        for name, value in headers.items():
+            response[name] = value
+    return response
+
+
+def _cached_response(request, cached):
+    status_code, content_type, content, headers = cached
+    response = not_modified(request, headers)
+    if response is None:
+        response = HttpResponse(content, status=status_code, content_type=content_type)
+        for name, value in headers.items():
+            response[name] = value
+    return response
+
+
+def serve_cached(request, namespace, models, compute, timeout=None, validators=None):
+    """
+    إرجاع الاستجابة المخزنة أو حسابها وتخزينها بعد تحويلها إلى JSON. عامل
+    واحد يحسب الاستجابة المنتهية والبقية تخدم السابقة (lookup).
+    """
+    if request.method != 'GET':
+        return compute()
+
+    timeout = RESPONSE_CACHE_TIMEOUT if timeout is None else timeout
+    key = response_cache_key(request, namespace)
+    generations = get_generations(models)
+    entry, token = lookup(key, generations)
+    if entry is not None:
+        return _cached_response(request, entry[0])
+
+    try:
+        signature = f'{key}|{",".join(str(generation) for generation in generations)}'
+        headers = validator_headers(signature, validators)
+        response = not_modified(request, headers)
+        if response is not None:
+            release_lease(key, token)
+            return response
+
+        started = time.monotonic()
+        response = compute()
+    except Exception:
+        release_lease(key, token)
+        raise
+
+    if not (isinstance(response, Response) and response.status_code == 200):
+        release_lease(key, token)
+        return response
+
+    for name, value in headers.items():
+        response[name] = value
+
+    def store(rendered):
+        try:
+            store_entry(
+                key,
+                (rendered.status_code, rendered['Content-Type'], rendered.content, headers),
+                generations, timeout, time.monotonic() - started
+            )
+        finally:
+            release_lease(key, token)
+    response.add_post_render_callback(store)
+    return response
+
+
+class CachedResponseMixin:
+    """
+    Mixin لـ ListAPIView وRetrieveAPIView يخزن استجابات GET.
+    cache_models: النماذج التي يؤدي تعديلها إلى إبطال الاستجابة.
+    """
+    cache_models = ()
+    cache_timeout = None
+
+    def get(self, request, *args, **kwargs):
+        return serve_cached(
+            request,
+            type(self).__name__,
+            self.cache_models,
+            lambda: super(CachedResponseMixin, self).get(request, *args, **kwargs),
+            self.cache_timeout,
+            self.get_validators
+        )
+
+    def get_validators(self):
+        """
+        حالة البيانات من updated_at: للقائمة أقصى updated_at بعد الفلاتر،
+        وللتفاصيل updated_at للصف نفسه. الحذف والإضافة يغيران أجيال النماذج
+        الداخلة في التوقيع، فلا حاجة لـ COUNT كامل على القائمة مع كل طلب.
+        """
+        queryset = self.validators_queryset()
+        if queryset is None:
+            return None
+        return validator_state(queryset.aggregate(**VALIDATOR_AGGREGATES))
+
+    async def aget_validators(self, queryset=None):
+        """نسخة get_validators غير المتزامنة (queryset: نتيجة الفلاتر إن حُسبت)"""
+        queryset = self.validators_queryset(queryset)
+        if queryset is None:
+            return None
+        return validator_state(await queryset.aaggregate(**VALIDATOR_AGGREGATES))
+
+    def validators_queryset(self, queryset=None):
+        if queryset is None:
+            queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.order_by()
+        if not hasattr(queryset.model, 'updated_at'):
+            return None
+        lookup_url_kwarg = getattr(self, 'lookup_url_kwarg', None) or self.lookup_field
+        if lookup_url_kwarg in self.kwargs:
+            queryset = queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        return queryset
+
+
+VALIDATOR_AGGREGATES = {'last_modified': Max('updated_at')}
+
+
+def validator_state(state):
+    last_modified = state['last_modified']
+    return last_modified.isoformat() if last_modified else '', last_modified
+
+
+def cache_response(*models, timeout=None):
+    """Decorator لدوال الـ api_view (يوضع أسفل @api_view)"""
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            return serve_cached(
+                request,
+                view_func.__name__,
+                models,
+                lambda: view_func(request, *args, **kwargs),
+                timeout
+            )
+        return wrapper
+    return decorator
+
+
+# ========== الموارد شبه الثابتة (طبقتان) ==========
+
+class LocalLRUCache:
+    """cache داخل العملية محدود الحجم، كل عنصر له مدة صلاحية"""
+
+    def __init__(self, maxsize=LOCAL_CACHE_SIZE, ttl=LOCAL_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """إرجاع العنصر (أو None) مع نقله لآخر القائمة"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry['expires_at']:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value, models=(), generations=()):
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = {
+                'value': value,
+                'models': tuple(models),
+                'generations': generations,
+                'checked_at': now,
+                'expires_at': now + self.ttl,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_model(self, model):
+        """حذف كل العناصر المعتمدة على نموذج (للتعديلات داخل نفس العملية)"""
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if model in entry['models']]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+local_cache = LocalLRUCache()
+
+
+def get_singleton(name, models, loader, timeout=None):
+    """
+    قراءة مورد شبه ثابت (إعدادات الموقع، الألوان، البنر الافتراضي):
+    الطبقة الأولى في ذاكرة العملية، والثانية في Redis مع أجيال النماذج
+    (get_or_compute). تُراجع الأجيال في Redis كل LOCAL_CACHE_RECHECK ثانية
+    على الأكثر، فيصل تعديل المدير إلى كل العمليات خلال هذه الفترة.
+    """
+    entry = local_cache.get(name)
+    now = time.monotonic()
+    if entry is not None and now - entry['checked_at'] < LOCAL_CACHE_RECHECK:
+        _count('hits')
+        return entry['value']
+
+    generations = get_generations(models)
+    if entry is not None and entry['generations'] == generations:
+        entry['checked_at'] = now
+        _count('hits')
+        return entry['value']
+
+    # القيمة القديمة تُحفظ محلياً بأجيالها فتُراجع في الطلب التالي
+    value, generations = compute_entry(f'singleton:{name}', loader, generations, timeout)
+    local_cache.set(name, value, models, generations)
+    return value
+
+
+# ========== المسار غير المتزامن (ASGI) ==========
+#
+# نسخ async من الدوال السابقة للـ views غير المتزامنة (async_views). تقرأ
+# وتكتب نفس المفاتيح وبنفس شكل القيم، فتتشارك عمليات WSGI وASGI الـ cache.
+
+async def aget_generations(models):
+    keys = [generation_key(model) for model in models]
+    found = await shared_cache.aget_many(keys)
+    generations = []
+    for key in keys:
+        if key not in found:
+            await shared_cache.aadd(key, time.time_ns(), None)
+            found[key] = await shared_cache.aget(key, 0)
+        generations.append(found[key])
+    return tuple(generations)
+
+
+async def _arelease_lease(key, token):
+    if token is not None and await shared_cache.aget(lease_key(key)) == token:
+        await shared_cache.adelete(lease_key(key))
+
+
+async def alookup(key, generations):
+    """نسخة lookup غير المتزامنة: الانتظار بـ asyncio.sleep لا يوقف العامل"""
+    entry = await shared_cache.aget(key)
+    if entry is not None and is_fresh(entry, generations):
+        _count('hits')
+        return entry, None
+
+    token = uuid.uuid4().hex
+    if not await shared_cache.aadd(lease_key(key), token, LEASE_TIMEOUT):
+        token = None
+        if entry is not None:
+            _count('stale')
+            return entry, None
+        deadline = time.monotonic() + LEASE_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LEASE_POLL_INTERVAL)
+            entry = await shared_cache.aget(key)
+            if entry is not None and entry[1] == tuple(generations):
+                _count('hits')
+                return entry, None
+            if await shared_cache.aget(lease_key(key)) is None:
+                break
+
+    _count('misses')
+    return None, token
+
+
+async def acompute_entry(key, compute, generations=(), timeout=None):
+    """نسخة compute_entry غير المتزامنة (compute دالة async)"""
+    generations = tuple(generations)
+    entry, token = await alookup(key, generations)
+    if entry is not None:
+        return entry[0], entry[1]
+    try:
+        started = time.monotonic()
+        value = await compute()
+        timeout = RESPONSE_CACHE_TIMEOUT if timeout is None else timeout
+        await shared_cache.aset(
+            key, (value, generations, time.time() + timeout, time.monotonic() - started), timeout + STALE_TTL
+        )
+    finally:
+        await _arelease_lease(key, token)
+    return value, generations
+
+
+async def aget_singleton(name, models, loader, timeout=None):
+    """نسخة get_singleton غير المتزامنة (loader دالة async)"""
+    entry = local_cache.get(name)
+    now = time.monotonic()
+    if entry is not None and now - entry['checked_at'] < LOCAL_CACHE_RECHECK:
+        _count('hits')
+        return entry['value']
+
+    generations = await aget_generations(models)
+    if entry is not None and entry['generations'] == generations:
+        entry['checked_at'] = now
+        _count('hits')
+        return entry['value']
+
+    value, generations = await acompute_entry(f'singleton:{name}', loader, generations, timeout)
+    local_cache.set(name, value, models, generations)
+    return value
+
+
+async def aserve_cached(request, namespace, models, compute, timeout=None, validators=None):
+    """
+    نسخة serve_cached غير المتزامنة لطلبات GET. compute دالة async تعيد
+    البيانات (تُحول إلى JSON وتُخزن) أو HttpResponse لا يُخزن (الأخطاء).
+    validators دالة async تعيد حالة البيانات كما في validator_headers.
+    المفتاح بصيغة json حتى يقرأ الطلب المتزامن نفس القيمة.
+    """
+    timeout = RESPONSE_CACHE_TIMEOUT if timeout is None else timeout
+    key = response_cache_key(request, namespace, 'json')
+    generations = await aget_generations(models)
+    entry, token = await alookup(key, generations)
+    if entry is not None:
+        return _cached_response(request, entry[0])
+
+    try:
+        signature = f'{key}|{",".join(str(generation) for generation in generations)}'
+        headers = state_headers(signature, await validators() if validators is not None else None)
+        response = not_modified(request, headers)
+        if response is not None:
+            return response
+
+        started = time.monotonic()
+        data = await compute()
+        if isinstance(data, HttpResponse):
+            return data
+        content = dumps(data)
+        await shared_cache.aset(
+            key,
+            ((200, 'application/json', content, headers), generations, time.time() + timeout,
+             time.monotonic() - started),
+            timeout + STALE_TTL
+        )
+    finally:
+        await _arelease_lease(key, token)
+
+    response = HttpResponse(content, content_type='application/json')
+    for name, value in headers.items():
+        response[name] = value
+    return response
@@ -0,0 +1,95 @@
+"""
+توزيع الاستعلامات المستقلة لخدمة المحتوى - منصة نائبك.كوم
+
+الردود المركبة (الإحصائيات، خيارات الفلاتر، صفحة النائب) تحتاج عدة
+استعلامات لا يعتمد أحدها على نتيجة الآخر. بدلاً من تنفيذها واحداً بعد
+الآخر تُوزع على thread pool محدود الحجم (FANOUT_WORKERS)، ولكل thread
+اتصاله الخاص بقاعدة البيانات (اتصالات Django لكل thread)، فيقترب زمن
+الرد من أبطأ استعلام بدلاً من مجموعها.
+
+في المسار غير المتزامن تُجمع نفس الفروع بـ asyncio.gather على نفس الـ
+pool: ORM Django غير المتزامن (4.2) ينفذ كل استعلامات الطلب في thread
+واحد، فلا تتوازى بدونه.
+
+داخل transaction (ومنها transaction الاختبارات) تُنفذ الفروع بالتتابع
+على اتصال الطلب، لأن الاتصالات الأخرى لا ترى تعديلاته غير المثبتة.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+
+# أقصى عدد من الفروع المتوازية في العملية (وكل منها اتصال بقاعدة البيانات)
+FANOUT_WORKERS = getattr(settings, 'CONTENT_FANOUT_WORKERS', 4)
+
+_executor = None
+_executor_lock = threading.Lock()
+_branch = threading.local()
+
+
+def executor():
+    """الـ pool المشترك للعملية (يُنشأ عند أول استخدام، بعد fork عمال gunicorn)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix='content-fanout')
+    return _executor
+
+
+def parallel_allowed(using=DEFAULT_DB_ALIAS):
+    """هل يمكن توزيع الفروع على اتصالات أخرى من هذا الـ thread"""
+    return (
+        FANOUT_WORKERS > 1
+        # فرع يوزع فروعاً على نفس الـ pool المحدود قد ينتظر نفسه
+        and not getattr(_branch, 'active', False)
+        and not connections[using].in_atomic_block
+    )
+
+
+def _isolated(call):
+    """
+    الفرع في thread من الـ pool: اتصال الـ thread يُغلق قبله وبعده إن
+    انتهى عمره (CONN_MAX_AGE) أو تعطل، كما يحدث بين الطلبات
+    """
+    def run():
+        _branch.active = True
+        close_old_connections()
+        try:
+            return call()
+        finally:
+            close_old_connections()
+            _branch.active = False
+    return run
+
+
+def run_serial(calls):
+    return [call() for call in calls]
+
+
+def run_parallel(*calls):
+    """
+    تنفيذ دوال بلا معاملات وإرجاع نتائجها بنفس الترتيب. الأولى في الـ
+    thread الحالي والبقية في الـ pool. أول استثناء يُرفع بعد انتهاء الفروع.
+    """
+    if len(calls) < 2 or not parallel_allowed():
+        return run_serial(calls)
+    futures = [executor().submit(_isolated(call)) for call in calls[1:]]
+    try:
+        first = calls[0]()
+    finally:
+        wait(futures)
+    return [first, *(future.result() for future in futures)]
+
+
+async def agather(*calls):
+    """نسخة run_parallel غير المتزامنة: كل الفروع في الـ pool عبر asyncio.gather"""
+    if len(calls) < 2 or not await sync_to_async(parallel_allowed)():
+        return await sync_to_async(run_serial)(calls)
+    return list(await asyncio.gather(*(
+        sync_to_async(_isolated(call), thread_sensitive=False, executor=executor())()
+        for call in calls
+    )))
@@ -0,0 +1,147 @@
+"""
+المسار السريع للـ serializers لخدمة المحتوى - منصة نائبك.كوم
+
+للقوائم الكبيرة للقراءة فقط: تُترجم حقول الـ serializer مرة واحدة إلى
+"خطة" (اسم الحقل، مفتاح values()، دالة التحويل)، ثم تُبنى القواميس
+مباشرة من صفوف values() دون إنشاء كائنات النموذج ودون get_attribute
+لكل حقل في كل صف. الناتج مطابق حرفياً لناتج الـ serializer نفسه.
+"""
+
+from types import SimpleNamespace
+
+from rest_framework import serializers
+from rest_framework.fields import empty
+
+# ماذا يحدث عند غياب علاقة وسيطة (مثل party=None في party.name)
+_SKIP = object()
+
+
+class FastFieldPlan:
+    """خطة تحويل صفوف values() لـ ModelSerializer بحقول بسيطة"""
+
+    def __init__(self, serializer_class, property_fields=None):
+        serializer = serializer_class()
+        self.model = serializer.Meta.model
+        self.property_fields = property_fields or {}
+        self.values_fields = []
+        self.entries = []
+        for name, field in serializer.fields.items():
+            if not field.write_only:
+                self.entries.append(self._compile(name, field))
+
+    def _require(self, key):
+        if key not in self.values_fields:
+            self.values_fields.append(key)
+        return key
+
+    def _compile(self, name, field):
+        if isinstance(field, (serializers.BaseSerializer, serializers.ManyRelatedField)):
+            raise TypeError(f'الحقل {name} غير مدعوم في المسار السريع')
+
+        source = field.source_attrs
+        key = '__'.join(source)
+        # كل علاقة وسيطة غائبة تعني تخطي الحقل كما يفعل DRF (SkipField)
+        guards = tuple(self._require('__'.join(source[:depth])) for depth in range(1, len(source)))
+        if field.default is not empty:
+            missing = field.default
+        elif field.allow_null:
+            missing = None
+        else:
+            missing = _SKIP
+
+        if source[0] in self.property_fields:
+            dependencies = tuple(self._require(dependency) for dependency in self.property_fields[source[0]])
+            getter = getattr(self.model, source[0]).fget
+
+            def read(row, getter=getter, dependencies=dependencies):
+                return getter(SimpleNamespace(**{dependency: row[dependency] for dependency in dependencies}))
+        else:
+            self._require(key)
+
+            def read(row, key=key):
+                return row[key]
+
+        if isinstance(field, serializers.RelatedField):
+            # values() تعيد المفتاح الأساسي مباشرة
+            convert = field.pk_field.to_representation if field.pk_field else None
+        elif isinstance(field, serializers.FileField):
+            convert = self._file_converter(field, source)
+        elif getattr(field, 'fast_uses_request', False):
+            # حقول تحتاج الطلب لبناء روابط مطلقة (مثل ImageVariantsField)
+            convert = field.fast_representation
+        else:
+            convert = field.to_representation
+        uses_request = isinstance(field, serializers.FileField) or getattr(field, 'fast_uses_request', False)
+        return name, read, guards, missing, convert, uses_request
+
+    def _file_converter(self, field, source):
+        model = self.model
+        for attr in source[:-1]:
+            model = model._meta.get_field(attr).related_model
+        storage = model._meta.get_field(source[-1]).storage
+        use_url = getattr(field, 'use_url', True)
+
+        def convert(name, request):
+            if not name:
+                return None
+            if not use_url:
+                return name
+            url = storage.url(name)
+            return request.build_absolute_uri(url) if request is not None else url
+        return convert
+
+    def serialize(self, rows, context=None):
+        request = (context or {}).get('request')
+        results = []
+        for row in rows:
+            item = {}
+            for name, read, guards, missing, convert, uses_request in self.entries:
+                if guards and any(row[guard] is None for guard in guards):
+                    if missing is not _SKIP:
+                        item[name] = missing
+                    continue
+                value = read(row)
+                if value is None:
+                    item[name] = None
+                elif uses_request:
+                    item[name] = convert(value, request)
+                else:
+                    item[name] = convert(value) if convert else value
+            results.append(item)
+        return results
+
+
+class FastSerializerMixin:
+    """
+    يضيف للـ ModelSerializer مساراً سريعاً للقراءة:
+        rows = Serializer.fast_values(queryset)
+        data = Serializer.fast_serialize(rows, context)
+    fast_property_fields: خصائص النموذج (property) والحقول التي تحتاجها.
+    """
+    fast_property_fields = {}
+
+    @classmethod
+    def fast_plan(cls):
+        plan = cls.__dict__.get('_fast_plan')
+        if plan is None:
+            plan = FastFieldPlan(cls, cls.fast_property_fields)
+            cls._fast_plan = plan
+        return plan
+
+    @classmethod
+    def fast_values(cls, queryset):
+        """
+        صفوف values() بكل ما تحتاجه الخطة، مع حقول الترتيب (والقيم
+        المحسوبة مثل similarity) التي يحتاجها الترقيم بالمؤشر.
+        """
+        fields = list(cls.fast_plan().values_fields)
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        for item in ordering:
+            name = item.lstrip('-') if isinstance(item, str) else None
+            if name and name != '?' and '__' not in name and name not in fields:
+                fields.append(name)
+        return queryset.values(*fields)
+
+    @classmethod
+    def fast_serialize(cls, rows, context=None):
+        return cls.fast_plan().serialize(rows, context)
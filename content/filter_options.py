@@ -0,0 +1,101 @@
+"""
+حزمة خيارات الفلاتر لخدمة المحتوى - منصة نائبك.كوم
+
+خيارات الفلاتر (المحافظات والأحزاب والدوائر والنوع والحالة) لا تتغير
+إلا بتعديل المدير للبيانات المرجعية، لذلك تُحول إلى JSON مرة واحدة لكل
+جيل من Governorate وDistrict وPoliticalParty (ترفع الـ signals الجيل مع
+كل حفظ أو حذف) وتُضغط مسبقاً، وتُخدم كما هي مع ETag قوي لكل ترميز. الحزمة متوفرة
+كاملة، أو دون الدوائر مع جزء مستقل لدوائر كل محافظة للتحميل عند الحاجة.
+"""
+
+import hashlib
+from functools import partial
+
+from django.urls import reverse
+from django.utils.cache import quote_etag
+
+from asgiref.sync import sync_to_async
+
+from .cache import aget_singleton, get_singleton
+from .fanout import run_parallel
+from .middleware import SUPPORTED_ENCODINGS, compress_content
+from .models import Governorate, District, PoliticalParty, Representative
+from .renderers import JSONFragment, dumps
+from .serializers import GovernorateSerializer, DistrictSerializer, PoliticalPartySerializer
+
+FILTER_OPTIONS_MODELS = (Governorate, District, PoliticalParty)
+
+GENDER_OPTIONS = [{'value': value, 'label': label} for value, label in Representative.GENDER_CHOICES]
+STATUS_OPTIONS = [{'value': value, 'label': label} for value, label in Representative.STATUS_CHOICES]
+
+
+def encoded(data):
+    """
+    تمثيلات JSON للبيانات: {الترميز: (المحتوى، ETag قوي)}، والمفتاح None
+    للجسم غير المضغوط. الضغط يتم هنا مرة لكل جيل بدلاً من كل طلب، ولكل
+    ترميز ETag قوي خاص به ("<sha1>-br") لأن جسمه يختلف بايتاً ببايت.
+    """
+    content = dumps(data)
+    digest = hashlib.sha1(content).hexdigest()
+    variants = {None: (content, quote_etag(digest))}
+    for encoding in SUPPORTED_ENCODINGS:
+        compressed = compress_content(content, encoding)
+        if compressed is not None:
+            variants[encoding] = (compressed, quote_etag(f'{digest}-{encoding}'))
+    return variants
+
+
+def build_bundle():
+    """تحويل كل خيارات الفلاتر إلى JSON (ثلاثة استعلامات متوازية)"""
+    governorates, parties, districts = run_parallel(*(
+        partial(serializer.fast_serialize, serializer.fast_values(model.objects.filter(is_active=True)))
+        for serializer, model in (
+            (GovernorateSerializer, Governorate),
+            (PoliticalPartySerializer, PoliticalParty),
+            (DistrictSerializer, District),
+        )
+    ))
+
+    # قائمتا المحافظات والأحزاب تُحولان مرة واحدة وتُدرجان كما هما في الحزمتين
+    governorates_json = JSONFragment(dumps(governorates))
+    parties_json = JSONFragment(dumps(parties))
+
+    chunks = {}
+    for district in districts:
+        chunks.setdefault(str(district['governorate']), []).append(district)
+
+    return {
+        'full': encoded({
+            'governorates': governorates_json,
+            'parties': parties_json,
+            'districts': districts,
+            'genders': GENDER_OPTIONS,
+            'statuses': STATUS_OPTIONS,
+        }),
+        'lazy': encoded({
+            'governorates': governorates_json,
+            'parties': parties_json,
+            'district_chunks': {
+                str(governorate['id']): reverse(
+                    'filter-options-districts', args=[governorate['id']]
+                )
+                for governorate in governorates
+            },
+            'genders': GENDER_OPTIONS,
+            'statuses': STATUS_OPTIONS,
+        }),
+        'districts': {
+            str(governorate['id']): encoded(chunks.get(str(governorate['id']), []))
+            for governorate in governorates
+        },
+    }
+
+
+def get_bundle():
+    return get_singleton('filter_options_bundle', FILTER_OPTIONS_MODELS, build_bundle)
+
+
+async def aget_bundle():
+    # البناء نادر (مرة لكل جيل) فيتم بالكود المتزامن في thread الطلب، وهو
+    # يوزع استعلاماته الثلاثة على الـ pool
+    return await aget_singleton('filter_options_bundle', FILTER_OPTIONS_MODELS, sync_to_async(build_bundle))
@@ -4,7 +4,9 @@ Filters لخدمة المحتوى - منصة نائبك.كوم
 
 import django_filters
 from django.db.models import Q
+from django_filters.widgets import BooleanWidget
 from .models import Representative, Governorate, PoliticalParty
+from .search import fuzzy_search_representatives
 
 
 class RepresentativeFilter(django_filters.FilterSet):
@@ -12,11 +14,17 @@ class RepresentativeFilter(django_filters.FilterSet):
     
     # البحث في الاسم
     name = django_filters.CharFilter(
-        field_name='name',
-        lookup_expr='icontains',
+        method='filter_name',
         label='البحث في الاسم'
     )
     
+    # البحث التقريبي بالاسم (?name=...&fuzzy=1)
+    fuzzy = django_filters.BooleanFilter(
+        method='filter_fuzzy',
+        widget=BooleanWidget(),
+        label='بحث تقريبي بالاسم'
+    )
+    
     # فلتر المحافظة
     governorate = django_filters.CharFilter(
         field_name='district__governorate__name',
@@ -86,6 +94,18 @@ class RepresentativeFilter(django_filters.FilterSet):
         label='البحث العام'
     )
     
+    def filter_name(self, queryset, name, value):
+        """البحث في الاسم (تقريبي يتحمل الأخطاء الإملائية عند fuzzy=1)"""
+        if not value:
+            return queryset
+        if self.form.cleaned_data.get('fuzzy'):
+            return fuzzy_search_representatives(queryset, value)
+        return queryset.filter(name__icontains=value)
+    
+    def filter_fuzzy(self, queryset, name, value):
+        """يغير طريقة فلتر الاسم فقط (انظر filter_name)"""
+        return queryset
+    
     def filter_search(self, queryset, name, value):
         """البحث في عدة حقول"""
         if value:
@@ -100,7 +120,7 @@ class RepresentativeFilter(django_filters.FilterSet):
     class Meta:
         model = Representative
         fields = [
-            'name', 'governorate', 'gender', 'party', 'status',
+            'name', 'fuzzy', 'governorate', 'gender', 'party', 'status',
             'is_distinguished', 'min_rating', 'max_rating',
             'election_year', 'district', 'profession', 'search'
         ]
@@ -0,0 +1,269 @@
+"""
+نسخ الصور المصغرة لخدمة المحتوى - منصة نائبك.كوم
+
+الصور المرفوعة (غالباً صور هواتف بعدة ميجابايت) لا تُخدم كما هي: بعد
+حفظ الصورة تُوحد في Celery (اتجاه EXIF، حذف EXIF، حد أقصى للأبعاد،
+إعادة ضغط)، ثم تُولد لحقول IMAGE_VARIANT_FIELDS نسخ بأحجام ثابتة (thumb
+وcard وfull) بصيغتي WebP وJPEG بجوار الأصل، وتُحفظ أسماؤها في
+image_variants على الصف نفسه. الـ serializers تعرضها كخريطة نسخ مع
+srcset لكل صيغة.
+"""
+
+import io
+import logging
+import os
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import models, transaction
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+from .cache import bump_generation
+
+logger = logging.getLogger(__name__)
+
+# حقول الصور التي تُولد لها نسخ، لكل نموذج
+IMAGE_VARIANT_FIELDS = {
+    'content.Representative': ('profile_image', 'banner_image'),
+    'content.RepresentativeImage': ('image',),
+    'content.Banner': ('image',),
+    'content.News': ('image',),
+    'content.Event': ('image',),
+}
+
+# النسخة: (العرض، الارتفاع، قص لملء المربع)؛ الصورة لا تُكبر أبداً
+IMAGE_VARIANTS = getattr(settings, 'CONTENT_IMAGE_VARIANTS', {
+    'thumb': (160, 160, True),
+    'card': (480, 480, False),
+    'full': (1600, 1600, False),
+})
+
+# الصيغة: (صيغة Pillow، الامتداد، خيارات الحفظ)
+IMAGE_FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+# أقصى بعد للصورة الأصلية بعد التوحيد
+IMAGE_MAX_DIMENSION = getattr(settings, 'CONTENT_IMAGE_MAX_DIMENSION', 2560)
+
+# صيغ الأصل التي تُوحد: (صيغة Pillow، الامتداد، خيارات الحفظ). الصيغ
+# الأخرى (GIF المتحرك، ICO ...) تبقى كما رُفعت
+NORMALIZED_FORMATS = {
+    'JPEG': ('JPEG', 'jpg', {'quality': 85, 'optimize': True, 'progressive': True}),
+    'MPO': ('JPEG', 'jpg', {'quality': 85, 'optimize': True, 'progressive': True}),
+    'PNG': ('PNG', 'png', {'optimize': True}),
+    'WEBP': ('WEBP', 'webp', {'quality': 85, 'method': 4}),
+}
+
+
+def image_fields(model):
+    """كل حقول ImageField في النموذج"""
+    return tuple(
+        field.name for field in model._meta.get_fields() if isinstance(field, models.ImageField)
+    )
+
+
+def variant_name(name, variant, extension):
+    """اسم النسخة بجوار الأصل: profiles/ahmed.jpg -> profiles/ahmed__thumb.webp"""
+    root, _ = os.path.splitext(name)
+    return f'{root}__{variant}.{extension}'
+
+
+def _flatten(image):
+    """RGB للحفظ بـ JPEG: الشفافية تُدمج على خلفية بيضاء"""
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def _resize(image, width, height, crop):
+    if crop:
+        # نفس نسبة الأبعاد المطلوبة، مصغرة إن كانت الصورة أصغر منها
+        scale = min(1, image.width / width, image.height / height)
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        return ImageOps.fit(image, size, Image.LANCZOS)
+    resized = image.copy()
+    resized.thumbnail((width, height), Image.LANCZOS)
+    return resized
+
+
+def render_variants(field_file):
+    """
+    توليد النسخ وحفظها في storage الحقل، وإرجاع خريطتها:
+        {'thumb': {'width': 160, 'height': 160, 'webp': 'path', 'jpeg': 'path'}, ...}
+    """
+    storage = field_file.storage
+    with field_file.open('rb') as source:
+        image = Image.open(source)
+        image = _flatten(ImageOps.exif_transpose(image))
+
+    variants = {}
+    for variant, (width, height, crop) in IMAGE_VARIANTS.items():
+        resized = _resize(image, width, height, crop)
+        entry = {'width': resized.width, 'height': resized.height}
+        for key, (pillow_format, extension, options) in IMAGE_FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, pillow_format, **options)
+            name = variant_name(field_file.name, variant, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            entry[key] = storage.save(name, ContentFile(buffer.getvalue()))
+        variants[variant] = entry
+    return variants
+
+
+def variant_paths(entry):
+    """مسارات ملفات النسخ في مدخل واحد من image_variants"""
+    return [
+        path for variant in IMAGE_VARIANTS
+        for key, path in (entry or {}).get(variant, {}).items() if key in IMAGE_FORMATS
+    ]
+
+
+def delete_variant_files(storage, paths):
+    for path in paths:
+        try:
+            storage.delete(path)
+        except Exception as e:
+            logger.warning('تعذر حذف نسخة الصورة %s: %s', path, e)
+
+
+def _replace_file(model, pk, field_name, source_name, new_name, storage):
+    """
+    تسجيل الملف الجديد في الصف إن لم تتغير صورته أثناء المعالجة، وإلا
+    حذف الملف الجديد. update() لا يمر على الـ signals فيُرفع الجيل يدوياً.
+    """
+    with transaction.atomic():
+        current = model.objects.select_for_update().filter(pk=pk).values_list(field_name, flat=True).first()
+        if current != source_name:
+            transaction.on_commit(lambda: delete_variant_files(storage, [new_name]))
+            return False
+        model.objects.filter(pk=pk).update(**{field_name: new_name})
+        bump_generation(model)
+        transaction.on_commit(lambda: delete_variant_files(storage, [source_name]))
+    return True
+
+
+def normalize_image(model_label, pk, field_name):
+    """
+    توحيد الصورة الأصلية: تطبيق اتجاه EXIF ثم حذف بيانات EXIF (ومنها
+    الموقع)، وتصغيرها إلى IMAGE_MAX_DIMENSION، وإعادة ضغطها. يحل الملف
+    الجديد محل الأصل في الصف ويُحذف الأصل. يعيد اسم الملف الجديد.
+    """
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).only(field_name).first()
+    field_file = getattr(instance, field_name, None)
+    if not field_file:
+        return None
+    source_name = field_file.name
+
+    try:
+        with field_file.open('rb') as source:
+            image = Image.open(source)
+            if image.format not in NORMALIZED_FORMATS:
+                return None
+            pillow_format, extension, options = NORMALIZED_FORMATS[image.format]
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((IMAGE_MAX_DIMENSION, IMAGE_MAX_DIMENSION), Image.LANCZOS)
+            if pillow_format == 'JPEG':
+                image = _flatten(image)
+            buffer = io.BytesIO()
+            # الحفظ دون exif يحذف بيانات الكاميرا والموقع
+            image.save(buffer, pillow_format, **options)
+    except (OSError, Image.DecompressionBombError) as e:
+        logger.warning('تعذر توحيد الصورة %s: %s', source_name, e)
+        return None
+
+    root, _ = os.path.splitext(source_name)
+    storage = field_file.storage
+    new_name = storage.save(f'{root}.{extension}', ContentFile(buffer.getvalue()))
+    if not _replace_file(model, pk, field_name, source_name, new_name, storage):
+        return None
+    return new_name
+
+
+def generate_image_variants(model_label, pk, field_name):
+    """
+    توليد نسخ صورة حقل واحد وتسجيلها في image_variants. إذا تغيرت
+    الصورة أثناء التوليد تُحذف النسخ ولا يُسجل شيء (ستولد للصورة الجديدة).
+    """
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).only(field_name).first()
+    field_file = getattr(instance, field_name, None)
+    if not field_file:
+        return None
+    source_name = field_file.name
+
+    try:
+        variants = render_variants(field_file)
+    except (OSError, Image.DecompressionBombError) as e:
+        logger.warning('تعذر توليد نسخ الصورة %s: %s', source_name, e)
+        return None
+    paths = variant_paths(variants)
+
+    with transaction.atomic():
+        current = model.objects.select_for_update().filter(pk=pk).values(field_name, 'image_variants').first()
+        if current is None or current[field_name] != source_name:
+            transaction.on_commit(lambda: delete_variant_files(field_file.storage, paths))
+            return None
+        image_variants = dict(current['image_variants'] or {})
+        image_variants[field_name] = {'source': source_name, **variants}
+        # update() لا يمر على الـ signals، فيُرفع الجيل يدوياً
+        model.objects.filter(pk=pk).update(image_variants=image_variants)
+        bump_generation(model)
+    return variants
+
+
+class ImageVariantsField(serializers.Field):
+    """
+    خريطة نسخ صورة حقل من image_variants مع srcset لكل صيغة. تُعاد null
+    حتى تكتمل النسخ، فيستخدم العميل الصورة الأصلية.
+    """
+    fast_uses_request = True
+
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        # المصدر دائماً عمود image_variants مهما كان اسم الحقل
+        self.source = 'image_variants'
+        self.source_attrs = ['image_variants']
+
+    def _storage(self):
+        model = self.parent.Meta.model
+        return model._meta.get_field(self.image_field).storage
+
+    def to_representation(self, value):
+        return self.fast_representation(value, self.context.get('request'))
+
+    def fast_representation(self, value, request):
+        entry = (value or {}).get(self.image_field)
+        if not entry:
+            return None
+        storage = self._storage()
+
+        def url(path):
+            location = storage.url(path)
+            return request.build_absolute_uri(location) if request is not None else location
+
+        data, srcset = {}, {key: [] for key in IMAGE_FORMATS}
+        for variant in IMAGE_VARIANTS:
+            if variant not in entry:
+                continue
+            item = entry[variant]
+            data[variant] = {'width': item['width'], 'height': item['height']}
+            for key in IMAGE_FORMATS:
+                data[variant][key] = url(item[key])
+                srcset[key].append(f"{data[variant][key]} {item['width']}w")
+        data['srcset'] = {key: ', '.join(items) for key, items in srcset.items()}
+        return data
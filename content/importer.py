@@ -0,0 +1,419 @@
+"""
+الاستيراد المجمع للنواب والمرشحين لخدمة المحتوى - منصة نائبك.كوم
+
+يقرأ ملفات CSV أو JSONL سطراً بسطر، ويحول أسماء المحافظات والدوائر
+والأحزاب إلى مفاتيح من خرائط في الذاكرة (استعلام واحد لكل جدول)، ثم
+يتحقق من الصفوف ويحفظها على دفعات: bulk_create للجديد وbulk_update
+للموجود (عند طلب التحديث) داخل معاملة لكل دفعة، مع تقرير بأخطاء كل صف.
+
+الحفظ المجمع لا يمر على الـ signals، لذلك يُحسب فهرس البحث في الذاكرة
+مع كل صف، ويُرفع جيل النماذج وتُعاد لقطة الإحصائيات مرة واحدة في النهاية.
+"""
+
+import csv
+import io
+import json
+import logging
+import uuid
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from .cache import bump_generation, shared_cache
+from .models import Governorate, District, PoliticalParty, Representative
+from .search import apply_search_index, normalize_arabic, search_index_fields
+from .slugs import allocate_slugs, base_slug
+from . import stats
+
+logger = logging.getLogger(__name__)
+
+# عدد الصفوف في كل دفعة (معاملة واحدة لكل دفعة)
+DEFAULT_BATCH_SIZE = getattr(settings, 'CONTENT_IMPORT_BATCH_SIZE', 500)
+
+# أقصى عدد لأخطاء الصفوف المحفوظة في التقرير (العدد الكلي يبقى في failed)
+MAX_REPORTED_ERRORS = 1000
+
+# مدة الاحتفاظ بحالة مهمة الاستيراد في الـ cache
+IMPORT_JOB_TIMEOUT = 24 * 60 * 60
+
+FORMATS = {'csv': 'csv', 'jsonl': 'jsonl', 'ndjson': 'jsonl'}
+
+# الحقول المقبولة من الملف كما هي
+IMPORT_FIELDS = (
+    'name', 'name_en', 'gender', 'birth_date', 'profession', 'education',
+    'status', 'electoral_number', 'electoral_symbol', 'election_year',
+    'bio', 'achievements', 'electoral_program', 'phone', 'email',
+    'facebook', 'twitter', 'website',
+)
+
+# أعمدة الملف التي تحدد الدائرة
+DISTRICT_COLUMNS = ('governorate', 'district', 'district_number')
+
+# حقول النائب التي قد يكتبها الاستيراد
+SAVED_FIELDS = (*IMPORT_FIELDS, 'district_id', 'party_id')
+
+# قبول التسميات العربية للاختيارات (ذكر، منتخب ...) إلى جانب القيم
+CHOICE_LABELS = {
+    'gender': {label: value for value, label in Representative.GENDER_CHOICES},
+    'status': {label: value for value, label in Representative.STATUS_CHOICES},
+}
+
+
+class ImportFormatError(ValueError):
+    """صيغة ملف غير مدعومة"""
+
+
+def detect_format(filename, file_format=None):
+    """الصيغة المطلوبة صراحة أو من امتداد الملف"""
+    name = file_format or filename.rsplit('.', 1)[-1]
+    try:
+        return FORMATS[name.lower()]
+    except KeyError:
+        raise ImportFormatError(f'صيغة غير مدعومة: {name} (المتاح: csv, jsonl)')
+
+
+def read_rows(stream, file_format):
+    """
+    قراءة الصفوف تدريجياً: (رقم السطر، قاموس الصف). الصف غير القابل
+    للقراءة يعود None ليُسجل خطأً على سطره دون إيقاف الاستيراد.
+    """
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(stream, 'mode', ''):
+        stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+    if file_format == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+class ReferenceLookup:
+    """خرائط في الذاكرة من أسماء المحافظات والدوائر والأحزاب إلى مفاتيحها"""
+
+    def __init__(self):
+        self.governorates = {}
+        for pk, name, name_en, code in Governorate.objects.values_list('pk', 'name', 'name_en', 'code'):
+            for key in (name, name_en, code):
+                if key:
+                    self.governorates[normalize_arabic(key)] = pk
+
+        # الدائرة بالاسم أو الرقم داخل محافظتها، أو بالاسم وحده إن لم يتكرر
+        self.districts = {}
+        self.district_names = {}
+        by_name = {}
+        for pk, name, number, governorate_id, governorate_name in District.objects.values_list(
+            'pk', 'name', 'number', 'governorate_id', 'governorate__name'
+        ):
+            self.district_names[pk] = (name, governorate_name)
+            key = normalize_arabic(name)
+            self.districts[(governorate_id, key)] = pk
+            self.districts[(governorate_id, str(number))] = pk
+            by_name.setdefault(key, []).append(pk)
+        self.districts_by_name = {key: pks[0] for key, pks in by_name.items() if len(pks) == 1}
+
+        self.parties = {}
+        self.party_names = {}
+        for pk, name, name_en, abbreviation in PoliticalParty.objects.values_list(
+            'pk', 'name', 'name_en', 'abbreviation'
+        ):
+            self.party_names[pk] = name
+            for key in (name, name_en, abbreviation):
+                if key:
+                    self.parties[normalize_arabic(key)] = pk
+
+    def district(self, governorate, district, number=''):
+        if governorate:
+            governorate_id = self.governorates.get(normalize_arabic(governorate))
+            if governorate_id is None:
+                raise ValidationError(f'محافظة غير معروفة: {governorate}')
+            key = normalize_arabic(district) if district else str(number).strip()
+            district_id = self.districts.get((governorate_id, key))
+        else:
+            district_id = self.districts_by_name.get(normalize_arabic(district))
+        if district_id is None:
+            raise ValidationError(f'دائرة غير معروفة: {district or number}')
+        return district_id
+
+    def party(self, name):
+        party_id = self.parties.get(normalize_arabic(name))
+        if party_id is None:
+            raise ValidationError(f'حزب غير معروف: {name}')
+        return party_id
+
+    def search_row(self, values):
+        """صف بحقول WEIGHTED_FIELDS لحساب فهرس البحث دون قراءة النائب من القاعدة"""
+        district_name, governorate_name = self.district_names[values['district_id']]
+        return {
+            **values,
+            'district__name': district_name,
+            'district__governorate__name': governorate_name,
+            'party__name': self.party_names.get(values['party_id']),
+        }
+
+
+def _clean_value(field_name, value):
+    field = Representative._meta.get_field(field_name)
+    if isinstance(value, str):
+        value = value.strip()
+        value = CHOICE_LABELS.get(field_name, {}).get(value, value)
+    if value is None or value == '':
+        if field.null:
+            return None
+        if field.has_default():
+            return field.get_default()
+        if field.blank:
+            return ''
+        raise ValidationError('هذا الحقل مطلوب')
+    return field.clean(value, None)
+
+
+def clean_row(row, lookup):
+    """
+    تحويل صف من الملف إلى قيم حقول النموذج، أو رفع قاموس الأخطاء. الأعمدة
+    الغائبة عن الملف لا تدخل القيم: عند التحديث تبقى قيمها الحالية، وعند
+    الإنشاء تُكمل بـ complete_values.
+    """
+    values, errors = {}, {}
+    for field_name in IMPORT_FIELDS:
+        if field_name not in row and field_name != 'name':
+            continue
+        try:
+            values[field_name] = _clean_value(field_name, row.get(field_name))
+        except ValidationError as e:
+            errors[field_name] = e.messages
+
+    if any(column in row for column in DISTRICT_COLUMNS):
+        try:
+            values['district_id'] = lookup.district(
+                row.get('governorate'), row.get('district'), row.get('district_number') or ''
+            )
+        except ValidationError as e:
+            errors['district'] = e.messages
+
+    if 'party' in row:
+        party = (row.get('party') or '').strip()
+        try:
+            values['party_id'] = lookup.party(party) if party else None
+        except ValidationError as e:
+            errors['party'] = e.messages
+
+    if errors:
+        raise ValidationError(errors)
+    return values
+
+
+def complete_values(values):
+    """قيم نائب جديد: الأعمدة الغائبة بقيمها الافتراضية، والدائرة مطلوبة"""
+    errors = {}
+    for field_name in IMPORT_FIELDS:
+        if field_name not in values:
+            try:
+                values[field_name] = _clean_value(field_name, None)
+            except ValidationError as e:
+                errors[field_name] = e.messages
+    if 'district_id' not in values:
+        errors['district'] = ['هذا الحقل مطلوب']
+    values.setdefault('party_id', None)
+    if errors:
+        raise ValidationError(errors)
+    return values
+
+
+class ImportReport:
+    """نتيجة الاستيراد: الأعداد وأخطاء الصفوف"""
+
+    def __init__(self):
+        self.processed = 0
+        self.created = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, line, errors):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'errors': errors})
+
+    def as_dict(self):
+        return {
+            'processed': self.processed,
+            'created': self.created,
+            'updated': self.updated,
+            'failed': self.failed,
+            'errors': self.errors,
+        }
+
+
+class RepresentativeImporter:
+    """
+    الاستيراد على دفعات:
+        report = RepresentativeImporter(update_existing=True).run(rows)
+    الصف الموجود (بنفس الاسم) خطأ، إلا مع update_existing فيُحدَّث.
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, update_existing=False, dry_run=False, progress=None):
+        self.batch_size = batch_size
+        self.update_existing = update_existing
+        self.dry_run = dry_run
+        self.progress = progress
+        self.report = ImportReport()
+        self.lookup = ReferenceLookup()
+        self._seen_names = set()
+
+    def run(self, rows):
+        batch = []
+        for line, row in rows:
+            self.report.processed += 1
+            values = self._validate(line, row)
+            if values is not None:
+                batch.append((line, values))
+            if len(batch) >= self.batch_size:
+                self._save_batch(batch)
+                batch = []
+        if batch:
+            self._save_batch(batch)
+
+        if not self.dry_run and (self.report.created or self.report.updated):
+            bump_generation(Representative)
+            stats.rebuild_snapshot()
+        return self.report
+
+    def _validate(self, line, row):
+        if row is None:
+            self.report.add_error(line, {'non_field_errors': ['سطر غير صالح']})
+            return None
+        try:
+            values = clean_row(row, self.lookup)
+        except ValidationError as e:
+            self.report.add_error(line, e.message_dict)
+            return None
+        if values['name'] in self._seen_names:
+            self.report.add_error(line, {'name': ['الاسم مكرر في الملف']})
+            return None
+        self._seen_names.add(values['name'])
+        return values
+
+    def _save_batch(self, batch):
+        # مع التحديث تُقرأ القيم الحالية أيضاً لتبقى الأعمدة الغائبة عن الملف
+        columns = ('pk', *SAVED_FIELDS) if self.update_existing else ('pk',)
+        existing = {
+            row['name']: row
+            for row in Representative.objects.filter(name__in=[values['name'] for _, values in batch])
+            .values('name', *columns)
+        }
+        to_create, to_update, present = [], [], set()
+        for line, values in batch:
+            if values['name'] not in existing:
+                try:
+                    to_create.append((line, complete_values(values)))
+                except ValidationError as e:
+                    self.report.add_error(line, e.message_dict)
+            elif self.update_existing:
+                present.update(values)
+                current = existing[values['name']]
+                to_update.append((line, {**{field: current[field] for field in SAVED_FIELDS}, **values}))
+            else:
+                self.report.add_error(line, {'name': ['يوجد نائب بهذا الاسم بالفعل']})
+
+        if self.dry_run:
+            self.report.created += len(to_create)
+            self.report.updated += len(to_update)
+            return
+
+        created = [Representative(**values) for _, values in to_create]
+        now = timezone.now()
+        updated = [
+            Representative(pk=existing[values['name']]['pk'], updated_at=now, **values) for _, values in to_update
+        ]
+        # فهرس البحث يُحسب في الذاكرة ويُكتب مع الصف نفسه
+        for representative, (_, values) in zip(created + updated, to_create + to_update):
+            apply_search_index(representative, self.lookup.search_row(values))
+        # التحديث يكتب أعمدة الملف فقط (وفهرس البحث المحسوب من القيم كاملة)
+        update_fields = [
+            *(field for field in SAVED_FIELDS if field in present), 'updated_at', *search_index_fields()
+        ]
+
+        try:
+            with transaction.atomic():
+                # حجز الروابط داخل معاملة الدفعة (مع أقفالها على PostgreSQL)
+                slugs = allocate_slugs(base_slug(item.name, item.name_en) for item in created)
+                for representative, slug in zip(created, slugs):
+                    representative.slug = slug
+                Representative.objects.bulk_create(created)
+                Representative.objects.bulk_update(updated, update_fields)
+        except DatabaseError as e:
+            logger.warning('فشل حفظ دفعة الاستيراد: %s', e)
+            for line, _ in to_create + to_update:
+                self.report.add_error(line, {'non_field_errors': [str(e)]})
+            return
+
+        self.report.created += len(created)
+        self.report.updated += len(updated)
+        if self.progress:
+            self.progress(self.report)
+
+
+def import_file(stream, file_format, **options):
+    """استيراد ملف مفتوح بالصيغة المحددة"""
+    return RepresentativeImporter(**options).run(read_rows(stream, file_format))
+
+
+# ========== مهام الاستيراد (content.tasks) ==========
+
+def job_key(job_id):
+    return f'import_job:{job_id}'
+
+
+def get_job(job_id):
+    return shared_cache.get(job_key(job_id))
+
+
+def _set_job(job_id, status, report=None, error=None):
+    shared_cache.set(job_key(job_id), {
+        'id': str(job_id),
+        'status': status,
+        'report': report.as_dict() if report else None,
+        'error': error,
+    }, IMPORT_JOB_TIMEOUT)
+
+
+def run_import_job(job_id, path, file_format, options):
+    """تنفيذ مهمة استيراد ملف محفوظ في الـ storage ثم حذفه"""
+    _set_job(job_id, 'running')
+    try:
+        with default_storage.open(path, 'rb') as stream:
+            report = import_file(
+                stream, file_format,
+                progress=lambda report: _set_job(job_id, 'running', report),
+                **options
+            )
+        _set_job(job_id, 'completed', report)
+    except Exception as e:
+        logger.exception('فشلت مهمة الاستيراد %s', job_id)
+        _set_job(job_id, 'failed', error=str(e))
+    finally:
+        default_storage.delete(path)
+
+
+def start_import_job(uploaded_file, file_format, **options):
+    """حفظ الملف المرفوع وإضافة استيراده إلى طابور Celery، وإرجاع رقم المهمة"""
+    from .tasks import import_representatives
+
+    job_id = str(uuid.uuid4())
+    path = default_storage.save(f'imports/{job_id}.{file_format}', uploaded_file)
+    _set_job(job_id, 'queued')
+    import_representatives.delay(job_id, path, file_format, options)
+    return job_id
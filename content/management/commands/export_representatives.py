@@ -0,0 +1,51 @@
+"""
+أمر التصدير المتدفق للنواب - منصة نائبك.كوم
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, iter_export, iter_gzip
+from content.filters import RepresentativeFilter
+from content.querysets import representative_list_queryset
+
+
+class Command(BaseCommand):
+    help = 'تصدير النواب (بنفس فلاتر /api/representatives/) إلى CSV أو JSONL أو NDJSON'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', dest='file_format', default='csv', choices=list(EXPORT_FORMATS))
+        parser.add_argument('--output', help='مسار الملف (افتراضياً المخرج القياسي)')
+        parser.add_argument('--gzip', action='store_true', help='ضغط الملف بـ gzip')
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE, help='عدد الصفوف في كل دفعة')
+        parser.add_argument(
+            '--filter', action='append', default=[], metavar='NAME=VALUE',
+            help='فلتر من فلاتر قائمة النواب، مثل --filter governorate=القاهرة'
+        )
+
+    def handle(self, *args, **options):
+        data = {}
+        for item in options['filter']:
+            name, separator, value = item.partition('=')
+            if not separator:
+                raise CommandError(f'فلتر غير صالح: {item} (الصيغة NAME=VALUE)')
+            data[name] = value
+
+        filterset = RepresentativeFilter(data, queryset=representative_list_queryset())
+        if not filterset.is_valid():
+            raise CommandError(f'فلاتر غير صالحة: {dict(filterset.errors)}')
+
+        chunks = iter_export(filterset.qs, options['file_format'], chunk_size=options['chunk_size'])
+        if options['gzip']:
+            chunks = iter_gzip(chunks)
+
+        output = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+        try:
+            for chunk in chunks:
+                output.write(chunk)
+        finally:
+            if options['output']:
+                output.close()
+            else:
+                output.flush()
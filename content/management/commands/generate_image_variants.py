@@ -0,0 +1,27 @@
+"""
+أمر توليد نسخ الصور المصغرة - منصة نائبك.كوم
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from content.images import IMAGE_VARIANT_FIELDS, generate_image_variants
+
+
+class Command(BaseCommand):
+    help = 'توليد نسخ الصور (thumb/card/full بصيغتي WebP وJPEG) للصور التي لا نسخ لها'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='إعادة توليد كل النسخ')
+
+    def handle(self, *args, **options):
+        generated = 0
+        for label, fields in IMAGE_VARIANT_FIELDS.items():
+            model = apps.get_model(label)
+            for field_name in fields:
+                rows = model.objects.exclude(**{field_name: ''}).values_list('pk', 'image_variants')
+                for pk, variants in rows.iterator():
+                    if options['force'] or field_name not in (variants or {}):
+                        if generate_image_variants(label, pk, field_name):
+                            generated += 1
+        self.stdout.write(self.style.SUCCESS(f'تم توليد نسخ {generated} صورة'))
@@ -0,0 +1,50 @@
+"""
+أمر الاستيراد المجمع للنواب - منصة نائبك.كوم
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.importer import DEFAULT_BATCH_SIZE, ImportFormatError, detect_format, import_file
+
+
+class Command(BaseCommand):
+    help = 'استيراد النواب والمرشحين من ملف CSV أو JSONL على دفعات'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='مسار الملف')
+        parser.add_argument('--format', dest='file_format', help='csv أو jsonl (افتراضياً من امتداد الملف)')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='عدد الصفوف في كل معاملة')
+        parser.add_argument('--update', action='store_true', help='تحديث النواب الموجودين بنفس الاسم')
+        parser.add_argument('--dry-run', action='store_true', help='التحقق فقط دون حفظ')
+
+    def handle(self, *args, **options):
+        try:
+            file_format = detect_format(options['path'], options['file_format'])
+        except ImportFormatError as e:
+            raise CommandError(str(e))
+
+        started = time.perf_counter()
+        try:
+            with open(options['path'], encoding='utf-8-sig', newline='') as stream:
+                report = import_file(
+                    stream, file_format,
+                    batch_size=options['batch_size'],
+                    update_existing=options['update'],
+                    dry_run=options['dry_run'],
+                    progress=lambda report: self.stdout.write(
+                        f'... {report.processed} صف', ending='\r'
+                    ),
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        for error in report.errors:
+            self.stderr.write(f"السطر {error['line']}: {error['errors']}")
+        rate = report.processed / elapsed if elapsed else report.processed
+        self.stdout.write(self.style.SUCCESS(
+            f'تمت معالجة {report.processed} صف ({rate:.0f} صف/ثانية): '
+            f'{report.created} جديد، {report.updated} محدث، {report.failed} خطأ'
+        ))
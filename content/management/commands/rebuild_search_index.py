@@ -0,0 +1,15 @@
+"""
+أمر إعادة بناء فهرس البحث - منصة نائبك.كوم
+"""
+
+from django.core.management.base import BaseCommand
+
+from content.search import update_search_index
+
+
+class Command(BaseCommand):
+    help = 'إعادة حساب نص ومتجه البحث لكل النواب'
+
+    def handle(self, *args, **options):
+        updated = update_search_index()
+        self.stdout.write(self.style.SUCCESS(f'تمت إعادة فهرسة {updated} نائب'))
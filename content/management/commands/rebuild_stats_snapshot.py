@@ -0,0 +1,17 @@
+"""
+أمر إعادة بناء لقطة الإحصائيات - منصة نائبك.كوم
+"""
+
+from django.core.management.base import BaseCommand
+
+from content.stats import rebuild_snapshot
+
+
+class Command(BaseCommand):
+    help = 'إعادة بناء لقطة إحصائيات المنصة بالكامل من جدول النواب'
+
+    def handle(self, *args, **options):
+        snapshot = rebuild_snapshot()
+        self.stdout.write(self.style.SUCCESS(
+            f'تمت إعادة بناء لقطة الإحصائيات: {snapshot.total_representatives} نائب'
+        ))
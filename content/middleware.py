@@ -0,0 +1,122 @@
+"""
+Middleware لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import gzip
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli اختيارية
+    brotli = None
+
+# أقل حجم للجسم يستحق الضغط (بالبايت)
+COMPRESSION_MIN_SIZE = getattr(settings, 'CONTENT_COMPRESSION_MIN_SIZE', 1024)
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_TYPES = ('application/json', 'application/x-ndjson', 'text/')
+
+_encoding_re = re.compile(r'\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?')
+
+
+def accepted_encodings(header):
+    """الترميزات المقبولة في Accept-Encoding (مع استبعاد q=0)"""
+    accepted = set()
+    for part in header.split(','):
+        match = _encoding_re.match(part)
+        if not match:
+            continue
+        name, quality = match.group(1).lower(), match.group(2)
+        try:
+            if quality is not None and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(name)
+    return accepted
+
+
+# الترميزات المدعومة بترتيب الأفضلية
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def compress_content(content, encoding):
+    """الجسم مضغوطاً بالترميز، أو None إن كان أصغر من الحد أو لم يصغر بالضغط"""
+    if len(content) < COMPRESSION_MIN_SIZE:
+        return None
+    if encoding == 'br':
+        compressed = brotli.compress(content, quality=BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+    return compressed if len(compressed) < len(content) else None
+
+
+def choose_encoding(request, streaming=False):
+    accepted = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    if brotli is not None and not streaming and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+class CompressionMiddleware:
+    """
+    ضغط استجابات JSON والنصوص بـ brotli (إن كانت مثبتة) أو gzip حسب
+    Accept-Encoding، للأجسام الأكبر من COMPRESSION_MIN_SIZE فقط.
+    الاستجابات المتدفقة تُضغط بـ gzip أثناء الإرسال. يعمل متزامناً وغير
+    متزامن حتى لا يحول سلسلة ASGI كلها إلى threads.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        if not self._should_compress(response):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = choose_encoding(request, streaming=response.streaming)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_sequence(response.streaming_content)
+            del response.headers['Content-Length']
+        else:
+            compressed = compress_content(response.content, encoding)
+            if compressed is None:
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+
+        # الجسم المضغوط ليس مطابقاً بايت ببايت للأصل
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    def _should_compress(self, response):
+        if response.status_code != 200 or response.has_header('Content-Encoding'):
+            return False
+        content_type = response.get('Content-Type', '')
+        return content_type.startswith(COMPRESSIBLE_TYPES)
@@ -0,0 +1,49 @@
+# Generated by Django 4.2.7 on 2026-10-18 03:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0003_representative_admin_approved'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GovernorateStatsSnapshot',
+            fields=[
+                ('governorate', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats_snapshot', serialize=False, to='content.governorate', verbose_name='المحافظة')),
+                ('representatives_count', models.IntegerField(default=0, verbose_name='عدد النواب')),
+            ],
+            options={
+                'verbose_name': 'لقطة إحصائيات محافظة',
+                'verbose_name_plural': 'لقطات إحصائيات المحافظات',
+            },
+        ),
+        migrations.CreateModel(
+            name='PlatformStatsSnapshot',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, primary_key=True, serialize=False)),
+                ('total_representatives', models.IntegerField(default=0, verbose_name='إجمالي النواب')),
+                ('total_candidates', models.IntegerField(default=0, verbose_name='إجمالي المرشحين')),
+                ('total_elected', models.IntegerField(default=0, verbose_name='إجمالي المنتخبين')),
+                ('total_former', models.IntegerField(default=0, verbose_name='إجمالي السابقين')),
+                ('total_distinguished', models.IntegerField(default=0, verbose_name='إجمالي المميزين')),
+                ('total_male', models.IntegerField(default=0, verbose_name='إجمالي الذكور')),
+                ('total_female', models.IntegerField(default=0, verbose_name='إجمالي الإناث')),
+                ('rating_sum', models.DecimalField(decimal_places=1, default=0, max_digits=12, verbose_name='مجموع التقييمات')),
+                ('total_solved_complaints', models.BigIntegerField(default=0, verbose_name='إجمالي الشكاوى المحلولة')),
+                ('total_received_complaints', models.BigIntegerField(default=0, verbose_name='إجمالي الشكاوى المستلمة')),
+                ('total_governorates', models.IntegerField(default=0, verbose_name='إجمالي المحافظات')),
+                ('total_districts', models.IntegerField(default=0, verbose_name='إجمالي الدوائر')),
+                ('total_parties', models.IntegerField(default=0, verbose_name='إجمالي الأحزاب')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاريخ التحديث')),
+            ],
+            options={
+                'verbose_name': 'لقطة إحصائيات المنصة',
+                'verbose_name_plural': 'لقطات إحصائيات المنصة',
+            },
+        ),
+    ]
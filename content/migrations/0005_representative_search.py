@@ -0,0 +1,119 @@
+# Generated by Django 4.2.7 on 2026-10-18 03:07
+
+import re
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import Value
+
+# نسخة مجمدة من تطبيع content.search وقت هذه الـ migration: تعديل
+# الوحدة الحية لاحقاً لا يغير ما تكتبه الـ migration على قاعدة جديدة.
+
+# التشكيل والتطويل وعلامات المصحف
+TASHKEEL_RE = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+# أشكال الألف: آ أ إ ٱ
+ALEF_RE = re.compile('[\u0622\u0623\u0625\u0671]')
+NON_WORD_RE = re.compile(r'[^\w\s]|_')
+
+# ى ئ -> ي ، ؤ -> و ، ة -> ه
+CHARACTER_MAP = str.maketrans({
+    '\u0649': '\u064a',
+    '\u0626': '\u064a',
+    '\u0624': '\u0648',
+    '\u0629': '\u0647',
+})
+
+# الأوزان: الاسم > الدائرة/المحافظة/الحزب > المهنة > السيرة/البرنامج
+WEIGHTED_FIELDS = (
+    ('A', ('name', 'name_en')),
+    ('B', ('district__name', 'district__governorate__name', 'party__name')),
+    ('C', ('profession',)),
+    ('D', ('bio', 'electoral_program')),
+)
+
+SEARCH_CONFIG = 'simple'
+
+
+def normalize_arabic(text):
+    """توحيد النص العربي: حذف التشكيل وتوحيد الألف والياء والتاء المربوطة"""
+    if not text:
+        return ''
+    text = TASHKEEL_RE.sub('', text)
+    text = ALEF_RE.sub('ا', text)
+    text = text.translate(CHARACTER_MAP).lower()
+    text = NON_WORD_RE.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def build_documents(row):
+    """النص الموحد لكل وزن من صف values()"""
+    return {
+        weight: ' '.join(filter(None, (normalize_arabic(row[field]) for field in fields)))
+        for weight, fields in WEIGHTED_FIELDS
+    }
+
+
+def build_search_vector(documents):
+    """تعبير tsvector الموزون من النصوص الموحدة"""
+    vector = None
+    for weight, _ in WEIGHTED_FIELDS:
+        part = SearchVector(Value(documents[weight]), config=SEARCH_CONFIG, weight=weight)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def create_search_index(apps, schema_editor):
+    """فهرس GIN على متجه البحث (PostgreSQL فقط)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS content_rep_search_vector_gin '
+        'ON content_representative USING gin (search_vector)'
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS content_rep_search_vector_gin')
+
+
+def backfill_search_index(apps, schema_editor):
+    """ملء نص ومتجه البحث للنواب الموجودين"""
+    Representative = apps.get_model('content', 'Representative')
+    use_vector = schema_editor.connection.vendor == 'postgresql'
+    source_fields = [field for _, fields in WEIGHTED_FIELDS for field in fields]
+
+    batch = []
+    for row in Representative.objects.values('pk', *source_fields).iterator(chunk_size=500):
+        documents = build_documents(row)
+        representative = Representative(pk=row['pk'])
+        representative.search_text = ' '.join(filter(None, documents.values()))
+        if use_vector:
+            representative.search_vector = build_search_vector(documents)
+        batch.append(representative)
+    fields = ['search_text', 'search_vector'] if use_vector else ['search_text']
+    Representative.objects.bulk_update(batch, fields, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0004_stats_snapshots'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='representative',
+            name='search_text',
+            field=models.TextField(blank=True, editable=False, verbose_name='نص البحث الموحد'),
+        ),
+        migrations.AddField(
+            model_name='representative',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='متجه البحث'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(backfill_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 4.2.7 on 2026-10-18 03:08
+
+import re
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+TRIGRAM_INDEXES = {
+    'content_rep_name_norm_trgm': 'name_normalized',
+    'content_rep_name_en_norm_trgm': 'name_en_normalized',
+    'content_rep_profession_norm_trgm': 'profession_normalized',
+}
+
+# الحقول الموحدة للبحث التقريبي وأصلها
+NORMALIZED_FIELDS = {
+    'name_normalized': 'name',
+    'name_en_normalized': 'name_en',
+    'profession_normalized': 'profession',
+}
+
+# نسخة مجمدة من تطبيع content.search وقت هذه الـ migration: تعديل
+# الوحدة الحية لاحقاً لا يغير ما تكتبه الـ migration على قاعدة جديدة.
+
+# التشكيل والتطويل وعلامات المصحف
+TASHKEEL_RE = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+# أشكال الألف: آ أ إ ٱ
+ALEF_RE = re.compile('[\u0622\u0623\u0625\u0671]')
+NON_WORD_RE = re.compile(r'[^\w\s]|_')
+
+# ى ئ -> ي ، ؤ -> و ، ة -> ه
+CHARACTER_MAP = str.maketrans({
+    '\u0649': '\u064a',
+    '\u0626': '\u064a',
+    '\u0624': '\u0648',
+    '\u0629': '\u0647',
+})
+
+
+def normalize_arabic(text):
+    """توحيد النص العربي: حذف التشكيل وتوحيد الألف والياء والتاء المربوطة"""
+    if not text:
+        return ''
+    text = TASHKEEL_RE.sub('', text)
+    text = ALEF_RE.sub('ا', text)
+    text = text.translate(CHARACTER_MAP).lower()
+    text = NON_WORD_RE.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """فهارس GIN بـ gin_trgm_ops على الحقول الموحدة (PostgreSQL فقط)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} '
+            f'ON content_representative USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+def backfill_normalized_fields(apps, schema_editor):
+    """ملء الحقول الموحدة للنواب الموجودين"""
+    Representative = apps.get_model('content', 'Representative')
+    batch = []
+    for row in Representative.objects.values('pk', *NORMALIZED_FIELDS.values()).iterator(chunk_size=500):
+        representative = Representative(pk=row['pk'])
+        for field, source in NORMALIZED_FIELDS.items():
+            setattr(representative, field, normalize_arabic(row[source]))
+        batch.append(representative)
+    Representative.objects.bulk_update(batch, list(NORMALIZED_FIELDS), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0005_representative_search'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='representative',
+            name='name_en_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='الاسم الإنجليزي الموحد'),
+        ),
+        migrations.AddField(
+            model_name='representative',
+            name='name_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='الاسم الموحد'),
+        ),
+        migrations.AddField(
+            model_name='representative',
+            name='profession_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=200, verbose_name='المهنة الموحدة'),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+        migrations.RunPython(backfill_normalized_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 03:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0006_representative_trigram'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='representative',
+            index=models.Index(condition=models.Q(('admin_approved', True), ('is_active', True)), fields=['-is_distinguished', '-rating', 'name', 'id'], name='content_rep_listing_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-18 03:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0007_representative_listing_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='banner',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='نسخ الصور'),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='نسخ الصور'),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='نسخ الصور'),
+        ),
+        migrations.AddField(
+            model_name='representative',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='نسخ الصور'),
+        ),
+        migrations.AddField(
+            model_name='representativeimage',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='نسخ الصور'),
+        ),
+    ]
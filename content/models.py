@@ -3,10 +3,12 @@
 """
 
 from django.db import models
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.utils.text import slugify
 import uuid
 
+from .slugs import save_with_unique_slug
+
 
 class BaseModel(models.Model):
     """نموذج أساسي يحتوي على الحقول المشتركة"""
@@ -128,6 +130,8 @@ class Representative(BaseModel):
     # الصور
     profile_image = models.ImageField(upload_to='representatives/profiles/', blank=True, verbose_name="الصورة الشخصية")
     banner_image = models.ImageField(upload_to='representatives/banners/', blank=True, verbose_name="صورة البانر")
+    # النسخ المصغرة المولدة من الصور (content.images)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name="نسخ الصور")
     
     # التقييم والإحصائيات
     rating = models.DecimalField(
@@ -159,6 +163,17 @@ class Representative(BaseModel):
     twitter = models.URLField(blank=True, verbose_name="تويتر")
     website = models.URLField(blank=True, verbose_name="الموقع الشخصي")
 
+    # فهرس البحث (يُحدَّث تلقائياً من content.search)
+    search_text = models.TextField(blank=True, editable=False, verbose_name="نص البحث الموحد")
+    search_vector = SearchVectorField(null=True, editable=False, verbose_name="متجه البحث")
+    name_normalized = models.CharField(max_length=255, blank=True, editable=False, verbose_name="الاسم الموحد")
+    name_en_normalized = models.CharField(max_length=255, blank=True, editable=False, verbose_name="الاسم الإنجليزي الموحد")
+    profession_normalized = models.CharField(max_length=200, blank=True, editable=False, verbose_name="المهنة الموحدة")
+
+    # الحد الأقصى للأخبار والمناسبات في صفحة النائب
+    LATEST_NEWS_LIMIT = 10
+    APPROVED_EVENTS_LIMIT = 10
+
     class Meta:
         verbose_name = "نائب/مرشح"
         verbose_name_plural = "النواب والمرشحين"
@@ -168,21 +183,20 @@ class Representative(BaseModel):
             models.Index(fields=['district', 'party']),
             models.Index(fields=['status', 'is_distinguished']),
             models.Index(fields=['rating']),
+            # الترتيب الافتراضي للقوائم مع id لكسر التساوي (الترقيم بالمؤشر)
+            models.Index(
+                fields=['-is_distinguished', '-rating', 'name', 'id'],
+                condition=models.Q(is_active=True, admin_approved=True),
+                name='content_rep_listing_idx'
+            ),
         ]
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            # استخدام الاسم الإنجليزي إذا كان متوفراً، وإلا استخدام transliteration
-            if self.name_en:
-                self.slug = slugify(self.name_en)
-            else:
-                # تحويل النص العربي إلى نص إنجليزي مبسط
-                import re
-                # إزالة التشكيل والرموز الخاصة
-                clean_name = re.sub(r'[^\w\s-]', '', self.name)
-                # استخدام unicode slugify
-                self.slug = slugify(clean_name, allow_unicode=True)
-        super().save(*args, **kwargs)
+        if self.slug:
+            super().save(*args, **kwargs)
+        else:
+            # رابط فريد من الاسم الإنجليزي أو العربي مع لاحقة عند التكرار
+            save_with_unique_slug(self, lambda: super(Representative, self).save(*args, **kwargs))
 
     def __str__(self):
         return f"{self.name} - {self.district}"
@@ -208,6 +222,20 @@ class Representative(BaseModel):
             return round((self.solved_complaints / self.received_complaints) * 100, 1)
         return 0.0
 
+    @property
+    def latest_news(self):
+        """آخر الأخبار النشطة (مجلوبة مسبقاً في صفحة النائب)"""
+        if hasattr(self, '_latest_news'):
+            return self._latest_news
+        return self.news.filter(is_active=True)[:self.LATEST_NEWS_LIMIT]
+
+    @property
+    def approved_events(self):
+        """أحدث المناسبات الموافق عليها (مجلوبة مسبقاً في صفحة النائب)"""
+        if hasattr(self, '_approved_events'):
+            return self._approved_events
+        return self.events.filter(is_active=True, admin_approved=True)[:self.APPROVED_EVENTS_LIMIT]
+
     def get_absolute_url(self):
         """إرجاع الرابط المطلق للصفحة الشخصية"""
         return f"/{self.slug}/"
@@ -222,6 +250,7 @@ class RepresentativeImage(BaseModel):
         verbose_name="النائب/المرشح"
     )
     image = models.ImageField(upload_to='representatives/gallery/', verbose_name="الصورة")
+    image_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name="نسخ الصور")
     caption = models.CharField(max_length=255, blank=True, verbose_name="وصف الصورة")
     order = models.PositiveIntegerField(default=0, verbose_name="الترتيب")
 
@@ -268,6 +297,7 @@ class News(BaseModel):
     title = models.CharField(max_length=255, verbose_name="عنوان الخبر")
     content = models.TextField(verbose_name="محتوى الخبر")
     image = models.ImageField(upload_to='news/', blank=True, verbose_name="صورة الخبر")
+    image_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name="نسخ الصور")
     published_date = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ النشر")
     is_featured = models.BooleanField(default=False, verbose_name="خبر مميز")
 
@@ -320,6 +350,7 @@ class Banner(BaseModel):
     name = models.CharField(max_length=100, verbose_name="اسم البنر")
     banner_type = models.CharField(max_length=20, choices=BANNER_TYPES, verbose_name="نوع البنر")
     image = models.ImageField(upload_to='banners/', verbose_name="صورة البنر")
+    image_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name="نسخ الصور")
     representative = models.ForeignKey(
         Representative, 
         on_delete=models.CASCADE, 
@@ -457,6 +488,7 @@ class Event(BaseModel):
     event_date = models.DateTimeField(verbose_name="تاريخ المناسبة")
     location = models.CharField(max_length=200, blank=True, verbose_name="المكان")
     image = models.ImageField(upload_to='events/', blank=True, verbose_name="صورة المناسبة")
+    image_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name="نسخ الصور")
     admin_approved = models.BooleanField(default=False, verbose_name="موافقة الإدارة")
 
     class Meta:
@@ -466,3 +498,52 @@ class Event(BaseModel):
 
     def __str__(self):
         return f"{self.title} - {self.representative.name}"
+
+
+# ========== لقطات الإحصائيات ==========
+
+class PlatformStatsSnapshot(models.Model):
+    """لقطة مجمعة لإحصائيات المنصة (صف واحد يحدث تدريجياً)"""
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID)
+    total_representatives = models.IntegerField(default=0, verbose_name="إجمالي النواب")
+    total_candidates = models.IntegerField(default=0, verbose_name="إجمالي المرشحين")
+    total_elected = models.IntegerField(default=0, verbose_name="إجمالي المنتخبين")
+    total_former = models.IntegerField(default=0, verbose_name="إجمالي السابقين")
+    total_distinguished = models.IntegerField(default=0, verbose_name="إجمالي المميزين")
+    total_male = models.IntegerField(default=0, verbose_name="إجمالي الذكور")
+    total_female = models.IntegerField(default=0, verbose_name="إجمالي الإناث")
+    rating_sum = models.DecimalField(max_digits=12, decimal_places=1, default=0, verbose_name="مجموع التقييمات")
+    total_solved_complaints = models.BigIntegerField(default=0, verbose_name="إجمالي الشكاوى المحلولة")
+    total_received_complaints = models.BigIntegerField(default=0, verbose_name="إجمالي الشكاوى المستلمة")
+    total_governorates = models.IntegerField(default=0, verbose_name="إجمالي المحافظات")
+    total_districts = models.IntegerField(default=0, verbose_name="إجمالي الدوائر")
+    total_parties = models.IntegerField(default=0, verbose_name="إجمالي الأحزاب")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="تاريخ التحديث")
+
+    class Meta:
+        verbose_name = "لقطة إحصائيات المنصة"
+        verbose_name_plural = "لقطات إحصائيات المنصة"
+
+    def __str__(self):
+        return f"إحصائيات المنصة ({self.updated_at})"
+
+
+class GovernorateStatsSnapshot(models.Model):
+    """عدد النواب النشطين لكل محافظة"""
+    governorate = models.OneToOneField(
+        Governorate,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats_snapshot',
+        verbose_name="المحافظة"
+    )
+    representatives_count = models.IntegerField(default=0, verbose_name="عدد النواب")
+
+    class Meta:
+        verbose_name = "لقطة إحصائيات محافظة"
+        verbose_name_plural = "لقطات إحصائيات المحافظات"
+
+    def __str__(self):
+        return f"{self.governorate.name} - {self.representatives_count}"
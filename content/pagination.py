@@ -0,0 +1,354 @@
+"""
+الترقيم لخدمة المحتوى - منصة نائبك.كوم
+
+بجانب الترقيم بالصفحات (OFFSET) يوفر ترقيماً بالمؤشر (keyset): الصفحة
+التالية تبدأ بعد آخر صف بمقارنة قيم حقول الترتيب كلها، فلا يتباطأ
+مع عمق الصفحات ولا تتكرر النتائج أو تُفقد عند إضافة صفوف أثناء التصفح.
+يُفعل بـ ?pagination=cursor ثم تتبع العميل روابط next/previous.
+
+العدد الكلي يُحسب بإحدى ثلاث طرق (count strategy):
+- exact: COUNT(*) في كل طلب.
+- cached: COUNT(*) يُخزن لفترة قصيرة بمفتاح من نص الاستعلام (أي الفلاتر).
+- estimate: تقدير مخطط PostgreSQL للمجموعات الكبيرة، وcached لما دونها.
+وتحمل الاستجابة count_exact لتوضح إن كان العدد دقيقاً.
+
+الطريقة الافتراضية لكل القوائم من CONTENT_COUNT_STRATEGY. الـ view الذي
+يحتاج طريقة أخرى يحددها صراحة بالخاصية count_strategy مع سبب ذلك.
+"""
+
+import base64
+import hashlib
+import json
+from functools import partial
+
+from django.conf import settings
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connection
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .cache import get_generations, shared_cache
+
+# طريقة العد الافتراضية ومدة تخزين الأعداد وحد المجموعات "الكبيرة"
+COUNT_STRATEGY = getattr(settings, 'CONTENT_COUNT_STRATEGY', 'cached')
+COUNT_CACHE_TIMEOUT = getattr(settings, 'CONTENT_COUNT_CACHE_TIMEOUT', 60)
+COUNT_ESTIMATE_THRESHOLD = getattr(settings, 'CONTENT_COUNT_ESTIMATE_THRESHOLD', 10000)
+
+TRUE_VALUES = ('1', 'true', 'yes')
+
+
+# ========== طرق العد: كل دالة تعيد (count, exact) ==========
+
+def exact_count(queryset):
+    return queryset.count(), True
+
+
+def cached_count(queryset, timeout=None):
+    """
+    COUNT فعلي يُخزن لمدة قصيرة بمفتاح من نص الاستعلام ومعاملاته وجيل
+    النموذج، فيتغير المفتاح مع أي تعديل. القيمة المقروءة من الـ cache
+    لا تُعد دقيقة لأنها قد تسبق تعديلات على الجداول المرتبطة.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    generation, = get_generations([queryset.model])
+    digest = hashlib.sha1(f'{sql}|{params!r}|{generation}'.encode('utf-8')).hexdigest()
+    key = f'count:{queryset.model._meta.label_lower}:{digest}'
+    count = shared_cache.get(key)
+    if count is not None:
+        return count, False
+    count = queryset.count()
+    shared_cache.set(key, count, COUNT_CACHE_TIMEOUT if timeout is None else timeout)
+    return count, True
+
+
+def planner_estimate(queryset):
+    """
+    تقدير PostgreSQL لعدد الصفوف دون تنفيذ الاستعلام: من pg_class.reltuples
+    للجدول دون فلاتر، ومن EXPLAIN لغير ذلك. None إن تعذر التقدير.
+    """
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        if not queryset.query.where:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+            # reltuples = -1 قبل أول ANALYZE
+            return int(row[0]) if row and row[0] >= 0 else None
+        sql, params = queryset.order_by().values('pk').query.sql_with_params()
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def estimated_count(queryset):
+    """تقدير المخطط للمجموعات الكبيرة، والعد المخزن لما دون COUNT_ESTIMATE_THRESHOLD"""
+    estimate = planner_estimate(queryset)
+    if estimate is not None and estimate >= COUNT_ESTIMATE_THRESHOLD:
+        return estimate, False
+    return cached_count(queryset)
+
+
+COUNT_STRATEGIES = {
+    'exact': exact_count,
+    'cached': cached_count,
+    'estimate': estimated_count,
+}
+
+
+def count_queryset(queryset, strategy=None):
+    """(count, exact) بالطريقة المطلوبة أو الافتراضية من الإعدادات"""
+    return COUNT_STRATEGIES[strategy or COUNT_STRATEGY](queryset)
+
+
+class CountedPage(Page):
+    """صفحة تعرف وجود ما بعدها حتى مع عدد تقريبي"""
+
+    def has_next(self):
+        if self.paginator.count_exact:
+            return super().has_next()
+        return self.has_more
+
+
+class StrategyPaginator(Paginator):
+    """
+    Paginator يحسب count بطريقة العد المحددة. مع العدد التقريبي لا تُرفض
+    الصفحات بعد آخر صفحة محسوبة، ويُعرف وجود صفحة تالية بجلب صف إضافي.
+    """
+
+    def __init__(self, *args, count_strategy=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_strategy = count_strategy
+        self.count_exact = True
+
+    @property
+    def count(self):
+        if not hasattr(self, '_count'):
+            self._count, self.count_exact = count_queryset(self.object_list, self.count_strategy)
+        return self._count
+
+    def validate_number(self, number):
+        # حساب العدد أولاً يحدد count_exact
+        if self.count is not None and self.count_exact:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('رقم الصفحة غير صحيح')
+        if number < 1:
+            raise EmptyPage('رقم الصفحة أقل من 1')
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if self.count_exact:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        page = CountedPage(rows[:self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
+    def _get_page(self, *args, **kwargs):
+        return CountedPage(*args, **kwargs)
+
+
+class StandardResultsSetPagination(PageNumberPagination):
+    """إعدادات الترقيم القياسية"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    count_strategy = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        strategy = getattr(view, 'count_strategy', None) or self.count_strategy
+        self.django_paginator_class = partial(StrategyPaginator, count_strategy=strategy)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data['count_exact'] = self.page.paginator.count_exact
+        return response
+
+
+class KeysetPagination(BasePagination):
+    """
+    ترقيم بالمؤشر على ترتيب الـ queryset الحالي (مع id لكسر التساوي).
+    المؤشر نص base64 لا يعتمد عليه العميل: يحمل قيم حقول الترتيب لآخر
+    (أو أول) صف في الصفحة واتجاه التصفح.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    count_query_param = 'include_count'
+    count_strategy = None
+    invalid_cursor_message = 'مؤشر الصفحة غير صالح'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['reverse'])
+
+        self.count = None
+        if request.query_params.get(self.count_query_param, '').lower() in TRUE_VALUES:
+            self.count, self.count_exact = self.get_count(queryset, view)
+
+        queryset = queryset.order_by(*(
+            ('-' if descending != reverse else '') + name
+            for name, descending in self.ordering
+        ))
+        if cursor:
+            queryset = queryset.filter(self.after_position(cursor['position'], reverse))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.has_next = has_more if not reverse else cursor is not None
+        self.has_previous = cursor is not None if not reverse else has_more
+        self.first_position = self.get_position(rows[0]) if rows else None
+        self.last_position = self.get_position(rows[-1]) if rows else None
+        return rows
+
+    def get_paginated_data(self, results):
+        data = {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+        }
+        if self.count is not None:
+            data['count'] = self.count
+            data['count_exact'] = self.count_exact
+        data['results'] = results
+        return data
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_count(self, queryset, view=None):
+        strategy = getattr(view, 'count_strategy', None) or self.count_strategy
+        return count_queryset(queryset, strategy)
+
+    # ---------- الترتيب والموضع ----------
+
+    def get_ordering(self, queryset):
+        """حقول الترتيب [(name, descending)] منتهية بالمفتاح الأساسي"""
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        fields = []
+        for item in ordering:
+            if not isinstance(item, str) or '__' in item or item == '?':
+                raise ValueError(f'ترتيب غير مدعوم في الترقيم بالمؤشر: {item}')
+            name = item.lstrip('-')
+            fields.append(('id' if name == 'pk' else name, item.startswith('-')))
+        if not any(name == 'id' for name, _ in fields):
+            fields.append(('id', False))
+        self._model = queryset.model
+        return fields
+
+    def get_position(self, row):
+        # الصفوف قد تكون كائنات أو قواميس values() (المسار السريع)
+        if isinstance(row, dict):
+            return [row[name] for name, _ in self.ordering]
+        return [getattr(row, name) for name, _ in self.ordering]
+
+    def after_position(self, position, reverse):
+        """
+        شرط المقارنة المعجمية: (f1 بعد v1) أو (f1 = v1 و f2 بعد v2) ...
+        وهو الشكل الذي يستطيع المخطط استخدام الفهرس المركب معه.
+        """
+        condition = Q()
+        equal = Q()
+        for (name, descending), value in zip(self.ordering, position):
+            lookup = 'lt' if descending != reverse else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    # ---------- المؤشرات ----------
+
+    def encode_cursor(self, position, reverse):
+        payload = json.dumps({'p': position, 'r': int(reverse)}, cls=DjangoJSONEncoder)
+        token = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, token
+        )
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+            position = [
+                self._to_python(name, value)
+                for (name, _), value in zip(self.ordering, payload['p'], strict=True)
+            ]
+            return {'position': position, 'reverse': bool(payload['r'])}
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _to_python(self, name, value):
+        try:
+            field = self._model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # حقل محسوب (rank / similarity)
+            return value
+        return field.to_python(value)
+
+    def get_next_link(self):
+        if not self.has_next or self.last_position is None:
+            return None
+        return self.encode_cursor(self.last_position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.first_position is None:
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self.encode_cursor(self.first_position, reverse=True)
+
+
+def uses_cursor_pagination(request, cursor_query_param='cursor'):
+    return (
+        request.query_params.get('pagination') == 'cursor'
+        or bool(request.query_params.get(cursor_query_param))
+    )
+
+
+class ListingPagination(StandardResultsSetPagination):
+    """الترقيم بالصفحات افتراضياً، وبالمؤشر عند ?pagination=cursor أو ?cursor="""
+
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if uses_cursor_pagination(request, self.keyset_class.cursor_query_param):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,95 @@
+"""
+خطط الاستعلام لخدمة المحتوى - منصة نائبك.كوم
+
+الـ querysets التي تحتاجها الـ serializers معرفة هنا مرة واحدة مع
+العلاقات التي تُجلب معها، حتى يُبنى كل رد بعدد ثابت من الاستعلامات
+مهما كان عدد العناصر المرتبطة.
+"""
+
+from functools import partial
+
+from django.db.models import Prefetch, prefetch_related_objects
+
+from .fanout import agather, run_parallel
+
+from .models import Representative, RepresentativeImage, Achievement, News, Event
+
+# كل ما يقرؤه RepresentativeDetailSerializer: الدائرة والمحافظة والحزب
+# بـ JOIN، والعناصر التابعة النشطة (والموافق عليها) باستعلام لكل علاقة
+# (prefetch_detail يوزعها بالتوازي بعد جلب صف النائب).
+# الأخبار والمناسبات محدودة العدد وتُحفظ في to_attr لأن Django 4.2 لا
+# يقبل Prefetch مقطوعاً (slice) على الـ manager نفسه.
+REPRESENTATIVE_DETAIL_RELATED = ('district__governorate', 'party')
+REPRESENTATIVE_DETAIL_PREFETCH = (
+    Prefetch('additional_images', queryset=RepresentativeImage.objects.filter(is_active=True)),
+    Prefetch('achievement_list', queryset=Achievement.objects.filter(is_active=True)),
+    Prefetch(
+        'news',
+        queryset=News.objects.filter(is_active=True)[:Representative.LATEST_NEWS_LIMIT],
+        to_attr='_latest_news'
+    ),
+    Prefetch(
+        'events',
+        queryset=Event.objects.filter(
+            is_active=True, admin_approved=True
+        )[:Representative.APPROVED_EVENTS_LIMIT],
+        to_attr='_approved_events'
+    ),
+)
+
+
+# أعمدة النائب التي يقرؤها RepresentativeListSerializer (وحقول الترتيب)،
+# فلا تُنقل أعمدة TEXT الكبيرة مثل bio وelectoral_program في القوائم
+REPRESENTATIVE_LIST_FIELDS = (
+    'id', 'name', 'slug', 'gender', 'profession', 'profile_image', 'image_variants',
+    'district', 'party', 'status', 'electoral_number', 'electoral_symbol',
+    'rating', 'rating_count', 'solved_complaints', 'received_complaints',
+    'is_distinguished', 'created_at',
+)
+REPRESENTATIVE_LIST_RELATED_FIELDS = (
+    'district__name', 'district__governorate', 'district__governorate__name',
+    'party__name', 'party__color',
+)
+
+
+def public_representatives():
+    """النواب الظاهرون للزوار"""
+    return Representative.objects.filter(is_active=True, admin_approved=True)
+
+
+def shape_for_list(queryset):
+    """JOIN للدائرة والمحافظة والحزب وجلب أعمدة القائمة فقط"""
+    return queryset.select_related('district__governorate', 'party').only(
+        *REPRESENTATIVE_LIST_FIELDS, *REPRESENTATIVE_LIST_RELATED_FIELDS
+    )
+
+
+def representative_list_queryset():
+    """قوائم النواب ونتائج البحث: استعلام واحد لكل صفحة"""
+    return shape_for_list(public_representatives())
+
+
+def representative_detail_queryset():
+    """صف النائب لصفحته؛ العلاقات التابعة تُجلب بعده بـ prefetch_detail"""
+    return public_representatives().select_related(*REPRESENTATIVE_DETAIL_RELATED)
+
+
+def _detail_branches(representative):
+    # قاموس الـ prefetch يُنشأ قبل التوزيع حتى لا ينشئه فرعان معاً
+    representative._prefetched_objects_cache = {}
+    return [
+        partial(prefetch_related_objects, [representative], lookup)
+        for lookup in REPRESENTATIVE_DETAIL_PREFETCH
+    ]
+
+
+def prefetch_detail(representative):
+    """العلاقات التابعة لصفحة النائب: 4 استعلامات مستقلة تُنفذ بالتوازي"""
+    run_parallel(*_detail_branches(representative))
+    return representative
+
+
+async def aprefetch_detail(representative):
+    """نسخة prefetch_detail غير المتزامنة"""
+    await agather(*_detail_branches(representative))
+    return representative
@@ -0,0 +1,95 @@
+"""
+محول JSON السريع لخدمة المحتوى - منصة نائبك.كوم
+
+يستخدم orjson إن كانت مثبتة (وإلا مكتبة json القياسية) ويكتب النص
+العربي UTF-8 كما هو. يقبل أجزاء JSON محولة مسبقاً (JSONFragment) داخل
+البيانات، مثل قوائم المحافظات والأحزاب المخزنة، فتُدرج في الاستجابة
+كما هي دون فكها وإعادة تحويلها.
+"""
+
+import json
+import uuid
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson اختيارية
+    orjson = None
+
+# orjson >= 3.9 تدرج الأجزاء بنفسها، وما قبلها يحتاج الاستبدال بعد التحويل
+NATIVE_FRAGMENTS = orjson is not None and hasattr(orjson, 'Fragment')
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class JSONFragment:
+    """نص JSON جاهز (bytes) يُدرج في الاستجابة دون إعادة تحويل"""
+
+    __slots__ = ('content',)
+
+    def __init__(self, content):
+        self.content = content if isinstance(content, bytes) else content.encode('utf-8')
+
+    def tolist(self):
+        # لمحولات DRF الأخرى: JSONEncoder يستدعي tolist() للأنواع غير المعروفة
+        return json.loads(self.content)
+
+    def __getstate__(self):
+        return self.content
+
+    def __setstate__(self, state):
+        self.content = state
+
+    def __eq__(self, other):
+        return isinstance(other, JSONFragment) and other.content == self.content
+
+    def __repr__(self):
+        return f'JSONFragment({self.content[:40]!r})'
+
+
+_drf_encoder = JSONEncoder()
+
+
+def dumps(data):
+    """تحويل البيانات إلى bytes بصيغة JSON مضغوطة مع إدراج الأجزاء الجاهزة"""
+    fragments = {}
+    marker = uuid.uuid4().hex
+
+    def default(obj):
+        if isinstance(obj, JSONFragment):
+            if NATIVE_FRAGMENTS:
+                return orjson.Fragment(obj.content)
+            token = f'__fragment_{marker}_{len(fragments)}__'
+            fragments[f'"{token}"'.encode('ascii')] = obj.content
+            return token
+        # نفس تحويلات DRF (التواريخ، Decimal، النصوص المؤجلة ...)
+        return _drf_encoder.default(obj)
+
+    if orjson is not None:
+        content = orjson.dumps(data, default=default, option=ORJSON_OPTIONS)
+    else:
+        content = json.dumps(
+            data, default=default, ensure_ascii=False, separators=(',', ':'), allow_nan=False
+        ).encode('utf-8')
+
+    for token, fragment in fragments.items():
+        content = content.replace(token, fragment, 1)
+    return content
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    بديل JSONRenderer الافتراضي. طلبات التنسيق (indent) تمر على محول
+    DRF الأصلي بعد فك الأجزاء الجاهزة.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(json.loads(dumps(data)), accepted_media_type, renderer_context)
+        return dumps(data)
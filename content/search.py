@@ -0,0 +1,274 @@
+"""
+محرك البحث لخدمة المحتوى - منصة نائبك.كوم
+
+على PostgreSQL يُخزن لكل نائب متجه tsvector موزون (عليه فهرس GIN)
+وتُرتب النتائج بـ ts_rank. على SQLite (الاختبارات والتطوير) يُستخدم
+نص البحث الموحد search_text بنفس التطبيع. في الحالتين يُطبع النص
+العربي عند الفهرسة وعند الاستعلام بنفس الدالة.
+
+البحث التقريبي بالاسم (fuzzy) يستخدم pg_trgm على الحقول الموحدة،
+وعلى SQLite فهرس n-gram في الذاكرة يحاكي word_similarity.
+"""
+
+import re
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+)
+from django.db import connection
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.db.models.functions import Greatest
+
+from .models import Representative
+
+# التشكيل والتطويل وعلامات المصحف
+TASHKEEL_RE = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]')
+# أشكال الألف: آ أ إ ٱ
+ALEF_RE = re.compile('[\u0622\u0623\u0625\u0671]')
+NON_WORD_RE = re.compile(r'[^\w\s]|_')
+
+# ى ئ -> ي ، ؤ -> و ، ة -> ه
+CHARACTER_MAP = str.maketrans({
+    '\u0649': '\u064a',
+    '\u0626': '\u064a',
+    '\u0624': '\u0648',
+    '\u0629': '\u0647',
+})
+
+# الأوزان: الاسم > الدائرة/المحافظة/الحزب > المهنة > السيرة/البرنامج
+WEIGHTED_FIELDS = (
+    ('A', ('name', 'name_en')),
+    ('B', ('district__name', 'district__governorate__name', 'party__name')),
+    ('C', ('profession',)),
+    ('D', ('bio', 'electoral_program')),
+)
+
+# الحقول الموحدة للبحث التقريبي وأصلها
+NORMALIZED_FIELDS = {
+    'name_normalized': 'name',
+    'name_en_normalized': 'name_en',
+    'profession_normalized': 'profession',
+}
+
+SEARCH_CONFIG = 'simple'
+DEFAULT_ORDERING = ('-is_distinguished', '-rating', 'name')
+INDEX_BATCH_SIZE = 500
+
+# الحد الأدنى للتشابه في البحث التقريبي (مثل pg_trgm.word_similarity_threshold)
+FUZZY_THRESHOLD = getattr(settings, 'CONTENT_FUZZY_THRESHOLD', 0.6)
+
+
+def normalize_arabic(text):
+    """توحيد النص العربي: حذف التشكيل وتوحيد الألف والياء والتاء المربوطة"""
+    if not text:
+        return ''
+    text = TASHKEEL_RE.sub('', text)
+    text = ALEF_RE.sub('ا', text)
+    text = text.translate(CHARACTER_MAP).lower()
+    text = NON_WORD_RE.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def uses_postgres_search():
+    return connection.vendor == 'postgresql'
+
+
+def build_documents(row):
+    """النص الموحد لكل وزن من صف values()"""
+    return {
+        weight: ' '.join(filter(None, (normalize_arabic(row[field]) for field in fields)))
+        for weight, fields in WEIGHTED_FIELDS
+    }
+
+
+def build_search_vector(documents):
+    """تعبير tsvector الموزون من النصوص الموحدة"""
+    vector = None
+    for weight, _ in WEIGHTED_FIELDS:
+        part = SearchVector(Value(documents[weight]), config=SEARCH_CONFIG, weight=weight)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def search_index_fields():
+    """حقول الفهرس التي تكتبها apply_search_index"""
+    fields = ['search_text', *NORMALIZED_FIELDS]
+    if uses_postgres_search():
+        fields.append('search_vector')
+    return fields
+
+
+def apply_search_index(representative, row):
+    """ضبط حقول الفهرس على كائن النائب من صف فيه حقول WEIGHTED_FIELDS"""
+    documents = build_documents(row)
+    representative.search_text = ' '.join(filter(None, documents.values()))
+    for field, source in NORMALIZED_FIELDS.items():
+        setattr(representative, field, normalize_arabic(row[source]))
+    if uses_postgres_search():
+        representative.search_vector = build_search_vector(documents)
+
+
+def update_search_index(queryset=None):
+    """إعادة حساب نص ومتجه البحث لمجموعة نواب (أو للجميع)"""
+    if queryset is None:
+        queryset = Representative.objects.all()
+
+    source_fields = [field for _, fields in WEIGHTED_FIELDS for field in fields]
+    update_fields = search_index_fields()
+    rows = queryset.order_by().values('pk', *source_fields).iterator(chunk_size=INDEX_BATCH_SIZE)
+
+    batch = []
+    updated = 0
+    for row in rows:
+        representative = Representative(pk=row['pk'])
+        apply_search_index(representative, row)
+        batch.append(representative)
+        if len(batch) >= INDEX_BATCH_SIZE:
+            Representative.objects.bulk_update(batch, update_fields)
+            updated += len(batch)
+            batch = []
+    if batch:
+        Representative.objects.bulk_update(batch, update_fields)
+        updated += len(batch)
+    return updated
+
+
+def search_representatives(queryset, query):
+    """
+    تطبيق البحث على queryset وترتيبه بالصلة.
+    كل كلمة في الاستعلام يجب أن تطابق (مع مطابقة البادئة).
+    """
+    terms = normalize_arabic(query).split()
+    if not terms:
+        return queryset.none()
+
+    if uses_postgres_search():
+        search_query = SearchQuery(
+            ' & '.join(f'{term}:*' for term in terms),
+            config=SEARCH_CONFIG,
+            search_type='raw'
+        )
+        return queryset.filter(search_vector=search_query).annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        ).order_by('-rank', *DEFAULT_ORDERING)
+
+    for term in terms:
+        queryset = queryset.filter(search_text__contains=term)
+    return queryset.order_by(*DEFAULT_ORDERING)
+
+
+# ========== البحث التقريبي ==========
+
+def trigrams(word):
+    """ثلاثيات الكلمة بنفس حشو pg_trgm (مسافتان قبلها ومسافة بعدها)"""
+    padded = f'  {word} '
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+def text_trigrams(text):
+    grams = set()
+    for word in text.split():
+        grams |= trigrams(word)
+    return grams
+
+
+def ordered_trigrams(text):
+    """ثلاثيات النص بترتيب ظهورها كلمة بعد كلمة"""
+    sequence = []
+    for word in text.split():
+        padded = f'  {word} '
+        sequence.extend(padded[index:index + 3] for index in range(len(padded) - 2))
+    return sequence
+
+
+def word_similarity(query, text):
+    """
+    مكافئ word_similarity في pg_trgm: أعلى تشابه بين ثلاثيات الاستعلام
+    وأي مقطع متصل من ثلاثيات النص المرتبة.
+    """
+    query_grams = text_trigrams(query)
+    sequence = ordered_trigrams(text)
+    if not query_grams or not sequence:
+        return 0.0
+
+    best = 0.0
+    for start, first in enumerate(sequence):
+        if first not in query_grams:
+            continue
+        extent = set()
+        shared = 0
+        for gram in sequence[start:]:
+            if gram not in extent:
+                extent.add(gram)
+                shared += gram in query_grams
+            best = max(best, shared / (len(query_grams) + len(extent) - shared))
+    return best
+
+
+class NGramIndex:
+    """فهرس ثلاثيات في الذاكرة: قوائم ترحيل لكل ثلاثية ثم تقييم المرشحين"""
+
+    def __init__(self):
+        self._texts = defaultdict(list)
+        self._postings = defaultdict(set)
+
+    def add(self, key, text):
+        if not text:
+            return
+        self._texts[key].append(text)
+        for gram in text_trigrams(text):
+            self._postings[gram].add(key)
+
+    def search(self, query, threshold=FUZZY_THRESHOLD):
+        """[(key, similarity)] مرتبة تنازلياً بالتشابه"""
+        candidates = set()
+        for gram in text_trigrams(query):
+            candidates |= self._postings.get(gram, set())
+
+        results = []
+        for key in candidates:
+            score = max(word_similarity(query, text) for text in self._texts[key])
+            if score >= threshold:
+                results.append((key, score))
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results
+
+
+def fuzzy_search_representatives(queryset, query, threshold=None):
+    """
+    بحث تقريبي يتحمل الأخطاء الإملائية في الاسم والاسم الإنجليزي والمهنة،
+    مع إضافة similarity وترتيب النتائج بها.
+    """
+    threshold = FUZZY_THRESHOLD if threshold is None else threshold
+    normalized = normalize_arabic(query)
+    if not normalized:
+        return queryset.none()
+
+    if uses_postgres_search():
+        # المعامل <% يستخدم فهارس GIN (gin_trgm_ops) على الحقول الموحدة
+        matches = Q()
+        for field in NORMALIZED_FIELDS:
+            matches |= Q(**{f'{field}__trigram_word_similar': normalized})
+        similarity = Greatest(*(
+            TrigramWordSimilarity(normalized, field) for field in NORMALIZED_FIELDS
+        ))
+        return queryset.filter(matches).annotate(similarity=similarity).filter(
+            similarity__gte=threshold
+        ).order_by('-similarity', *DEFAULT_ORDERING)
+
+    index = NGramIndex()
+    for row in queryset.values('pk', *NORMALIZED_FIELDS):
+        for field in NORMALIZED_FIELDS:
+            index.add(row['pk'], row[field])
+    scores = index.search(normalized, threshold)
+    if not scores:
+        return queryset.none()
+
+    return queryset.filter(pk__in=[pk for pk, _ in scores]).annotate(
+        similarity=Case(
+            *(When(pk=pk, then=Value(score)) for pk, score in scores),
+            output_field=FloatField()
+        )
+    ).order_by('-similarity', *DEFAULT_ORDERING)
@@ -8,9 +8,11 @@ from .models import (
     RepresentativeImage, Achievement, News, StaticPage,
     Banner, ColorSettings, SiteSettings, FAQ, Event
 )
+from .fast_serializers import FastSerializerMixin
+from .images import ImageVariantsField
 
 
-class GovernorateSerializer(serializers.ModelSerializer):
+class GovernorateSerializer(FastSerializerMixin, serializers.ModelSerializer):
     """Serializer للمحافظات"""
     
     class Meta:
@@ -18,7 +20,7 @@ class GovernorateSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'name_en', 'code', 'population', 'area']
 
 
-class DistrictSerializer(serializers.ModelSerializer):
+class DistrictSerializer(FastSerializerMixin, serializers.ModelSerializer):
     """Serializer للدوائر الانتخابية"""
     governorate_name = serializers.CharField(source='governorate.name', read_only=True)
     
@@ -27,7 +29,7 @@ class DistrictSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'governorate', 'governorate_name', 'number', 'description']
 
 
-class PoliticalPartySerializer(serializers.ModelSerializer):
+class PoliticalPartySerializer(FastSerializerMixin, serializers.ModelSerializer):
     """Serializer للأحزاب السياسية"""
     
     class Meta:
@@ -40,10 +42,11 @@ class PoliticalPartySerializer(serializers.ModelSerializer):
 
 class RepresentativeImageSerializer(serializers.ModelSerializer):
     """Serializer لصور النواب الإضافية"""
+    image_variants = ImageVariantsField('image')
     
     class Meta:
         model = RepresentativeImage
-        fields = ['id', 'image', 'caption', 'order']
+        fields = ['id', 'image', 'image_variants', 'caption', 'order']
 
 
 class AchievementSerializer(serializers.ModelSerializer):
@@ -56,34 +59,40 @@ class AchievementSerializer(serializers.ModelSerializer):
 
 class NewsSerializer(serializers.ModelSerializer):
     """Serializer لأخبار النواب"""
+    image_variants = ImageVariantsField('image')
     
     class Meta:
         model = News
-        fields = ['id', 'title', 'content', 'image', 'published_date', 'is_featured']
+        fields = ['id', 'title', 'content', 'image', 'image_variants', 'published_date', 'is_featured']
 
 
 class EventSerializer(serializers.ModelSerializer):
     """Serializer للمناسبات والمؤتمرات"""
+    image_variants = ImageVariantsField('image')
     
     class Meta:
         model = Event
         fields = [
             'id', 'title', 'description', 'event_type', 'event_date', 
-            'location', 'image', 'admin_approved'
+            'location', 'image', 'image_variants', 'admin_approved'
         ]
 
 
-class RepresentativeListSerializer(serializers.ModelSerializer):
+class RepresentativeListSerializer(FastSerializerMixin, serializers.ModelSerializer):
     """Serializer مبسط لقائمة النواب"""
     district_name = serializers.CharField(source='district.name', read_only=True)
     governorate_name = serializers.CharField(source='district.governorate.name', read_only=True)
     party_name = serializers.CharField(source='party.name', read_only=True)
     party_color = serializers.CharField(source='party.color', read_only=True)
+    profile_image_variants = ImageVariantsField('profile_image')
+    
+    # المسار السريع: الحقول التي تحتاجها الخاصية success_rate
+    fast_property_fields = {'success_rate': ('solved_complaints', 'received_complaints')}
     
     class Meta:
         model = Representative
         fields = [
-            'id', 'name', 'slug', 'gender', 'profession', 'profile_image',
+            'id', 'name', 'slug', 'gender', 'profession', 'profile_image', 'profile_image_variants',
             'district', 'district_name', 'governorate_name', 'party', 'party_name', 'party_color',
             'status', 'electoral_number', 'electoral_symbol',
             'rating', 'rating_count', 'solved_complaints', 'received_complaints',
@@ -99,12 +108,14 @@ class RepresentativeDetailSerializer(serializers.ModelSerializer):
     party_color = serializers.CharField(source='party.color', read_only=True)
     age = serializers.ReadOnlyField()
     success_rate = serializers.ReadOnlyField()
+    profile_image_variants = ImageVariantsField('profile_image')
+    banner_image_variants = ImageVariantsField('banner_image')
     
     # العلاقات
     additional_images = RepresentativeImageSerializer(many=True, read_only=True)
     achievement_list = AchievementSerializer(many=True, read_only=True)
-    news = NewsSerializer(many=True, read_only=True)
-    events = EventSerializer(many=True, read_only=True)
+    news = NewsSerializer(many=True, read_only=True, source='latest_news')
+    events = EventSerializer(many=True, read_only=True, source='approved_events')
     
     class Meta:
         model = Representative
@@ -113,7 +124,8 @@ class RepresentativeDetailSerializer(serializers.ModelSerializer):
             'profession', 'education', 'party', 'party_name', 'party_color',
             'district', 'district_name', 'governorate_name', 'status',
             'electoral_number', 'electoral_symbol', 'election_year',
-            'profile_image', 'banner_image', 'rating', 'rating_count',
+            'profile_image', 'profile_image_variants', 'banner_image', 'banner_image_variants',
+            'rating', 'rating_count',
             'solved_complaints', 'received_complaints', 'success_rate',
             'is_distinguished', 'bio', 'achievements', 'electoral_program',
             'phone', 'email', 'facebook', 'twitter', 'website',
@@ -131,8 +143,10 @@ class RepresentativeCreateSerializer(serializers.ModelSerializer):
             'name', 'name_en', 'gender', 'birth_date', 'profession', 'education',
             'party', 'district', 'status', 'electoral_number', 'electoral_symbol',
             'profile_image', 'bio', 'electoral_program', 'phone', 'email',
-            'facebook', 'twitter', 'website'
+            'facebook', 'twitter', 'website', 'slug'
         ]
+        # الرابط يُحجز عند الحفظ ويعود في الاستجابة
+        read_only_fields = ['slug']
 
     def validate_name(self, value):
         """التحقق من عدم تكرار الاسم"""
@@ -156,11 +170,12 @@ class StaticPageSerializer(serializers.ModelSerializer):
 class BannerSerializer(serializers.ModelSerializer):
     """Serializer للبنرات"""
     representative_name = serializers.CharField(source='representative.name', read_only=True)
+    image_variants = ImageVariantsField('image')
     
     class Meta:
         model = Banner
         fields = [
-            'id', 'name', 'banner_type', 'image', 'representative', 
+            'id', 'name', 'banner_type', 'image', 'image_variants', 'representative', 
             'representative_name', 'is_default', 'alt_text'
         ]
 
@@ -243,6 +258,7 @@ class SearchResultSerializer(serializers.Serializer):
     """Serializer لنتائج البحث"""
     representatives = RepresentativeListSerializer(many=True)
     total_count = serializers.IntegerField()
+    count_exact = serializers.BooleanField(default=True)
     page_count = serializers.IntegerField()
     current_page = serializers.IntegerField()
     has_next = serializers.BooleanField()
@@ -0,0 +1,225 @@
+"""
+Signals لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+from functools import partial
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import (
+    Governorate, District, PoliticalParty, Representative,
+    RepresentativeImage, Achievement, News, StaticPage,
+    Banner, ColorSettings, SiteSettings, FAQ, Event
+)
+from .cache import bump_generation
+from .search import update_search_index
+from . import images, stats, tasks
+
+# النماذج التي يبطل تعديلها الاستجابات المخزنة المعتمدة عليها
+CACHE_INVALIDATING_MODELS = (
+    Governorate, District, PoliticalParty, Representative,
+    RepresentativeImage, Achievement, News, StaticPage,
+    Banner, ColorSettings, SiteSettings, FAQ, Event,
+)
+
+
+def _governorate_of(district_id):
+    """المحافظة التابعة لها الدائرة"""
+    if district_id is None:
+        return None
+    return District.objects.filter(pk=district_id).values_list('governorate_id', flat=True).first()
+
+
+def _representative_values(instance):
+    """قيم حقول الإحصائيات من كائن النائب"""
+    return {field: getattr(instance, field) for field in stats.REPRESENTATIVE_STATS_FIELDS}
+
+
+# ========== لقطة الإحصائيات ==========
+
+@receiver(pre_save, sender=Representative)
+def capture_representative_stats_state(sender, instance, raw=False, **kwargs):
+    """حفظ الحالة السابقة للنائب قبل التعديل لحساب الفرق"""
+    instance._stats_previous = None
+    if raw or instance._state.adding:
+        return
+    instance._stats_previous = Representative.objects.filter(pk=instance.pk).values(
+        *stats.REPRESENTATIVE_STATS_FIELDS, 'district__governorate_id'
+    ).first()
+
+
+@receiver(post_save, sender=Representative)
+def update_stats_on_representative_save(sender, instance, raw=False, **kwargs):
+    """تطبيق فرق الإحصائيات بعد حفظ النائب"""
+    if raw:
+        return
+    previous = getattr(instance, '_stats_previous', None)
+    current = _representative_values(instance)
+
+    previous_governorate_id = previous['district__governorate_id'] if previous else None
+    if previous and previous['district_id'] == instance.district_id:
+        current_governorate_id = previous_governorate_id
+    else:
+        current_governorate_id = _governorate_of(instance.district_id)
+
+    stats.apply_snapshot_delta(previous, previous_governorate_id, current, current_governorate_id)
+
+
+@receiver(post_delete, sender=Representative)
+def update_stats_on_representative_delete(sender, instance, **kwargs):
+    """طرح مساهمة النائب المحذوف من الإحصائيات"""
+    stats.apply_snapshot_delta(
+        _representative_values(instance), _governorate_of(instance.district_id), None, None
+    )
+
+
+@receiver(pre_save, sender=District)
+def capture_district_governorate(sender, instance, raw=False, **kwargs):
+    """حفظ المحافظة السابقة للدائرة قبل التعديل"""
+    instance._stats_previous_governorate_id = None
+    if raw or instance._state.adding:
+        return
+    instance._stats_previous_governorate_id = _governorate_of(instance.pk)
+
+
+@receiver(post_save, sender=District)
+def move_stats_on_district_change(sender, instance, raw=False, **kwargs):
+    """نقل عدد نواب الدائرة عند نقلها لمحافظة أخرى"""
+    if raw:
+        return
+    previous_governorate_id = getattr(instance, '_stats_previous_governorate_id', None)
+    if previous_governorate_id and previous_governorate_id != instance.governorate_id:
+        count = instance.representatives.filter(is_active=True).count()
+        if count:
+            stats.move_governorate_count(previous_governorate_id, -count)
+            stats.move_governorate_count(instance.governorate_id, count)
+
+
+@receiver(post_save, sender=Governorate)
+@receiver(post_save, sender=District)
+@receiver(post_save, sender=PoliticalParty)
+@receiver(post_delete, sender=Governorate)
+@receiver(post_delete, sender=District)
+@receiver(post_delete, sender=PoliticalParty)
+def update_reference_counters(sender, raw=False, **kwargs):
+    """تحديث عدادات المحافظات والدوائر والأحزاب في اللقطة"""
+    if raw:
+        return
+    stats.refresh_reference_counter(sender)
+
+
+# ========== فهرس البحث ==========
+
+@receiver(post_save, sender=Representative)
+def index_representative(sender, instance, raw=False, **kwargs):
+    """تحديث نص ومتجه البحث للنائب بعد حفظه"""
+    if raw:
+        return
+    update_search_index(Representative.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=District)
+def reindex_district_representatives(sender, instance, raw=False, **kwargs):
+    """إعادة فهرسة نواب الدائرة (اسم الدائرة والمحافظة من الحقول الموزونة)"""
+    if raw or kwargs.get('created'):
+        return
+    update_search_index(Representative.objects.filter(district=instance))
+
+
+@receiver(post_save, sender=Governorate)
+def reindex_governorate_representatives(sender, instance, raw=False, **kwargs):
+    """إعادة فهرسة نواب المحافظة"""
+    if raw or kwargs.get('created'):
+        return
+    update_search_index(Representative.objects.filter(district__governorate=instance))
+
+
+@receiver(post_save, sender=PoliticalParty)
+def reindex_party_representatives(sender, instance, raw=False, **kwargs):
+    """إعادة فهرسة نواب الحزب"""
+    if raw or kwargs.get('created'):
+        return
+    update_search_index(Representative.objects.filter(party=instance))
+
+
+# ========== معالجة الصور ==========
+
+def capture_image_changes(sender, instance, raw=False, **kwargs):
+    """تحديد حقول الصور التي تغيرت وإسقاط نسخها القديمة قبل الحفظ"""
+    fields = images.image_fields(sender)
+    has_variants = sender._meta.label in images.IMAGE_VARIANT_FIELDS
+    instance._changed_image_fields = []
+    if raw:
+        return
+    previous = None
+    if not instance._state.adding:
+        columns = (*fields, 'image_variants') if has_variants else fields
+        previous = sender.objects.filter(pk=instance.pk).values(*columns).first()
+    variants = dict(instance.image_variants or {}) if has_variants else None
+    for field_name in fields:
+        field_file = getattr(instance, field_name)
+        previous_name = previous[field_name] if previous else ''
+        # ملف جديد لم يُحفظ بعد، أو اسم مختلف عن المحفوظ
+        if field_file._committed and (field_file.name or '') == (previous_name or ''):
+            continue
+        instance._changed_image_fields.append(field_name)
+        if not has_variants:
+            continue
+        variants.pop(field_name, None)
+        stale_paths = images.variant_paths(((previous or {}).get('image_variants') or {}).get(field_name))
+        if stale_paths:
+            storage = sender._meta.get_field(field_name).storage
+            transaction.on_commit(partial(images.delete_variant_files, storage, stale_paths))
+    if has_variants:
+        instance.image_variants = variants
+
+
+def schedule_image_processing(sender, instance, raw=False, **kwargs):
+    """إضافة معالجة الصور المتغيرة إلى طابور Celery بعد تأكيد المعاملة"""
+    if raw:
+        return
+    for field_name in getattr(instance, '_changed_image_fields', ()):
+        if getattr(instance, field_name):
+            transaction.on_commit(partial(
+                tasks.process_image.delay, sender._meta.label, str(instance.pk), field_name
+            ))
+
+
+def delete_image_variants(sender, instance, **kwargs):
+    """حذف ملفات النسخ مع الصف"""
+    for field_name in images.IMAGE_VARIANT_FIELDS[sender._meta.label]:
+        paths = images.variant_paths((instance.image_variants or {}).get(field_name))
+        if paths:
+            storage = sender._meta.get_field(field_name).storage
+            transaction.on_commit(partial(images.delete_variant_files, storage, paths))
+
+
+for model in apps.get_app_config('content').get_models():
+    if not images.image_fields(model):
+        continue
+    name = model._meta.model_name
+    pre_save.connect(capture_image_changes, sender=model, dispatch_uid=f'image_changes_{name}')
+    post_save.connect(schedule_image_processing, sender=model, dispatch_uid=f'image_processing_{name}')
+    if model._meta.label in images.IMAGE_VARIANT_FIELDS:
+        post_delete.connect(delete_image_variants, sender=model, dispatch_uid=f'image_variants_delete_{name}')
+
+
+# ========== إبطال الـ cache ==========
+
+def invalidate_cached_responses(sender, **kwargs):
+    """رفع جيل النموذج لإبطال كل الاستجابات المخزنة المعتمدة عليه"""
+    bump_generation(sender)
+
+
+for model in CACHE_INVALIDATING_MODELS:
+    post_save.connect(
+        invalidate_cached_responses, sender=model,
+        dispatch_uid=f'invalidate_cache_save_{model._meta.model_name}'
+    )
+    post_delete.connect(
+        invalidate_cached_responses, sender=model,
+        dispatch_uid=f'invalidate_cache_delete_{model._meta.model_name}'
+    )
@@ -0,0 +1,108 @@
+"""
+توليد روابط النواب (slug) لخدمة المحتوى - منصة نائبك.كوم
+
+الرابط الأساسي يُبنى من الاسم الإنجليزي أو العربي، وعند التعارض تُضاف
+لاحقة رقمية (-2، -3 ...). الحجز يتم لدفعات كاملة: استعلام واحد عن
+الروابط الأساسية المطلوبة، واستعلام واحد عن لواحق المتعارض منها فقط،
+ثم توزع اللواحق في الذاكرة.
+
+الكتّاب المتزامنون: على PostgreSQL يُؤخذ قفل استشاري (advisory lock)
+لكل رابط أساسي حتى نهاية المعاملة، فلا يحجز كاتبان نفس الرابط. وفي كل
+الأحوال يعيد الحفظ المحاولة برابط جديد إذا رفضه قيد التفرد.
+"""
+
+import hashlib
+import re
+from collections import Counter
+
+from django.db import IntegrityError, connection, transaction
+from django.utils.text import slugify
+
+SLUG_MAX_LENGTH = 300
+
+# مساحة محجوزة لللاحقة الرقمية
+SUFFIX_RESERVE = 8
+
+# عدد محاولات الحفظ عند تعارض الرابط مع كاتب آخر
+SAVE_ATTEMPTS = 5
+
+
+def base_slug(name, name_en=''):
+    """الرابط الأساسي: من الاسم الإنجليزي إن وجد، وإلا من الاسم العربي"""
+    slug = slugify(name_en) if name_en else ''
+    if not slug:
+        # إزالة التشكيل والرموز الخاصة ثم unicode slugify
+        slug = slugify(re.sub(r'[^\w\s-]', '', name or ''), allow_unicode=True)
+    return slug[:SLUG_MAX_LENGTH - SUFFIX_RESERVE].strip('-') or 'representative'
+
+
+def _lock_id(base):
+    return int.from_bytes(hashlib.sha1(base.encode('utf-8')).digest()[:8], 'big', signed=True)
+
+
+def lock_bases(bases):
+    """
+    قفل استشاري لكل رابط أساسي حتى نهاية المعاملة الحالية (PostgreSQL
+    فقط). الأقفال تؤخذ بترتيب ثابت حتى لا يتبادل كاتبان الانتظار.
+    """
+    if connection.vendor != 'postgresql' or not connection.in_atomic_block:
+        return
+    lock_ids = sorted({_lock_id(base) for base in bases})
+    if lock_ids:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT pg_advisory_xact_lock(lock_id) FROM unnest(%s::bigint[]) AS lock_id ORDER BY lock_id',
+                [lock_ids]
+            )
+
+
+def taken_slugs(bases):
+    """الروابط المستخدمة من الروابط الأساسية ولواحقها"""
+    from .models import Representative
+
+    bases = list(bases)
+    taken = set(Representative.objects.filter(slug__in=set(bases)).values_list('slug', flat=True))
+    # المتكرر داخل الدفعة يحتاج لواحق حتى لو لم يُستخدم أصله بعد
+    repeated = {base for base, count in Counter(bases).items() if count > 1}
+    colliding = (set(bases) & taken) | repeated
+    if colliding:
+        pattern = '^(%s)-[0-9]+$' % '|'.join(re.escape(base) for base in colliding)
+        taken.update(Representative.objects.filter(slug__regex=pattern).values_list('slug', flat=True))
+    return taken
+
+
+def allocate_slugs(bases):
+    """
+    رابط فريد لكل رابط أساسي (بنفس الترتيب، مع تمييز المتكرر داخل
+    الدفعة نفسها). يُستدعى داخل المعاملة التي تحفظ الصفوف.
+    """
+    bases = list(bases)
+    lock_bases(bases)
+    taken = taken_slugs(bases)
+    slugs = []
+    for base in bases:
+        slug, suffix = base, 2
+        while slug in taken:
+            slug, suffix = f'{base}-{suffix}', suffix + 1
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def save_with_unique_slug(instance, save):
+    """
+    حفظ نائب جديد برابط محجوز. كل محاولة في savepoint مستقل؛ إذا سبقه
+    كاتب آخر إلى نفس الرابط يُحجز رابط جديد ويُعاد الحفظ.
+    """
+    base = base_slug(instance.name, instance.name_en)
+    for attempt in range(SAVE_ATTEMPTS):
+        try:
+            with transaction.atomic():
+                instance.slug = allocate_slugs([base])[0]
+                save()
+            return
+        except IntegrityError:
+            conflict = instance.slug in taken_slugs([instance.slug])
+            if attempt == SAVE_ATTEMPTS - 1 or not conflict:
+                instance.slug = ''
+                raise
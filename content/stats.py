@@ -0,0 +1,260 @@
+"""
+محرك الإحصائيات لخدمة المحتوى - منصة نائبك.كوم
+
+يحسب كل أرقام صفحة الإحصائيات بعدد ثابت من الاستعلامات المستقلة (تُنفذ
+بالتوازي، fanout.run_parallel) بدلاً من استعلام لكل رقم واستعلام لكل
+محافظة، ويحافظ على لقطة مجمعة
+(PlatformStatsSnapshot) تحدث تدريجياً مع كل تعديل على النواب حتى
+تصبح قراءة الإحصائيات قراءة بالمفتاح الأساسي.
+"""
+
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.db.models import Q, F, Count, Sum
+
+from .models import (
+    Governorate, District, PoliticalParty, Representative,
+    PlatformStatsSnapshot, GovernorateStatsSnapshot
+)
+from .cache import bump_generation
+from .fanout import agather, run_parallel
+
+# حقول النائب التي تؤثر في الإحصائيات
+REPRESENTATIVE_STATS_FIELDS = (
+    'is_active', 'status', 'gender', 'is_distinguished', 'rating',
+    'solved_complaints', 'received_complaints', 'district_id',
+)
+
+# عدادات الجداول المرجعية في اللقطة
+REFERENCE_COUNTERS = {
+    Governorate: 'total_governorates',
+    District: 'total_districts',
+    PoliticalParty: 'total_parties',
+}
+
+
+def _representative_totals():
+    """إجماليات النواب النشطين في استعلام تجميع شرطي واحد"""
+    totals = Representative.objects.filter(is_active=True).aggregate(
+        total_representatives=Count('id'),
+        total_candidates=Count('id', filter=Q(status='candidate')),
+        total_elected=Count('id', filter=Q(status='elected')),
+        total_former=Count('id', filter=Q(status='former')),
+        total_distinguished=Count('id', filter=Q(is_distinguished=True)),
+        total_male=Count('id', filter=Q(gender='male')),
+        total_female=Count('id', filter=Q(gender='female')),
+        rating_sum=Sum('rating'),
+        total_solved_complaints=Sum('solved_complaints'),
+        total_received_complaints=Sum('received_complaints'),
+    )
+    totals['rating_sum'] = Decimal(totals['rating_sum'] or 0)
+    totals['total_solved_complaints'] = totals['total_solved_complaints'] or 0
+    totals['total_received_complaints'] = totals['total_received_complaints'] or 0
+    return totals
+
+
+def _governorate_counts(governorates):
+    """عدد النواب النشطين لكل محافظة في GROUP BY واحد"""
+    return list(
+        governorates.annotate(
+            representatives_count=Count(
+                'districts__representatives',
+                filter=Q(districts__representatives__is_active=True)
+            )
+        ).order_by('name').values_list('id', 'name', 'representatives_count')
+    )
+
+
+def _build_payload(totals, governorate_stats):
+    """تجميع البيانات بالشكل الذي يتوقعه StatisticsSerializer"""
+    if totals['total_representatives']:
+        average_rating = round(Decimal(totals['rating_sum']) / totals['total_representatives'], 2)
+    else:
+        average_rating = 0.0
+
+    return {
+        'total_representatives': totals['total_representatives'],
+        'total_candidates': totals['total_candidates'],
+        'total_elected': totals['total_elected'],
+        'total_former': totals['total_former'],
+        'total_distinguished': totals['total_distinguished'],
+        'total_governorates': totals['total_governorates'],
+        'total_districts': totals['total_districts'],
+        'total_parties': totals['total_parties'],
+        'average_rating': average_rating,
+        'total_solved_complaints': totals['total_solved_complaints'],
+        'total_received_complaints': totals['total_received_complaints'],
+        'governorate_stats': governorate_stats,
+        'gender_stats': {
+            'male': totals['total_male'],
+            'female': totals['total_female'],
+        },
+        'status_stats': {
+            'candidate': totals['total_candidates'],
+            'elected': totals['total_elected'],
+            'former': totals['total_former'],
+        },
+    }
+
+
+def compute_statistics():
+    """حساب إحصائيات المنصة مباشرة من الجداول"""
+    totals, governorates, districts, parties = run_parallel(
+        _representative_totals,
+        lambda: _governorate_counts(Governorate.objects.filter(is_active=True)),
+        District.objects.filter(is_active=True).count,
+        PoliticalParty.objects.filter(is_active=True).count,
+    )
+    totals['total_governorates'] = len(governorates)
+    totals['total_districts'] = districts
+    totals['total_parties'] = parties
+
+    governorate_stats = [
+        {'name': name, 'count': count}
+        for _, name, count in governorates
+        if count > 0
+    ]
+    return _build_payload(totals, governorate_stats)
+
+
+# ========== اللقطة المجمعة ==========
+
+def rebuild_snapshot():
+    """إعادة بناء لقطة الإحصائيات بالكامل من الجداول"""
+    totals, active_governorates, districts, parties, governorates = run_parallel(
+        _representative_totals,
+        Governorate.objects.filter(is_active=True).count,
+        District.objects.filter(is_active=True).count,
+        PoliticalParty.objects.filter(is_active=True).count,
+        lambda: _governorate_counts(Governorate.objects.all()),
+    )
+    totals['total_governorates'] = active_governorates
+    totals['total_districts'] = districts
+    totals['total_parties'] = parties
+
+    with transaction.atomic():
+        snapshot, _ = PlatformStatsSnapshot.objects.update_or_create(
+            pk=PlatformStatsSnapshot.SINGLETON_ID,
+            defaults=totals
+        )
+        GovernorateStatsSnapshot.objects.all().delete()
+        GovernorateStatsSnapshot.objects.bulk_create([
+            GovernorateStatsSnapshot(governorate_id=governorate_id, representatives_count=count)
+            for governorate_id, _, count in governorates
+            if count > 0
+        ])
+    bump_generation(PlatformStatsSnapshot)
+    return snapshot
+
+
+def _snapshot():
+    return PlatformStatsSnapshot.objects.filter(pk=PlatformStatsSnapshot.SINGLETON_ID).first()
+
+
+def _governorate_stats():
+    return list(GovernorateStatsSnapshot.objects.filter(
+        governorate__is_active=True,
+        representatives_count__gt=0
+    ).order_by('governorate__name').values_list('governorate__name', 'representatives_count'))
+
+
+def _snapshot_payload(snapshot, governorate_stats):
+    totals = {
+        field.attname: getattr(snapshot, field.attname)
+        for field in PlatformStatsSnapshot._meta.concrete_fields
+    }
+    return _build_payload(
+        totals,
+        [{'name': name, 'count': count} for name, count in governorate_stats]
+    )
+
+
+def get_statistics():
+    """
+    قراءة الإحصائيات من اللقطة المجمعة واللقطات لكل محافظة بالتوازي
+    (تُبنى عند أول طلب إن لم توجد)
+    """
+    snapshot, governorate_stats = run_parallel(_snapshot, _governorate_stats)
+    if snapshot is None:
+        snapshot = rebuild_snapshot()
+        governorate_stats = _governorate_stats()
+    return _snapshot_payload(snapshot, governorate_stats)
+
+
+async def aget_statistics():
+    """نسخة get_statistics غير المتزامنة (الفروع بـ asyncio.gather)"""
+    snapshot, governorate_stats = await agather(_snapshot, _governorate_stats)
+    if snapshot is None:
+        snapshot = await sync_to_async(rebuild_snapshot)()
+        governorate_stats = await sync_to_async(_governorate_stats)()
+    return _snapshot_payload(snapshot, governorate_stats)
+
+
+def representative_contribution(values):
+    """مساهمة صف نائب واحد في عدادات اللقطة"""
+    if not values or not values['is_active']:
+        return {}
+    return {
+        'total_representatives': 1,
+        'total_candidates': int(values['status'] == 'candidate'),
+        'total_elected': int(values['status'] == 'elected'),
+        'total_former': int(values['status'] == 'former'),
+        'total_distinguished': int(bool(values['is_distinguished'])),
+        'total_male': int(values['gender'] == 'male'),
+        'total_female': int(values['gender'] == 'female'),
+        'rating_sum': Decimal(str(values['rating'] or 0)),
+        'total_solved_complaints': values['solved_complaints'] or 0,
+        'total_received_complaints': values['received_complaints'] or 0,
+    }
+
+
+def apply_snapshot_delta(old_values, old_governorate_id, new_values, new_governorate_id):
+    """تطبيق الفرق بين حالتين لنائب على اللقطة بتحديثات F() ذرية"""
+    old = representative_contribution(old_values)
+    new = representative_contribution(new_values)
+    delta = {
+        field: new.get(field, 0) - old.get(field, 0)
+        for field in set(old) | set(new)
+    }
+    updates = {field: F(field) + value for field, value in delta.items() if value}
+
+    governorate_deltas = {}
+    if old:
+        governorate_deltas[old_governorate_id] = governorate_deltas.get(old_governorate_id, 0) - 1
+    if new:
+        governorate_deltas[new_governorate_id] = governorate_deltas.get(new_governorate_id, 0) + 1
+
+    with transaction.atomic():
+        if updates:
+            updated = PlatformStatsSnapshot.objects.filter(
+                pk=PlatformStatsSnapshot.SINGLETON_ID
+            ).update(**updates)
+            if not updated:
+                # لا توجد لقطة بعد: البناء الكامل يشمل هذا التعديل
+                rebuild_snapshot()
+                return
+        for governorate_id, count in governorate_deltas.items():
+            if governorate_id is not None and count:
+                move_governorate_count(governorate_id, count)
+
+
+def move_governorate_count(governorate_id, count):
+    """إضافة (أو طرح) عدد من نواب محافظة في لقطتها"""
+    updated = GovernorateStatsSnapshot.objects.filter(governorate_id=governorate_id).update(
+        representatives_count=F('representatives_count') + count
+    )
+    if not updated and count > 0:
+        GovernorateStatsSnapshot.objects.create(
+            governorate_id=governorate_id,
+            representatives_count=count
+        )
+
+
+def refresh_reference_counter(model):
+    """إعادة عد جدول مرجعي (محافظات/دوائر/أحزاب) في اللقطة"""
+    field = REFERENCE_COUNTERS[model]
+    PlatformStatsSnapshot.objects.filter(pk=PlatformStatsSnapshot.SINGLETON_ID).update(
+        **{field: model.objects.filter(is_active=True).count()}
+    )
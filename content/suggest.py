@@ -0,0 +1,159 @@
+"""
+الاقتراحات أثناء الكتابة لخدمة المحتوى - منصة نائبك.كوم
+
+فهرس بادئات في ذاكرة العملية: مصفوفة مرتبة من (مفتاح موحد، رقم عنصر)
+يُبحث فيها بـ bisect. لكل اسم مفتاح يبدأ من كل كلمة فيه، فتطابق
+"ابراهيم" الاسم "أحمد إبراهيم". يُعاد بناء الفهرس عند تغير أجيال
+النماذج التي يعتمد عليها، ويُحد عدد عناصره بـ SUGGEST_MAX_ENTRIES.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+
+from .cache import LOCAL_CACHE_RECHECK, get_generations
+from .models import Governorate, District, PoliticalParty, Representative
+from .search import normalize_arabic
+
+# النماذج التي يعتمد عليها الفهرس
+SUGGEST_MODELS = (Representative, District, Governorate, PoliticalParty)
+
+# الحد الأقصى لعدد العناصر المفهرسة (الأعلى تقييماً من النواب أولاً)
+SUGGEST_MAX_ENTRIES = getattr(settings, 'CONTENT_SUGGEST_MAX_ENTRIES', 50000)
+
+DEFAULT_SUGGEST_LIMIT = 8
+MAX_SUGGEST_LIMIT = 20
+
+# أقصى عدد مطابقات يُفحص قبل الترتيب (للبادئات القصيرة جداً)
+MAX_SCANNED_MATCHES = 200
+
+# ترتيب الأنواع في النتائج
+TYPE_PRIORITY = {'representative': 0, 'governorate': 1, 'district': 2, 'party': 3}
+
+
+def _name_keys(*names):
+    """مفاتيح الاسم: النص الموحد بدءاً من كل كلمة فيه"""
+    keys = set()
+    for name in names:
+        words = normalize_arabic(name).split()
+        for start in range(len(words)):
+            keys.add((' '.join(words[start:]), start))
+    return keys
+
+
+class SuggestionIndex:
+    """مصفوفة مفاتيح مرتبة مع قائمة العناصر المقابلة"""
+
+    def __init__(self, entries):
+        self.entries = entries
+        keys = []
+        for entry_id, entry in enumerate(entries):
+            for key, position in _name_keys(entry['name'], entry.pop('name_en', '')):
+                keys.append((key, position, entry_id))
+        keys.sort()
+        self._keys = [key for key, _, _ in keys]
+        self._refs = [(position, entry_id) for _, position, entry_id in keys]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search(self, prefix, limit=DEFAULT_SUGGEST_LIMIT):
+        prefix = normalize_arabic(prefix)
+        if not prefix:
+            return []
+
+        best = {}
+        index = bisect_left(self._keys, prefix)
+        while (
+            index < len(self._keys)
+            and self._keys[index].startswith(prefix)
+            and len(best) < MAX_SCANNED_MATCHES
+        ):
+            position, entry_id = self._refs[index]
+            # مطابقة بداية الاسم أفضل من مطابقة كلمة داخله
+            best[entry_id] = min(position, best.get(entry_id, position))
+            index += 1
+
+        ranked = sorted(
+            best,
+            key=lambda entry_id: (
+                min(best[entry_id], 1),
+                TYPE_PRIORITY[self.entries[entry_id]['type']],
+                entry_id,
+            )
+        )
+        return [self.entries[entry_id] for entry_id in ranked[:limit]]
+
+
+def load_entries(max_entries=SUGGEST_MAX_ENTRIES):
+    """عناصر الفهرس من قاعدة البيانات بالشكل الذي تعيده الواجهة"""
+    entries = []
+    representatives = Representative.objects.filter(
+        is_active=True, admin_approved=True
+    ).order_by('-is_distinguished', '-rating', 'name').values(
+        'id', 'name', 'name_en', 'slug', 'district__name', 'district__governorate__name'
+    )
+    for row in representatives[:max_entries]:
+        entries.append({
+            'type': 'representative',
+            'id': str(row['id']),
+            'name': row['name'],
+            'name_en': row['name_en'],
+            'slug': row['slug'],
+            'district': row['district__name'],
+            'governorate': row['district__governorate__name'],
+        })
+
+    for row in Governorate.objects.filter(is_active=True).values('id', 'name', 'name_en'):
+        entries.append({
+            'type': 'governorate', 'id': str(row['id']), 'name': row['name'],
+            'name_en': row['name_en'], 'slug': None, 'district': None, 'governorate': row['name'],
+        })
+
+    districts = District.objects.filter(is_active=True).values('id', 'name', 'governorate__name')
+    for row in districts:
+        entries.append({
+            'type': 'district', 'id': str(row['id']), 'name': row['name'],
+            'slug': None, 'district': row['name'], 'governorate': row['governorate__name'],
+        })
+
+    for row in PoliticalParty.objects.filter(is_active=True).values('id', 'name', 'name_en'):
+        entries.append({
+            'type': 'party', 'id': str(row['id']), 'name': row['name'],
+            'name_en': row['name_en'], 'slug': None, 'district': None, 'governorate': None,
+        })
+    return entries[:max_entries]
+
+
+_state = {'index': None, 'generations': None, 'checked_at': 0.0}
+_state_lock = threading.Lock()
+
+
+def get_suggestion_index():
+    """
+    الفهرس الحالي، مع إعادة بنائه إذا تغيرت أجيال النماذج. الأجيال تُراجع
+    كل LOCAL_CACHE_RECHECK ثانية على الأكثر حتى لا يصل كل حرف إلى Redis.
+    """
+    now = time.monotonic()
+    index = _state['index']
+    if index is not None and now - _state['checked_at'] < LOCAL_CACHE_RECHECK:
+        return index
+
+    generations = get_generations(SUGGEST_MODELS)
+    with _state_lock:
+        if _state['index'] is None or _state['generations'] != generations:
+            _state['index'] = SuggestionIndex(load_entries())
+            _state['generations'] = generations
+        _state['checked_at'] = now
+        return _state['index']
+
+
+def reset_suggestion_index():
+    with _state_lock:
+        _state.update(index=None, generations=None, checked_at=0.0)
+
+
+def suggest(prefix, limit=DEFAULT_SUGGEST_LIMIT):
+    return get_suggestion_index().search(prefix, limit)
@@ -0,0 +1,56 @@
+"""
+مهام Celery لخدمة المحتوى - منصة نائبك.كوم
+
+أعمال الصور والاستيراد تُنفذ في الـ worker بدلاً من طلب gunicorn. المهام
+تُضاف إلى الطابور بعد تأكيد المعاملة (transaction.on_commit)، وتُنفذ
+مباشرة في الاختبارات (CELERY_TASK_ALWAYS_EAGER). المهام الدورية (تسخين
+الـ cache ولقطة الإحصائيات) يجدولها Celery beat من CELERY_BEAT_SCHEDULE.
+"""
+
+from celery import shared_task
+from celery.signals import worker_ready
+from django.urls import reverse
+
+from . import images, importer, stats, warming
+
+
+@shared_task(ignore_result=True, acks_late=True)
+def process_image(model_label, pk, field_name):
+    """توحيد الصورة المرفوعة ثم توليد نسخها المصغرة إن كان الحقل منها"""
+    images.normalize_image(model_label, pk, field_name)
+    if field_name in images.IMAGE_VARIANT_FIELDS.get(model_label, ()):
+        images.generate_image_variants(model_label, pk, field_name)
+
+
+@shared_task(ignore_result=True, acks_late=True)
+def import_representatives(job_id, path, file_format, options):
+    """مهمة استيراد ملف مرفوع (حالتها وتقريرها في الـ cache)"""
+    importer.run_import_job(job_id, path, file_format, options)
+
+
+@shared_task(ignore_result=True, expires=60)
+def warm_caches():
+    """تسخين الـ cache لأكثر المسارات طلباً"""
+    return warming.warm_caches()
+
+
+@shared_task(ignore_result=True)
+def decay_traffic():
+    """تنصيف عدادات زيارات النواب"""
+    warming.decay_traffic()
+
+
+@shared_task(ignore_result=True, expires=300)
+def rebuild_stats_snapshot():
+    """
+    إعادة بناء لقطة الإحصائيات من الجداول خارج الطلبات، لتصحيح أي انحراف
+    في التحديث التدريجي، ثم تسخين الإحصائيات بالأرقام الجديدة
+    """
+    stats.rebuild_snapshot()
+    warming.warm_path(reverse('statistics'))
+
+
+@worker_ready.connect
+def warm_on_startup(sender, **kwargs):
+    """التسخين فور تشغيل الـ worker (بعد النشر) دون انتظار أول دورة"""
+    warm_caches.delay()
@@ -2,6 +2,7 @@
 URLs لخدمة المحتوى - منصة نائبك.كوم
 """
 
+from django.conf import settings
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from . import views
@@ -16,7 +17,14 @@ urlpatterns = [
     # ========== APIs الأساسية للنواب ==========
     path('api/representatives/', views.RepresentativeListView.as_view(), name='representative-list'),
     path('api/representatives/create/', views.RepresentativeCreateView.as_view(), name='representative-create'),
-    path('api/representatives/<slug:slug>/', views.RepresentativeDetailView.as_view(), name='representative-detail'),
+    path('api/representatives/export/', views.RepresentativeExportView.as_view(), name='representative-export'),
+    path('api/representatives/import/', views.representative_import_view, name='representative-import'),
+    path(
+        'api/representatives/import/<uuid:job_id>/',
+        views.representative_import_status_view,
+        name='representative-import-status'
+    ),
+    path('api/representatives/<str:slug>/', views.RepresentativeDetailView.as_view(), name='representative-detail'),
     
     # ========== APIs الصفحات الثابتة ==========
     path('api/pages/', views.StaticPageListView.as_view(), name='static-page-list'),
@@ -31,8 +39,8 @@ urlpatterns = [
     
     # ========== APIs إدارة الألوان ==========
     path('api/colors/', views.ColorSettingsListView.as_view(), name='color-list'),
-    path('api/colors/<str:color_type>/', views.ColorSettingsDetailView.as_view(), name='color-detail'),
     path('api/colors/scheme/', views.get_color_scheme, name='color-scheme'),
+    path('api/colors/<str:color_type>/', views.ColorSettingsDetailView.as_view(), name='color-detail'),
     
     # ========== APIs إعدادات الموقع ==========
     path('api/settings/', views.SiteSettingsView.as_view(), name='site-settings'),
@@ -48,7 +56,13 @@ urlpatterns = [
     # ========== APIs الإحصائيات والبحث ==========
     path('api/statistics/', views.statistics_view, name='statistics'),
     path('api/filter-options/', views.filter_options_view, name='filter-options'),
+    path(
+        'api/filter-options/districts/<uuid:governorate_id>/',
+        views.filter_options_districts_view,
+        name='filter-options-districts'
+    ),
     path('api/search/', views.search_view, name='search'),
+    path('api/search/suggest/', views.suggest_view, name='search-suggest'),
     
     # ========== API فحص الصحة ==========
     path('health/', views.health_check, name='health-check'),
@@ -60,8 +74,14 @@ urlpatterns = [
 # إضافة مسارات الصفحات الشخصية بالروابط العربية في البداية
 arabic_urls = [
     # مسار الصفحة الشخصية بالرابط العربي (يجب أن يكون في النهاية)
-    path('<slug:slug>/', views.RepresentativeDetailView.as_view(), name='representative-page-arabic'),
+    # str وليس slug: محول slug لا يقبل الحروف العربية
+    path('<str:slug>/', views.RepresentativeDetailView.as_view(), name='representative-page-arabic'),
 ]
 
 # دمج URLs مع وضع الروابط العربية في النهاية
 urlpatterns += arabic_urls
+
+# تحت ASGI تُخدم مسارات القراءة الساخنة بنسخها غير المتزامنة
+if getattr(settings, 'CONTENT_ASYNC_VIEWS', False):
+    from .async_views import use_async_routes
+    urlpatterns = use_async_routes(urlpatterns)
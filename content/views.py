@@ -3,56 +3,129 @@ Views لخدمة المحتوى - منصة نائبك.كوم
 """
 
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Avg, Count
+from django.http import HttpResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.cache import patch_vary_headers
 from rest_framework import generics, status
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 
 from .models import (
     Governorate, District, PoliticalParty, Representative,
-    StaticPage, Banner, ColorSettings, SiteSettings, FAQ, Event
+    RepresentativeImage, Achievement, News,
+    StaticPage, Banner, ColorSettings, SiteSettings, FAQ, Event,
+    PlatformStatsSnapshot
 )
 from .serializers import (
-    GovernorateSerializer, DistrictSerializer, PoliticalPartySerializer,
     RepresentativeListSerializer, RepresentativeDetailSerializer,
     RepresentativeCreateSerializer, StatisticsSerializer,
-    FilterOptionsSerializer, SearchResultSerializer,
     StaticPageSerializer, BannerSerializer, ColorSettingsSerializer,
     SiteSettingsSerializer, FAQSerializer, EventSerializer
 )
 from .filters import RepresentativeFilter
+from .querysets import prefetch_detail, representative_detail_queryset, representative_list_queryset
+from .pagination import (
+    KeysetPagination, ListingPagination, count_queryset, uses_cursor_pagination
+)
+from .stats import get_statistics
+from .search import search_representatives, fuzzy_search_representatives
+from .suggest import suggest, DEFAULT_SUGGEST_LIMIT, MAX_SUGGEST_LIMIT
+from .export import EXPORT_FORMATS, iter_export, iter_gzip
+from .importer import (
+    DEFAULT_BATCH_SIZE as DEFAULT_IMPORT_BATCH_SIZE, ImportFormatError,
+    detect_format, get_job as get_import_job, start_import_job
+)
+from .filter_options import get_bundle as get_filter_options_bundle
+from . import warming
+from .middleware import choose_encoding
+from .cache import CachedResponseMixin, cache_response, cache_stats, get_singleton, not_modified
 
 
-class StandardResultsSetPagination(PageNumberPagination):
-    """إعدادات الترقيم القياسية"""
-    page_size = 20
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+# النماذج التي تعتمد عليها استجابات قائمة النواب
+REPRESENTATIVE_LIST_MODELS = (Representative, District, Governorate, PoliticalParty)
 
 
 # ========== APIs الأساسية للنواب ==========
 
-class RepresentativeListView(generics.ListAPIView):
+class RepresentativeListView(CachedResponseMixin, generics.ListAPIView):
     """قائمة النواب مع الفلاتر والبحث"""
-    queryset = Representative.objects.filter(is_active=True, admin_approved=True)
+    cache_models = REPRESENTATIVE_LIST_MODELS
+    queryset = representative_list_queryset()
     serializer_class = RepresentativeListSerializer
-    pagination_class = StandardResultsSetPagination
+    pagination_class = ListingPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = RepresentativeFilter
     search_fields = ['name', 'profession', 'bio', 'electoral_program']
     ordering_fields = ['name', 'rating', 'created_at', 'solved_complaints']
     ordering = ['-is_distinguished', '-rating', 'name']
 
+    def list(self, request, *args, **kwargs):
+        # المسار السريع: صفوف values() بدلاً من كائنات النموذج
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(RepresentativeListSerializer.fast_values(queryset))
+        return self.get_paginated_response(
+            RepresentativeListSerializer.fast_serialize(page, self.get_serializer_context())
+        )
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        # البحث التقريبي يرتب بالتشابه ما لم يطلب العميل ترتيباً آخر
+        if 'similarity' in queryset.query.annotations and not self.request.query_params.get('ordering'):
+            queryset = queryset.order_by('-similarity', *self.ordering)
+        return queryset
+
+
+class RepresentativeExportView(RepresentativeListView):
+    """
+    تصدير نتائج الفلاتر كاملة كملف متدفق دون ترقيم
+    (?file_format=csv|jsonl|ndjson، و?gzip=1 لملف مضغوط)
+    """
+    pagination_class = None
+
+    def get(self, request, *args, **kwargs):
+        file_format = request.query_params.get('file_format', 'csv').lower()
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {'error': f'صيغة غير مدعومة: {file_format} (المتاح: {", ".join(EXPORT_FORMATS)})'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        content_type, extension = EXPORT_FORMATS[file_format]
+        filename = f'representatives.{extension}'
+
+        chunks = iter_export(
+            self.filter_queryset(self.get_queryset()), file_format, self.get_serializer_context()
+        )
+        if request.query_params.get('gzip', '').lower() in ('1', 'true'):
+            chunks, content_type, filename = iter_gzip(chunks), 'application/gzip', filename + '.gz'
+
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
 
-class RepresentativeDetailView(generics.RetrieveAPIView):
+
+class RepresentativeDetailView(CachedResponseMixin, generics.RetrieveAPIView):
     """تفاصيل النائب بالرابط العربي"""
-    queryset = Representative.objects.filter(is_active=True, admin_approved=True)
+    cache_models = REPRESENTATIVE_LIST_MODELS + (RepresentativeImage, Achievement, News, Event)
+    queryset = representative_detail_queryset()
     serializer_class = RepresentativeDetailSerializer
     lookup_field = 'slug'
 
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        # الأكثر زيارة تُسخن صفحاتهم دورياً (warming.warm_caches)؛ الروابط
+        # غير الموجودة لا تُحسب
+        if response.status_code in (200, 304) and not getattr(request, 'cache_warming', False):
+            warming.traffic.hit(kwargs['slug'])
+        return response
+
+    def get_object(self):
+        # صف النائب أولاً ثم علاقاته التابعة بالتوازي
+        return prefetch_detail(super().get_object())
+
 
 class RepresentativeCreateView(generics.CreateAPIView):
     """إنشاء نائب جديد"""
@@ -60,16 +133,52 @@ class RepresentativeCreateView(generics.CreateAPIView):
     serializer_class = RepresentativeCreateSerializer
 
 
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def representative_import_view(request):
+    """استيراد النواب من ملف CSV أو JSONL في الخلفية (file، file_format، update)"""
+    uploaded_file = request.FILES.get('file')
+    if uploaded_file is None:
+        return Response({'error': 'يجب إرفاق ملف الاستيراد'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        file_format = detect_format(uploaded_file.name, request.data.get('file_format'))
+        batch_size = int(request.data.get('batch_size', DEFAULT_IMPORT_BATCH_SIZE))
+    except (ImportFormatError, ValueError) as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    job_id = start_import_job(
+        uploaded_file, file_format,
+        batch_size=max(1, batch_size),
+        update_existing=str(request.data.get('update', '')).lower() in ('1', 'true'),
+    )
+    return Response({
+        'job_id': str(job_id),
+        'status_url': reverse('representative-import-status', args=[job_id]),
+    }, status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def representative_import_status_view(request, job_id):
+    """حالة مهمة الاستيراد وتقريرها (فيه قيم صفوف الملف)"""
+    job = get_import_job(job_id)
+    if job is None:
+        return Response({'error': 'مهمة الاستيراد غير موجودة'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(job)
+
+
 # ========== APIs الصفحات الثابتة ==========
 
-class StaticPageListView(generics.ListAPIView):
+class StaticPageListView(CachedResponseMixin, generics.ListAPIView):
     """قائمة الصفحات الثابتة"""
+    cache_models = (StaticPage,)
     queryset = StaticPage.objects.filter(is_active=True)
     serializer_class = StaticPageSerializer
 
 
-class StaticPageDetailView(generics.RetrieveAPIView):
+class StaticPageDetailView(CachedResponseMixin, generics.RetrieveAPIView):
     """تفاصيل صفحة ثابتة"""
+    cache_models = (StaticPage,)
     queryset = StaticPage.objects.filter(is_active=True)
     serializer_class = StaticPageSerializer
     lookup_field = 'page_type'
@@ -84,8 +193,9 @@ class StaticPageCreateUpdateView(generics.RetrieveUpdateAPIView):
 
 # ========== APIs إدارة البنرات ==========
 
-class BannerListView(generics.ListAPIView):
+class BannerListView(CachedResponseMixin, generics.ListAPIView):
     """قائمة البنرات"""
+    cache_models = (Banner, Representative)
     queryset = Banner.objects.filter(is_active=True)
     serializer_class = BannerSerializer
     filter_backends = [DjangoFilterBackend]
@@ -104,14 +214,20 @@ class BannerCreateView(generics.CreateAPIView):
     serializer_class = BannerSerializer
 
 
+def _load_default_banner():
+    banner = Banner.objects.filter(
+        banner_type='main', is_default=True, is_active=True
+    ).select_related('representative').first()
+    return dict(BannerSerializer(banner).data) if banner else None
+
+
 @api_view(['GET'])
 def get_default_banner(request):
     """الحصول على البنر الافتراضي"""
     try:
-        banner = Banner.objects.filter(banner_type='main', is_default=True, is_active=True).first()
-        if banner:
-            serializer = BannerSerializer(banner)
-            return Response(serializer.data)
+        data = get_singleton('default_banner', (Banner, Representative), _load_default_banner)
+        if data:
+            return Response(data)
         else:
             return Response({'message': 'لا يوجد بنر افتراضي'}, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
@@ -120,8 +236,9 @@ def get_default_banner(request):
 
 # ========== APIs إدارة الألوان ==========
 
-class ColorSettingsListView(generics.ListAPIView):
+class ColorSettingsListView(CachedResponseMixin, generics.ListAPIView):
     """قائمة إعدادات الألوان"""
+    cache_models = (ColorSettings,)
     queryset = ColorSettings.objects.filter(is_active=True)
     serializer_class = ColorSettingsSerializer
 
@@ -133,49 +250,73 @@ class ColorSettingsDetailView(generics.RetrieveUpdateAPIView):
     lookup_field = 'color_type'
 
 
+def active_colors():
+    return ColorSettings.objects.filter(is_active=True).values_list('color_type', 'color_value')
+
+
+def build_color_scheme(colors):
+    """نظام الألوان من أزواج (color_type, color_value)"""
+    color_scheme = {}
+    for color_type, color_value in colors:
+        color_scheme[color_type] = color_value
+    
+    return {
+        'colors': color_scheme,
+        'css_variables': {
+            f'--{color_type.replace("_", "-")}': color_value
+            for color_type, color_value in color_scheme.items()
+        }
+    }
+
+
+def _load_color_scheme():
+    return build_color_scheme(active_colors())
+
+
 @api_view(['GET'])
 def get_color_scheme(request):
     """الحصول على نظام الألوان الكامل"""
     try:
-        colors = ColorSettings.objects.filter(is_active=True)
-        color_scheme = {}
-        for color in colors:
-            color_scheme[color.color_type] = color.color_value
-        
-        return Response({
-            'colors': color_scheme,
-            'css_variables': {
-                f'--{color.color_type.replace("_", "-")}': color.color_value 
-                for color in colors
-            }
-        })
+        return Response(get_singleton('color_scheme', (ColorSettings,), _load_color_scheme))
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 # ========== APIs إعدادات الموقع ==========
 
+SITE_SETTINGS_DEFAULTS = {
+    'site_name': 'نائبك.كوم',
+    'visitor_counter_min': 1000,
+    'visitor_counter_max': 1500
+}
+
+
 class SiteSettingsView(generics.RetrieveUpdateAPIView):
     """إعدادات الموقع"""
     serializer_class = SiteSettingsSerializer
     
-    def get_object(self):
-        settings, created = SiteSettings.objects.get_or_create(
-            defaults={
-                'site_name': 'نائبك.كوم',
-                'visitor_counter_min': 1000,
-                'visitor_counter_max': 1500
-            }
+    def retrieve(self, request, *args, **kwargs):
+        # روابط الصور مطلقة، لذا يدخل أصل الطلب في اسم المورد المخزن
+        data = get_singleton(
+            f'site_settings:{request.build_absolute_uri("/")}',
+            (SiteSettings,),
+            lambda: dict(self.get_serializer(self.get_object()).data)
         )
+        return Response(data)
+
+    def get_object(self):
+        settings, created = SiteSettings.objects.get_or_create(defaults=SITE_SETTINGS_DEFAULTS)
         return settings
 
 
 # ========== APIs الأسئلة الشائعة ==========
 
-class FAQListView(generics.ListCreateAPIView):
+class FAQListView(CachedResponseMixin, generics.ListCreateAPIView):
     """قائمة الأسئلة الشائعة"""
+    cache_models = (FAQ,)
     queryset = FAQ.objects.filter(is_active=True)
     serializer_class = FAQSerializer
+    pagination_class = ListingPagination
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['category']
 
@@ -188,10 +329,12 @@ class FAQDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 # ========== APIs المناسبات والمؤتمرات ==========
 
-class EventListView(generics.ListCreateAPIView):
+class EventListView(CachedResponseMixin, generics.ListCreateAPIView):
     """قائمة المناسبات"""
+    cache_models = (Event,)
     queryset = Event.objects.filter(is_active=True, admin_approved=True)
     serializer_class = EventSerializer
+    pagination_class = ListingPagination
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ['representative', 'event_type']
     ordering = ['-event_date']
@@ -206,172 +349,153 @@ class EventDetailView(generics.RetrieveUpdateDestroyAPIView):
 # ========== APIs الإحصائيات ==========
 
 @api_view(['GET'])
+@cache_response(*REPRESENTATIVE_LIST_MODELS, PlatformStatsSnapshot)
 def statistics_view(request):
     """إحصائيات شاملة للمنصة"""
     try:
-        # الإحصائيات الأساسية
-        total_representatives = Representative.objects.filter(is_active=True).count()
-        total_candidates = Representative.objects.filter(status='candidate', is_active=True).count()
-        total_elected = Representative.objects.filter(status='elected', is_active=True).count()
-        total_former = Representative.objects.filter(status='former', is_active=True).count()
-        total_distinguished = Representative.objects.filter(is_distinguished=True, is_active=True).count()
-        
-        total_governorates = Governorate.objects.filter(is_active=True).count()
-        total_districts = District.objects.filter(is_active=True).count()
-        total_parties = PoliticalParty.objects.filter(is_active=True).count()
-        
-        # متوسط التقييم
-        avg_rating = Representative.objects.filter(is_active=True).aggregate(
-            avg_rating=Avg('rating')
-        )['avg_rating'] or 0.0
-        
-        # إحصائيات الشكاوى
-        total_solved = Representative.objects.filter(is_active=True).aggregate(
-            total=Count('solved_complaints')
-        )['total'] or 0
-        
-        total_received = Representative.objects.filter(is_active=True).aggregate(
-            total=Count('received_complaints')
-        )['total'] or 0
-        
-        # إحصائيات حسب المحافظة
-        governorate_stats = []
-        for gov in Governorate.objects.filter(is_active=True):
-            count = Representative.objects.filter(
-                district__governorate=gov, 
-                is_active=True
-            ).count()
-            if count > 0:
-                governorate_stats.append({
-                    'name': gov.name,
-                    'count': count
-                })
-        
-        # إحصائيات حسب النوع
-        gender_stats = {
-            'male': Representative.objects.filter(gender='male', is_active=True).count(),
-            'female': Representative.objects.filter(gender='female', is_active=True).count()
-        }
-        
-        # إحصائيات حسب الحالة
-        status_stats = {
-            'candidate': total_candidates,
-            'elected': total_elected,
-            'former': total_former
-        }
-        
-        data = {
-            'total_representatives': total_representatives,
-            'total_candidates': total_candidates,
-            'total_elected': total_elected,
-            'total_former': total_former,
-            'total_distinguished': total_distinguished,
-            'total_governorates': total_governorates,
-            'total_districts': total_districts,
-            'total_parties': total_parties,
-            'average_rating': round(avg_rating, 2),
-            'total_solved_complaints': total_solved,
-            'total_received_complaints': total_received,
-            'governorate_stats': governorate_stats,
-            'gender_stats': gender_stats,
-            'status_stats': status_stats
-        }
-        
-        serializer = StatisticsSerializer(data)
+        serializer = StatisticsSerializer(get_statistics())
         return Response(serializer.data)
         
+    except NotFound as e:
+        return Response({'error': str(e.detail)}, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
 # ========== APIs خيارات الفلاتر ==========
 
+def encoded_response(request, variants):
+    """
+    استجابة JSON محولة ومضغوطة مسبقاً (filter_options.encoded) بالترميز
+    الذي يقبله العميل مع ETag القوي لذلك الترميز، أو 304 إن لم تتغير.
+    Content-Encoding المضبوط يجعل CompressionMiddleware يتركها كما هي.
+    """
+    encoding = choose_encoding(request)
+    if encoding not in variants:
+        encoding = None
+    content, etag = variants[encoding]
+    response = not_modified(request, {'ETag': etag})
+    if response is None:
+        response = HttpResponse(content, content_type='application/json')
+        response['ETag'] = etag
+        if encoding is not None:
+            response['Content-Encoding'] = encoding
+    if len(variants) > 1:
+        patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
 @api_view(['GET'])
 def filter_options_view(request):
-    """خيارات الفلاتر المتاحة"""
-    try:
-        governorates = Governorate.objects.filter(is_active=True)
-        parties = PoliticalParty.objects.filter(is_active=True)
-        districts = District.objects.filter(is_active=True)
-        
-        genders = [
-            {'value': 'male', 'label': 'ذكر'},
-            {'value': 'female', 'label': 'أنثى'}
-        ]
-        
-        statuses = [
-            {'value': 'candidate', 'label': 'مرشح'},
-            {'value': 'elected', 'label': 'منتخب'},
-            {'value': 'former', 'label': 'سابق'}
-        ]
-        
-        data = {
-            'governorates': GovernorateSerializer(governorates, many=True).data,
-            'parties': PoliticalPartySerializer(parties, many=True).data,
-            'districts': DistrictSerializer(districts, many=True).data,
-            'genders': genders,
-            'statuses': statuses
-        }
-        
-        serializer = FilterOptionsSerializer(data)
-        return Response(serializer.data)
-        
-    except Exception as e:
-        return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    """خيارات الفلاتر المتاحة (?districts=lazy: الدوائر في أجزاء لكل محافظة)"""
+    bundle = get_filter_options_bundle()
+    variants = bundle['lazy'] if request.GET.get('districts') == 'lazy' else bundle['full']
+    return encoded_response(request, variants)
+
+
+@api_view(['GET'])
+def filter_options_districts_view(request, governorate_id):
+    """دوائر محافظة واحدة من حزمة خيارات الفلاتر"""
+    chunk = get_filter_options_bundle()['districts'].get(str(governorate_id))
+    if chunk is None:
+        return Response({'error': 'المحافظة غير موجودة'}, status=status.HTTP_404_NOT_FOUND)
+    return encoded_response(request, chunk)
 
 
 # ========== API البحث المتقدم ==========
 
+def search_params(request):
+    """(query, fuzzy, page, page_size) من معاملات طلب البحث"""
+    return (
+        request.GET.get('q', ''),
+        request.GET.get('fuzzy', '').lower() in ('1', 'true'),
+        int(request.GET.get('page', 1)),
+        int(request.GET.get('page_size', 20)),
+    )
+
+
+def search_queryset(query, fuzzy):
+    # البحث النصي الكامل مرتباً بالصلة، أو التقريبي بالاسم مرتباً بالتشابه
+    search = fuzzy_search_representatives if fuzzy else search_representatives
+    return search(representative_list_queryset(), query)
+
+
+def cursor_search_data(paginator, page_representatives, context):
+    data = paginator.get_paginated_data(
+        RepresentativeListSerializer.fast_serialize(page_representatives, context)
+    )
+    data['representatives'] = data.pop('results')
+    if 'count' in data:
+        data['total_count'] = data.pop('count')
+    return data
+
+
+def search_page_data(page_representatives, total_count, count_exact, page, page_size, context):
+    """بيانات صفحة البحث من صفوفها (مع الصف الإضافي إن وجدت صفحة تالية)"""
+    has_next = len(page_representatives) > page_size
+    page_representatives = page_representatives[:page_size]
+    
+    # نفس شكل SearchResultSerializer مع تحويل الصفوف بالمسار السريع
+    return {
+        'representatives': RepresentativeListSerializer.fast_serialize(page_representatives, context),
+        'total_count': total_count,
+        'count_exact': count_exact,
+        'page_count': (total_count + page_size - 1) // page_size,
+        'current_page': page,
+        'has_next': has_next,
+        'has_previous': page > 1
+    }
+
+
 @api_view(['GET'])
+@cache_response(*REPRESENTATIVE_LIST_MODELS)
 def search_view(request):
     """البحث المتقدم في النواب"""
     try:
-        query = request.GET.get('q', '')
-        page = int(request.GET.get('page', 1))
-        page_size = int(request.GET.get('page_size', 20))
+        query, fuzzy, page, page_size = search_params(request)
         
         if not query:
             return Response({'error': 'يجب إدخال كلمة البحث'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # البحث في الحقول المختلفة
-        representatives = Representative.objects.filter(
-            Q(name__icontains=query) |
-            Q(profession__icontains=query) |
-            Q(bio__icontains=query) |
-            Q(electoral_program__icontains=query) |
-            Q(district__name__icontains=query) |
-            Q(district__governorate__name__icontains=query) |
-            Q(party__name__icontains=query),
-            is_active=True,
-            admin_approved=True
-        ).distinct().order_by('-is_distinguished', '-rating', 'name')
+        representatives = search_queryset(query, fuzzy)
+        rows = RepresentativeListSerializer.fast_values(representatives)
+        context = {'request': request}
+        
+        # الترقيم بالمؤشر (?pagination=cursor)
+        if uses_cursor_pagination(request):
+            paginator = KeysetPagination()
+            page_representatives = paginator.paginate_queryset(rows, request)
+            return Response(cursor_search_data(paginator, page_representatives, context))
         
         # الترقيم
-        total_count = representatives.count()
+        total_count, count_exact = count_queryset(representatives)
         start = (page - 1) * page_size
-        end = start + page_size
-        page_representatives = representatives[start:end]
-        
-        page_count = (total_count + page_size - 1) // page_size
-        has_next = page < page_count
-        has_previous = page > 1
-        
-        data = {
-            'representatives': RepresentativeListSerializer(page_representatives, many=True).data,
-            'total_count': total_count,
-            'page_count': page_count,
-            'current_page': page,
-            'has_next': has_next,
-            'has_previous': has_previous
-        }
-        
-        serializer = SearchResultSerializer(data)
-        return Response(serializer.data)
+        # صف إضافي لمعرفة وجود صفحة تالية حتى مع العدد التقريبي
+        page_representatives = list(rows[start:start + page_size + 1])
+        return Response(search_page_data(
+            page_representatives, total_count, count_exact, page, page_size, context
+        ))
         
     except Exception as e:
         return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(['GET'])
+def suggest_view(request):
+    """اقتراحات البحث أثناء الكتابة (نواب، محافظات، دوائر، أحزاب)"""
+    query = request.GET.get('q', '')
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_SUGGEST_LIMIT))
+    except ValueError:
+        limit = DEFAULT_SUGGEST_LIMIT
+    limit = max(1, min(limit, MAX_SUGGEST_LIMIT))
+
+    return Response({
+        'query': query,
+        'suggestions': suggest(query, limit),
+    })
+
+
 # ========== الصفحة الرئيسية ==========
 
 @api_view(['GET'])
@@ -386,6 +510,7 @@ def service_info_view(request):
             'representatives': '/api/representatives/',
             'statistics': '/api/statistics/',
             'search': '/api/search/',
+            'suggest': '/api/search/suggest/',
             'filter_options': '/api/filter-options/',
             'pages': '/api/pages/',
             'banners': '/api/banners/',
@@ -424,7 +549,8 @@ def health_check(request):
             'status': 'healthy',
             'service': 'naebak-content-service',
             'version': '1.0.0',
-            'timestamp': '2025-09-22T04:30:00Z'
+            'timestamp': '2025-09-22T04:30:00Z',
+            'cache': cache_stats()
         })
     except Exception as e:
         return Response({
@@ -0,0 +1,164 @@
+"""
+تسخين الـ cache لخدمة المحتوى - منصة نائبك.كوم
+
+مهمة دورية في Celery beat تملأ الـ cache لأكثر المسارات طلباً قبل أن
+يطلبها الزوار: خيارات الفلاتر، والإحصائيات، والصفحة الأولى من قائمة
+النواب لكل محافظة، وصفحات تفاصيل أكثر النواب زيارة. بعد النشر أو مسح
+Redis تُبنى هذه الاستجابات في الـ worker مرة واحدة بدلاً من أن تصل كل
+الطلبات الأولى إلى PostgreSQL معاً.
+
+الطلبات تُبنى بـ RequestFactory وتمر على الـ view نفسه، فتُخزن بنفس
+مفاتيح serve_cached التي تقرؤها الطلبات الحقيقية. المسار المخزن مسبقاً
+يكلف قراءة واحدة من الـ cache.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from .cache import shared_cache
+from .filter_options import get_bundle as get_filter_options_bundle
+from .models import Governorate
+
+logger = logging.getLogger(__name__)
+
+# عدد صفحات تفاصيل النواب الأكثر زيارة التي تُسخن
+WARM_TOP_REPRESENTATIVES = getattr(settings, 'CONTENT_WARM_TOP_REPRESENTATIVES', 50)
+
+# المضيف والبروتوكول للروابط المطلقة في الاستجابات المسخنة (روابط الصور)
+WARM_HOST = getattr(settings, 'CONTENT_WARM_HOST', '') or next(
+    (host for host in settings.ALLOWED_HOSTS if host not in ('*', '')), 'localhost'
+).lstrip('.')
+WARM_SECURE = getattr(settings, 'CONTENT_WARM_SECURE', not settings.DEBUG)
+
+# كل كم ثانية تُرسل عدادات الزيارات من العملية إلى الـ cache المشترك
+TRAFFIC_FLUSH_INTERVAL = getattr(settings, 'CONTENT_TRAFFIC_FLUSH_INTERVAL', 30)
+
+# أقصى عدد من النواب تُحفظ عداداتهم (الأقل زيارة يُحذف عند الدمج والتنصيف)
+TRAFFIC_TRACKED = 1000
+
+TRAFFIC_KEY = 'traffic:representatives'
+
+
+# ========== عدادات الزيارات ==========
+
+class TrafficCounter:
+    """
+    عداد زيارات صفحات النواب داخل العملية، يُدمج في الـ cache المشترك
+    كل TRAFFIC_FLUSH_INTERVAL ثانية بدلاً من كتابة في كل طلب. الدمج
+    قراءة ثم كتابة، فقد تضيع زيارات عمليتين تدمجان معاً؛ المطلوب ترتيب
+    تقريبي للأكثر زيارة لا عد دقيق.
+    """
+
+    def __init__(self, flush_interval=TRAFFIC_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._counts = Counter()
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def count(self, slug):
+        """زيارة في الذاكرة فقط؛ يعيد True إن حان الدمج في الـ cache المشترك"""
+        with self._lock:
+            self._counts[slug] += 1
+            # العداد لا يتجاوز TRAFFIC_TRACKED رابطاً بين دمجين
+            return (
+                len(self._counts) >= TRAFFIC_TRACKED
+                or time.monotonic() - self._flushed_at >= self.flush_interval
+            )
+
+    def hit(self, slug):
+        if self.count(slug):
+            self.flush()
+
+    async def ahit(self, slug):
+        """نسخة hit غير المتزامنة: الدمج (قراءة وكتابة Redis) في thread"""
+        if self.count(slug):
+            await sync_to_async(self.flush, thread_sensitive=False)()
+
+    def flush(self):
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            self._flushed_at = time.monotonic()
+        if counts:
+            totals = Counter(shared_cache.get(TRAFFIC_KEY) or {})
+            totals.update(counts)
+            shared_cache.set(TRAFFIC_KEY, dict(totals.most_common(TRAFFIC_TRACKED)), None)
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
+
+
+traffic = TrafficCounter()
+
+
+def top_representatives(limit=WARM_TOP_REPRESENTATIVES):
+    """روابط أكثر النواب زيارة"""
+    totals = Counter(shared_cache.get(TRAFFIC_KEY) or {})
+    return [slug for slug, _ in totals.most_common(limit)]
+
+
+def decay_traffic():
+    """
+    تنصيف العدادات حتى يتبع الترتيب الزيارات الحديثة، مع حذف الأقل
+    زيارة بعد TRAFFIC_TRACKED
+    """
+    totals = Counter(shared_cache.get(TRAFFIC_KEY) or {})
+    decayed = {slug: count // 2 for slug, count in totals.most_common(TRAFFIC_TRACKED) if count > 1}
+    shared_cache.set(TRAFFIC_KEY, decayed, None)
+
+
+# ========== التسخين ==========
+
+def warm_path(path, data=None):
+    """
+    تمرير طلب GET على الـ view المسؤول عن المسار. إن كانت الاستجابة
+    مخزنة يعود بعد قراءة الـ cache، وإلا تُحسب وتُخزن. يعيد رمز الحالة.
+    """
+    request = RequestFactory().get(
+        path, data or {}, HTTP_HOST=WARM_HOST, HTTP_ACCEPT='application/json', secure=WARM_SECURE
+    )
+    # طلبات التسخين لا تُحسب في عدادات الزيارات
+    request.cache_warming = True
+    match = resolve(request.path_info)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, 'render'):
+        # التخزين يتم في post-render callback
+        response.render()
+    return response.status_code
+
+
+def warm_targets(top=WARM_TOP_REPRESENTATIVES):
+    """المسارات المسخنة بالترتيب: (المسار، معاملات الاستعلام)"""
+    targets = [
+        (reverse('statistics'), None),
+        (reverse('representative-list'), None),
+    ]
+    governorates = Governorate.objects.filter(is_active=True).order_by('name').values_list('name', flat=True)
+    targets.extend((reverse('representative-list'), {'governorate': name}) for name in governorates)
+    targets.extend(
+        (reverse('representative-detail', kwargs={'slug': slug}), None)
+        for slug in top_representatives(top)
+    )
+    return targets
+
+
+def warm_caches(top=WARM_TOP_REPRESENTATIVES):
+    """تسخين كل المسارات، ويعيد عدد المسارات المسخنة"""
+    get_filter_options_bundle()
+    warmed = 1
+    for path, data in warm_targets(top):
+        try:
+            status_code = warm_path(path, data)
+        except Exception as e:
+            logger.warning('تعذر تسخين %s: %s', path, e)
+            continue
+        if status_code == 200:
+            warmed += 1
+    return warmed
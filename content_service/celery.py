@@ -0,0 +1,17 @@
+"""
+تطبيق Celery لخدمة المحتوى - منصة نائبك.كوم
+
+    celery -A content_service worker -l info
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'content_service.settings')
+
+app = Celery('content_service')
+
+# كل إعدادات CELERY_* من إعدادات Django
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -0,0 +1,48 @@
+"""
+إدارة اتصالات قاعدة البيانات لخدمة المحتوى - منصة نائبك.كوم
+
+كل عامل gunicorn يعيد استخدام اتصاله بـ PostgreSQL بين الطلبات
+(CONN_MAX_AGE) بدلاً من فتح اتصال جديد (TLS ومصادقة) مع كل طلب، ويفحص
+صلاحيته قبل أول استعلام في الطلب (CONN_HEALTH_CHECKS) فلا يفشل طلب
+بسبب اتصال أغلقه الخادم.
+
+عدد الاتصالات الدائمة لكل عامل = threads العامل + فروع التوزيع
+(content.fanout)، فيُحدد عدد الفروع من نصيب العامل في حد اتصالات الخدمة.
+خلف PgBouncer بوضع transaction pooling تُعطل الـ server-side cursors لأن
+الـ cursor لا يبقى على نفس اتصال الخادم بين المعاملات.
+"""
+
+import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
+
+
+def database_settings(url, conn_max_age=600, health_checks=True, pgbouncer=False):
+    """إعدادات DATABASES['default'] من DATABASE_URL"""
+    database = dj_database_url.parse(url, conn_max_age=conn_max_age, conn_health_checks=health_checks)
+    if pgbouncer:
+        # iterator() (التصدير المتدفق) يستخدم cursor عادياً بدلاً من server-side
+        database['DISABLE_SERVER_SIDE_CURSORS'] = True
+    return database
+
+
+def worker_connections(max_connections, workers):
+    """نصيب كل عامل من حد اتصالات الخدمة (0: دون حد)"""
+    if not max_connections:
+        return 0
+    return max_connections // max(1, workers)
+
+
+def fanout_workers(requested, max_connections, workers, threads):
+    """
+    عدد فروع التوزيع لكل عامل: كل thread طلب يحجز اتصالاً، وما بقي من
+    نصيب العامل لـ pool التوزيع (1 يعطل التوزيع)
+    """
+    per_worker = worker_connections(max_connections, workers)
+    if not per_worker:
+        return requested
+    if per_worker < threads:
+        raise ImproperlyConfigured(
+            f'CONTENT_DB_MAX_CONNECTIONS={max_connections} لا يكفي {workers} عمال '
+            f'بـ {threads} threads لكل عامل'
+        )
+    return max(1, min(requested, per_worker - threads))
@@ -5,7 +5,8 @@
 import os
 from pathlib import Path
 from decouple import config
-import dj_database_url
+
+from .database import database_settings, fanout_workers
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -26,6 +27,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third party apps
     'rest_framework',
@@ -40,6 +42,7 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'content.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -73,12 +76,28 @@ DEFAULT_CHARSET = 'utf-8'
 FILE_CHARSET = 'utf-8'
 
 # Database
+# الاتصالات الدائمة: مدة إعادة استخدام اتصال العامل بين الطلبات (بالثواني،
+# 0 يغلقه بعد كل طلب)، وفحص صلاحيته قبل أول استعلام في كل طلب
+CONTENT_DB_CONN_MAX_AGE = config('CONTENT_DB_CONN_MAX_AGE', default=600, cast=int)
+CONTENT_DB_CONN_HEALTH_CHECKS = config('CONTENT_DB_CONN_HEALTH_CHECKS', default=True, cast=bool)
+# الاتصال عبر PgBouncer بوضع transaction pooling
+CONTENT_DB_PGBOUNCER = config('CONTENT_DB_PGBOUNCER', default=False, cast=bool)
+
 DATABASES = {
-    'default': dj_database_url.config(
-        default=config('DATABASE_URL', default='sqlite:///db.sqlite3')
+    'default': database_settings(
+        config('DATABASE_URL', default='sqlite:///db.sqlite3'),
+        conn_max_age=CONTENT_DB_CONN_MAX_AGE,
+        health_checks=CONTENT_DB_CONN_HEALTH_CHECKS,
+        pgbouncer=CONTENT_DB_PGBOUNCER,
     )
 }
 
+# عمال gunicorn وthreads كل عامل (gunicorn.conf.py يقرأ نفس المتغيرات)،
+# وحد اتصالات الخدمة كلها بقاعدة البيانات يُقسم عليهم (0: دون حد)
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', default=3, cast=int)
+GUNICORN_THREADS = config('GUNICORN_THREADS', default=1, cast=int)
+CONTENT_DB_MAX_CONNECTIONS = config('CONTENT_DB_MAX_CONNECTIONS', default=0, cast=int)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -123,7 +142,7 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'content.renderers.FastJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -145,18 +164,74 @@ CORS_ALLOW_CREDENTIALS = True
 REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
 
 # Cache settings
+# ملاحظة: RedisCache المدمج في Django لا يقبل CLIENT_CLASS (خاص بـ django-redis)
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
         'LOCATION': REDIS_URL,
         'OPTIONS': {
-            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'socket_connect_timeout': 1,
+            'socket_timeout': 1,
         },
         'KEY_PREFIX': 'naebak_content',
         'TIMEOUT': 300,  # 5 minutes default timeout
-    }
+    },
+    # cache محلي يُستخدم تلقائياً عند تعذر الوصول إلى Redis
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'naebak-content-local',
+        'TIMEOUT': 300,
+    },
 }
 
+# مدة تخزين الاستجابات المحولة إلى JSON
+CONTENT_CACHE_TIMEOUT = config('CONTENT_CACHE_TIMEOUT', default=300, cast=int)
+
+# views غير متزامنة لمسارات القراءة الساخنة (للتشغيل تحت ASGI/uvicorn فقط)
+CONTENT_ASYNC_VIEWS = config('CONTENT_ASYNC_VIEWS', default=False, cast=bool)
+if CONTENT_ASYNC_VIEWS:
+    # WhiteNoise متزامن فقط ويحول سلسلة ASGI كلها إلى threads؛ الملفات الثابتة من nginx
+    MIDDLEWARE.remove('whitenoise.middleware.WhiteNoiseMiddleware')
+    # كل طلب ASGI ينفذ الـ ORM في thread جديد، فالاتصال الدائم لا يُعاد
+    # استخدامه ويبقى مفتوحاً؛ يُغلق في نهاية الطلب (للتجميع: PgBouncer)
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+
+# الحماية من التدافع: مدة خدمة القيمة المنتهية أثناء تحديثها، ومدة عقد
+# الإيجار، وأقصى انتظار لصاحب العقد عند عدم وجود قيمة (بالثواني)
+CONTENT_CACHE_STALE_TTL = config('CONTENT_CACHE_STALE_TTL', default=300, cast=int)
+CONTENT_CACHE_LEASE_TIMEOUT = config('CONTENT_CACHE_LEASE_TIMEOUT', default=30, cast=int)
+CONTENT_CACHE_LEASE_WAIT = config('CONTENT_CACHE_LEASE_WAIT', default=5.0, cast=float)
+
+# أقصى عدد من الاستعلامات المستقلة المتوازية في الردود المركبة لكل عملية
+# (كل فرع اتصال بقاعدة البيانات؛ 1 يعطل التوزيع). يُخفض ليبقى كل عامل في
+# نصيبه من CONTENT_DB_MAX_CONNECTIONS
+CONTENT_FANOUT_WORKERS = fanout_workers(
+    config('CONTENT_FANOUT_WORKERS', default=4, cast=int),
+    CONTENT_DB_MAX_CONNECTIONS, WEB_CONCURRENCY, GUNICORN_THREADS
+)
+
+# الطبقة المحلية (داخل كل عملية) للموارد شبه الثابتة: الإعدادات والألوان والبنر الافتراضي
+CONTENT_LOCAL_CACHE_SIZE = config('CONTENT_LOCAL_CACHE_SIZE', default=256, cast=int)
+CONTENT_LOCAL_CACHE_TTL = config('CONTENT_LOCAL_CACHE_TTL', default=60, cast=int)
+CONTENT_LOCAL_CACHE_RECHECK = config('CONTENT_LOCAL_CACHE_RECHECK', default=1.0, cast=float)
+
+# ضغط استجابات JSON الأكبر من هذا الحجم (بالبايت) بـ brotli أو gzip
+CONTENT_COMPRESSION_MIN_SIZE = config('CONTENT_COMPRESSION_MIN_SIZE', default=1024, cast=int)
+
+# طريقة حساب العدد الكلي في القوائم المرقمة: exact أو cached أو estimate
+CONTENT_COUNT_STRATEGY = config('CONTENT_COUNT_STRATEGY', default='cached')
+CONTENT_COUNT_CACHE_TIMEOUT = config('CONTENT_COUNT_CACHE_TIMEOUT', default=60, cast=int)
+CONTENT_COUNT_ESTIMATE_THRESHOLD = config('CONTENT_COUNT_ESTIMATE_THRESHOLD', default=10000, cast=int)
+
+# عدد الصفوف في كل معاملة عند الاستيراد المجمع للنواب
+CONTENT_IMPORT_BATCH_SIZE = config('CONTENT_IMPORT_BATCH_SIZE', default=500, cast=int)
+
+# عدد الصفوف المقروءة في كل دفعة عند التصدير المتدفق للنواب
+CONTENT_EXPORT_CHUNK_SIZE = config('CONTENT_EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# أقصى بعد للصور المرفوعة بعد توحيدها في Celery (بالبكسل)
+CONTENT_IMAGE_MAX_DIMENSION = config('CONTENT_IMAGE_MAX_DIMENSION', default=2560, cast=int)
+
 # Celery settings
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
@@ -165,6 +240,29 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# تسخين الـ cache (بالثواني، أقل من CONTENT_CACHE_TIMEOUT) وعدد صفحات النواب الأكثر زيارة
+CONTENT_WARM_INTERVAL = config('CONTENT_WARM_INTERVAL', default=60, cast=int)
+CONTENT_WARM_TOP_REPRESENTATIVES = config('CONTENT_WARM_TOP_REPRESENTATIVES', default=50, cast=int)
+# المضيف في روابط الصور المطلقة للاستجابات المسخنة (افتراضياً أول ALLOWED_HOSTS)
+CONTENT_WARM_HOST = config('CONTENT_WARM_HOST', default='')
+# إعادة بناء لقطة الإحصائيات بالكامل (بالثواني)
+CONTENT_STATS_REBUILD_INTERVAL = config('CONTENT_STATS_REBUILD_INTERVAL', default=900, cast=int)
+
+CELERY_BEAT_SCHEDULE = {
+    'warm-caches': {
+        'task': 'content.tasks.warm_caches',
+        'schedule': CONTENT_WARM_INTERVAL,
+    },
+    'rebuild-stats-snapshot': {
+        'task': 'content.tasks.rebuild_stats_snapshot',
+        'schedule': CONTENT_STATS_REBUILD_INTERVAL,
+    },
+    'decay-traffic': {
+        'task': 'content.tasks.decay_traffic',
+        'schedule': 3600,
+    },
+}
+
 # Logging
 LOGGING = {
     'version': 1,
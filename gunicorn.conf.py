@@ -0,0 +1,13 @@
+"""
+إعدادات Gunicorn لخدمة المحتوى - منصة نائبك.كوم
+
+عدد العمال والـ threads من نفس متغيرات البيئة التي تحسب منها الإعدادات
+حدود اتصالات قاعدة البيانات لكل عامل (content_service/database.py).
+"""
+
+from decouple import config
+
+bind = config('GUNICORN_BIND', default='0.0.0.0:8000')
+workers = config('WEB_CONCURRENCY', default=3, cast=int)
+threads = config('GUNICORN_THREADS', default=1, cast=int)
+timeout = config('GUNICORN_TIMEOUT', default=120, cast=int)
@@ -0,0 +1,123 @@
+"""
+اختبارات الـ views غير المتزامنة لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import sys
+import types
+
+import pytest
+from django.core.cache import caches
+from django.urls import include, path, resolve
+from model_bakery import baker
+from rest_framework.test import APIClient
+from content import async_views
+from content import urls as content_urls
+from content.cache import local_cache
+from content.models import Governorate, District, PoliticalParty, Representative, ColorSettings
+
+ASYNC_URLCONF = 'tests_async_urlconf'
+
+
+@pytest.fixture
+def async_urls(settings):
+    """مسارات الخدمة مع views القراءة غير المتزامنة (CONTENT_ASYNC_VIEWS)"""
+    module = types.ModuleType(ASYNC_URLCONF)
+    module.urlpatterns = [path('', include(async_views.use_async_routes(content_urls.urlpatterns)))]
+    sys.modules[ASYNC_URLCONF] = module
+    yield lambda: setattr(settings, 'ROOT_URLCONF', ASYNC_URLCONF)
+    sys.modules.pop(ASYNC_URLCONF, None)
+
+
+@pytest.fixture
+def representative():
+    governorate = baker.make(Governorate, name="القاهرة", is_active=True)
+    district = baker.make(District, governorate=governorate, number=1, is_active=True)
+    baker.make(ColorSettings, color_type='primary_green', color_value='#00AA00', is_active=True)
+    return baker.make(
+        Representative, name="سامي نبيل", name_en="Samy Nabil", slug='samy-nabil', district=district,
+        party=baker.make(PoliticalParty, name="حزب الأمل", is_active=True),
+        profession="مهندس", is_active=True, admin_approved=True
+    )
+
+
+def clear_caches():
+    for alias in ('default', 'local'):
+        caches[alias].clear()
+    local_cache.clear()
+
+
+READ_PATHS = [
+    '/api/representatives/',
+    '/api/representatives/?governorate=القاهرة&page_size=5',
+    '/api/representatives/?pagination=cursor',
+    '/api/representatives/samy-nabil/',
+    '/samy-nabil/',
+    '/api/statistics/',
+    '/api/search/?q=سامي',
+    '/api/search/?q=سامي&pagination=cursor',
+    '/api/filter-options/',
+    '/api/colors/scheme/',
+    '/api/settings/',
+]
+
+
+@pytest.mark.django_db
+class TestAsyncViews:
+    """اختبارات تطابق المسار غير المتزامن مع المتزامن"""
+
+    def test_routes_are_replaced(self):
+        """اختبار استبدال مسارات القراءة الساخنة فقط"""
+        patterns = async_views.use_async_routes(content_urls.urlpatterns)
+        callbacks = {pattern.name: pattern.callback for pattern in patterns if getattr(pattern, 'name', None)}
+
+        assert callbacks['statistics'] is async_views.statistics_view
+        assert callbacks['representative-page-arabic'] is async_views.representative_detail_view
+        assert callbacks['faq-list'].view_class.__name__ == 'FAQListView'
+
+    def test_same_content_as_sync(self, representative, async_urls):
+        """اختبار أن المسار غير المتزامن ينتج نفس المحتوى"""
+        client = APIClient()
+        expected = {}
+        for url in READ_PATHS:
+            clear_caches()
+            response = client.get(url)
+            expected[url] = (response.status_code, response.content, 'ETag' in response)
+
+        async_urls()
+        assert resolve('/api/representatives/').func is async_views.representative_list_view
+        for url in READ_PATHS:
+            clear_caches()
+            response = client.get(url)
+            assert (response.status_code, response.content, 'ETag' in response) == expected[url], url
+
+    def test_cache_shared_with_sync(self, representative, async_urls, django_assert_num_queries):
+        """اختبار قراءة الاستجابات التي خزنها المسار المتزامن دون استعلامات"""
+        client = APIClient()
+        for url in READ_PATHS:
+            client.get(url)
+
+        async_urls()
+        with django_assert_num_queries(0):
+            for url in READ_PATHS:
+                assert client.get(url).status_code == 200, url
+
+    def test_errors_match_sync(self, representative, async_urls):
+        """اختبار تطابق استجابات الأخطاء"""
+        client = APIClient()
+        urls = ['/api/representatives/missing/', '/api/representatives/?gender=other', '/api/search/']
+        expected = [(response.status_code, response.json()) for response in map(client.get, urls)]
+
+        async_urls()
+
+        assert [(response.status_code, response.json()) for response in map(client.get, urls)] == expected
+
+    def test_updates_go_to_sync_view(self, representative, async_urls):
+        """اختبار تحويل طلبات التعديل إلى الـ view المتزامن"""
+        async_urls()
+        client = APIClient()
+        client.get('/api/settings/')
+
+        response = client.patch('/api/settings/', {'site_name': 'نائبك'}, format='json')
+
+        assert response.status_code == 200
+        assert client.get('/api/settings/').json()['site_name'] == 'نائبك'
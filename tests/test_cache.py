@@ -0,0 +1,415 @@
+"""
+اختبارات طبقة التخزين المؤقت لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from django.core.cache.backends.base import BaseCache
+from django.db import connection
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from content.models import Governorate, District, Representative, FAQ, ColorSettings, SiteSettings
+from content import cache as cache_module
+from content.cache import (
+    ResilientCache, LocalLRUCache, bump_generation, get_generations, get_or_compute,
+    acquire_lease, is_fresh, store_entry, normalized_query_string, cache_stats,
+    reset_cache_stats, shared_cache
+)
+from content.views import RepresentativeListView
+
+
+@pytest.fixture
+def approved_representative():
+    """نائب نشط وموافق عليه"""
+    governorate = baker.make(Governorate, name="القاهرة")
+    district = baker.make(District, governorate=governorate, number=1)
+    return baker.make(
+        Representative, name="أحمد سالم", name_en="Ahmed Salem", district=district,
+        is_active=True, admin_approved=True
+    )
+
+
+class TestCacheHelpers:
+    """اختبارات الدوال المساعدة"""
+
+    def test_query_string_is_normalized(self):
+        """اختبار ترتيب المعاملات وحذف القيم الفارغة"""
+        first = normalized_query_string(QueryDict('page=2&gender=male&name='))
+        second = normalized_query_string(QueryDict('gender=male&page=2'))
+
+        assert first == second == 'gender=male&page=2'
+
+    def test_bump_generation_changes_only_that_model(self):
+        """اختبار أن رفع الجيل يخص النموذج المعدل فقط"""
+        before = get_generations([Representative, FAQ])
+        bump_generation(Representative)
+        after = get_generations([Representative, FAQ])
+
+        assert after[0] != before[0]
+        assert after[1] == before[1]
+
+    def test_fallback_when_shared_cache_fails(self, settings):
+        """اختبار التحول للذاكرة المحلية عند تعطل Redis"""
+        settings.CACHES = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+                'LOCATION': 'redis://127.0.0.1:1/0',
+                'OPTIONS': {'socket_connect_timeout': 0.1},
+            },
+            'local': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'fallback-test',
+            },
+        }
+        cache = ResilientCache()
+
+        cache.set('key', 'value', 60)
+
+        assert cache.is_degraded
+        assert cache.get('key') == 'value'
+
+
+@pytest.mark.django_db
+class TestCachedResponses:
+    """اختبارات تخزين الاستجابات"""
+
+    def test_second_request_is_served_from_cache(self, approved_representative, django_assert_num_queries):
+        """اختبار خدمة الطلب الثاني دون استعلامات"""
+        client = APIClient()
+        reset_cache_stats()
+        first = client.get('/api/representatives/')
+
+        with django_assert_num_queries(0):
+            second = client.get('/api/representatives/')
+
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert cache_stats()['hits'] == 1
+        assert cache_stats()['misses'] == 1
+
+    def test_save_invalidates_cached_response(self, approved_representative):
+        """اختبار أن التعديل يبطل الاستجابة المخزنة"""
+        client = APIClient()
+        client.get(f'/api/representatives/{approved_representative.slug}/')
+
+        approved_representative.profession = "مهندس"
+        approved_representative.save()
+        response = client.get(f'/api/representatives/{approved_representative.slug}/')
+
+        assert response.json()['profession'] == "مهندس"
+
+    def test_related_model_invalidates_list(self, approved_representative):
+        """اختبار إبطال القائمة عند تعديل المحافظة"""
+        client = APIClient()
+        client.get('/api/representatives/')
+
+        governorate = approved_representative.district.governorate
+        governorate.name = "الجيزة"
+        governorate.save()
+        response = client.get('/api/representatives/')
+
+        assert response.json()['results'][0]['governorate_name'] == "الجيزة"
+
+    def test_function_view_is_cached(self, approved_representative, django_assert_num_queries):
+        """اختبار تخزين استجابات دوال api_view"""
+        client = APIClient()
+        client.get('/api/statistics/')
+
+        with django_assert_num_queries(0):
+            response = client.get('/api/statistics/')
+
+        assert response.json()['total_representatives'] == 1
+
+    def test_errors_are_not_cached(self, approved_representative):
+        """اختبار عدم تخزين الأخطاء"""
+        client = APIClient()
+        client.get('/api/search/')
+
+        reset_cache_stats()
+        response = client.get('/api/search/')
+
+        assert response.status_code == 400
+        assert cache_stats()['hits'] == 0
+
+    def test_cached_per_host_and_scheme(self, approved_representative):
+        """اختبار أن الروابط المطلقة المخزنة لا تُخدم لمضيف أو بروتوكول آخر"""
+        approved_representative.profile_image = 'representatives/profiles/ahmed.jpg'
+        approved_representative.save()
+        path = f'/api/representatives/{approved_representative.slug}/'
+        client = APIClient()
+
+        client.get(path, HTTP_HOST='localhost')
+        response = client.get(path, secure=True)
+
+        assert response.json()['profile_image'].startswith('https://testserver/media/')
+
+
+class TestLocalLRUCache:
+    """اختبارات الطبقة المحلية"""
+
+    def test_evicts_least_recently_used(self):
+        """اختبار حذف الأقدم استخداماً عند امتلاء الحجم"""
+        cache = LocalLRUCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a')['value'] == 1
+        assert len(cache) == 2
+
+    def test_entries_expire(self):
+        """اختبار انتهاء صلاحية العناصر"""
+        cache = LocalLRUCache(maxsize=2, ttl=0)
+        cache.set('a', 1)
+
+        assert cache.get('a') is None
+
+    def test_discard_model(self):
+        """اختبار حذف العناصر المعتمدة على نموذج"""
+        cache = LocalLRUCache()
+        cache.set('colors', 1, models=(ColorSettings,))
+        cache.set('faq', 2, models=(FAQ,))
+        cache.discard_model(ColorSettings)
+
+        assert cache.get('colors') is None
+        assert cache.get('faq')['value'] == 2
+
+
+@pytest.mark.django_db
+class TestSingletonResources:
+    """اختبارات الموارد شبه الثابتة"""
+
+    def test_color_scheme_served_without_queries(self, django_assert_num_queries):
+        """اختبار خدمة نظام الألوان من الذاكرة"""
+        baker.make(ColorSettings, color_type='primary_green', color_value='#00AA00')
+        client = APIClient()
+        client.get('/api/colors/scheme/')
+
+        with django_assert_num_queries(0):
+            response = client.get('/api/colors/scheme/')
+
+        assert response.json() == {
+            'colors': {'primary_green': '#00AA00'},
+            'css_variables': {'--primary-green': '#00AA00'},
+        }
+
+    def test_color_scheme_invalidated_on_save(self):
+        """اختبار إبطال نظام الألوان عند تعديله"""
+        color = baker.make(ColorSettings, color_type='primary_green', color_value='#00AA00')
+        client = APIClient()
+        client.get('/api/colors/scheme/')
+
+        color.color_value = '#111111'
+        color.save()
+        response = client.get('/api/colors/scheme/')
+
+        assert response.json()['colors']['primary_green'] == '#111111'
+
+    def test_site_settings_get_does_not_insert_twice(self, django_assert_num_queries):
+        """اختبار أن قراءة الإعدادات لا تنفذ get_or_create في كل طلب"""
+        client = APIClient()
+        first = client.get('/api/settings/')
+
+        with django_assert_num_queries(0):
+            second = client.get('/api/settings/')
+
+        assert SiteSettings.objects.count() == 1
+        assert second.json() == first.json()
+
+    def test_default_banner_missing(self):
+        """اختبار عدم وجود بنر افتراضي"""
+        response = APIClient().get('/api/banners/default/')
+
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestConditionalRequests:
+    """اختبارات الطلبات الشرطية (ETag وLast-Modified)"""
+
+    def test_list_returns_304_for_matching_etag(self, approved_representative, django_assert_num_queries):
+        """اختبار 304 من الـ cache دون استعلامات"""
+        client = APIClient()
+        first = client.get('/api/representatives/')
+
+        with django_assert_num_queries(0):
+            second = client.get('/api/representatives/', HTTP_IF_NONE_MATCH=first['ETag'])
+
+        assert first['Last-Modified']
+        assert second.status_code == 304
+        assert second.content == b''
+
+    def test_304_before_serialization(self, approved_representative, django_assert_num_queries, monkeypatch):
+        """اختبار 304 باستعلام التحقق فقط عند عدم وجود الاستجابة في الـ cache"""
+        monkeypatch.setattr(shared_cache, 'set', lambda *args, **kwargs: None)
+        client = APIClient()
+        etag = client.get('/api/representatives/')['ETag']
+
+        with django_assert_num_queries(1):
+            response = client.get('/api/representatives/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_etag_changes_after_update(self, approved_representative):
+        """اختبار تغير ETag بعد تعديل البيانات"""
+        client = APIClient()
+        etag = client.get('/api/representatives/')['ETag']
+        approved_representative.profession = "محامي"
+        approved_representative.save()
+
+        response = client.get('/api/representatives/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert response['ETag'] != etag
+
+    def test_etag_changes_after_delete(self, approved_representative):
+        """اختبار تغير ETag بعد حذف صف دون تغير أقصى updated_at"""
+        older = baker.make(
+            Representative, name="سالم أحمد", district=approved_representative.district,
+            is_active=True, admin_approved=True
+        )
+        Representative.objects.filter(pk=older.pk).update(updated_at=approved_representative.updated_at)
+        client = APIClient()
+        etag = client.get('/api/representatives/')['ETag']
+        older.delete()
+
+        assert client.get('/api/representatives/', HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_validators_skip_count(self, approved_representative):
+        """اختبار بناء ترويسات التحقق دون COUNT على القائمة"""
+        view = RepresentativeListView()
+        view.setup(Request(APIRequestFactory().get('/api/representatives/')))
+        view.format_kwarg = None
+
+        with CaptureQueriesContext(connection) as queries:
+            signature, last_modified = view.get_validators()
+
+        assert last_modified == approved_representative.updated_at
+        assert len(queries) == 1
+        assert not any('COUNT(' in query['sql'].upper() for query in queries.captured_queries)
+
+    def test_detail_if_modified_since(self, approved_representative):
+        """اختبار If-Modified-Since لصفحة النائب"""
+        client = APIClient()
+        url = f'/api/representatives/{approved_representative.slug}/'
+        last_modified = client.get(url)['Last-Modified']
+
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == 304
+
+    def test_function_views_have_etag(self, approved_representative):
+        """اختبار ETag لدوال api_view"""
+        client = APIClient()
+        etag = client.get('/api/statistics/')['ETag']
+
+        assert client.get('/api/statistics/', HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+
+class TestStampedeProtection:
+    """اختبارات الحماية من التدافع"""
+
+    def test_stale_value_served_while_another_worker_refreshes(self):
+        """اختبار خدمة القيمة القديمة وعقد الإيجار مع عامل آخر"""
+        store_entry('hot', 'old', (1,), 60, 0.01)
+        assert acquire_lease('hot')
+        calls = []
+
+        value = get_or_compute('hot', lambda: calls.append(1) or 'new', (2,))
+
+        assert value == 'old'
+        assert calls == []
+
+    def test_waits_for_lease_holder_when_cold(self):
+        """اختبار انتظار صاحب العقد بدلاً من الحساب عند عدم وجود قيمة"""
+        assert acquire_lease('cold')
+        threading.Timer(0.1, store_entry, ('cold', 'computed', (), 60, 0.1)).start()
+        calls = []
+
+        value = get_or_compute('cold', lambda: calls.append(1) or 'again')
+
+        assert value == 'computed'
+        assert calls == []
+
+    def test_computes_once_and_releases_lease(self):
+        """اختبار الحساب مرة واحدة ثم تحرير العقد"""
+        calls = []
+        compute = lambda: calls.append(1) or 'value'
+
+        assert get_or_compute('once', compute, (1,)) == 'value'
+        assert get_or_compute('once', compute, (1,)) == 'value'
+        assert calls == [1]
+        assert acquire_lease('once')
+
+    def test_xfetch_refreshes_early(self, monkeypatch):
+        """اختبار التحديث المبكر قرب الانتهاء للقيم بطيئة الحساب"""
+        monkeypatch.setattr(cache_module.random, 'random', lambda: 0.9)
+        expires_at = time.time() + 1
+
+        # -log(0.1) * 10 ثوانٍ من زمن الحساب تتجاوز الثانية المتبقية
+        assert not is_fresh(('v', (), expires_at, 10.0), ())
+        assert is_fresh(('v', (), expires_at, 0.001), ())
+        assert not is_fresh(('v', (1,), expires_at, 0.001), (2,))
+
+
+@pytest.mark.django_db
+class TestStaleWhileRevalidate:
+    """اختبارات خدمة الاستجابات القديمة أثناء تحديثها"""
+
+    def test_endpoint_serves_stale_during_refresh(self, approved_representative, monkeypatch):
+        """اختبار خدمة الاستجابة السابقة بعد التعديل إن كان التحديث مع عامل آخر"""
+        client = APIClient()
+        client.get('/api/statistics/')
+        baker.make(
+            Representative, district=approved_representative.district, is_active=True, admin_approved=True
+        )
+        monkeypatch.setattr(cache_module, 'acquire_lease', lambda key: None)
+        reset_cache_stats()
+
+        stale = client.get('/api/statistics/')
+
+        assert stale.json()['total_representatives'] == 1
+        assert cache_stats()['stale'] == 1
+        monkeypatch.undo()
+        assert client.get('/api/statistics/').json()['total_representatives'] == 2
+
+
+class SlowCache(BaseCache):
+    """backend متزامن بطيء مثل Redis بعيد أو متعطل"""
+
+    def get(self, key, default=None, version=None):
+        time.sleep(0.2)
+        return 'value'
+
+
+class TestAsyncCache:
+    """اختبارات استدعاء الـ cache من المسار غير المتزامن"""
+
+    def test_sync_backend_does_not_block_event_loop(self):
+        """اختبار أن انتظار backend متزامن لا يوقف حلقة الأحداث"""
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            value = await cache_module._acache_call(SlowCache({}), 'aget', 'key')
+            task.cancel()
+            return value, ticks
+
+        value, ticks = asyncio.run(scenario())
+
+        assert value == 'value'
+        assert ticks >= 5
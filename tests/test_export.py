@@ -0,0 +1,100 @@
+"""
+اختبارات التصدير المتدفق لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import csv
+import gzip
+import io
+import json
+import tempfile
+
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+from django.core.management import call_command
+from content.models import Governorate, District, PoliticalParty, Representative
+
+
+@pytest.fixture
+def representatives():
+    """نواب معتمدون في محافظتين ونائب غير معتمد"""
+    cairo = baker.make(Governorate, name="القاهرة", code="CAI")
+    giza = baker.make(Governorate, name="الجيزة", code="GIZ")
+    party = baker.make(PoliticalParty, name="حزب الوفد")
+    cairo_district = baker.make(District, name="شبرا", governorate=cairo, number=1)
+    giza_district = baker.make(District, name="الدقي", governorate=giza, number=1)
+    for index in range(5):
+        baker.make(
+            Representative, name=f"نائب القاهرة {index}", district=cairo_district,
+            party=party, gender='male', admin_approved=True
+        )
+    baker.make(Representative, name="نائب الجيزة", district=giza_district, gender='female', admin_approved=True)
+    baker.make(Representative, name="غير معتمد", district=giza_district, gender='male', admin_approved=False)
+
+
+def streamed(response):
+    return b''.join(response.streaming_content)
+
+
+@pytest.mark.django_db
+class TestRepresentativeExport:
+    """اختبارات تصدير النواب"""
+
+    def test_csv_export(self, representatives):
+        """اختبار تصدير CSV بنفس حقول القائمة"""
+        response = APIClient().get('/api/representatives/export/')
+
+        rows = list(csv.DictReader(io.StringIO(streamed(response).decode('utf-8-sig'))))
+        assert response.streaming
+        assert response['Content-Type'] == 'text/csv; charset=utf-8'
+        assert 'representatives.csv' in response['Content-Disposition']
+        assert len(rows) == 6
+        assert rows[0]['governorate_name'] in ("القاهرة", "الجيزة")
+        assert 'غير معتمد' not in {row['name'] for row in rows}
+
+    def test_jsonl_export_honors_filters(self, representatives):
+        """اختبار JSONL مع فلاتر قائمة النواب"""
+        response = APIClient().get(
+            '/api/representatives/export/', {'file_format': 'jsonl', 'governorate': 'القاهرة'}
+        )
+
+        records = [json.loads(line) for line in streamed(response).splitlines()]
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert len(records) == 5
+        assert {record['party_name'] for record in records} == {"حزب الوفد"}
+
+    def test_export_reads_in_chunks(self, representatives, monkeypatch, django_assert_max_num_queries):
+        """اختبار القراءة على دفعات في استعلام واحد"""
+        monkeypatch.setattr('content.export.EXPORT_CHUNK_SIZE', 2)
+        response = APIClient().get('/api/representatives/export/', {'file_format': 'ndjson'})
+
+        with django_assert_max_num_queries(1):
+            lines = streamed(response).splitlines()
+
+        assert len(lines) == 6
+
+    def test_gzip_export(self, representatives):
+        """اختبار الملف المضغوط"""
+        response = APIClient().get('/api/representatives/export/', {'file_format': 'jsonl', 'gzip': '1'})
+
+        content = gzip.decompress(streamed(response))
+        assert response['Content-Type'] == 'application/gzip'
+        assert 'representatives.jsonl.gz' in response['Content-Disposition']
+        assert len(content.splitlines()) == 6
+
+    def test_unknown_format(self, representatives):
+        """اختبار رفض صيغة غير مدعومة"""
+        response = APIClient().get('/api/representatives/export/', {'file_format': 'xml'})
+
+        assert response.status_code == 400
+
+    def test_management_command(self, representatives):
+        """اختبار أمر export_representatives مع فلتر وضغط"""
+        with tempfile.NamedTemporaryFile(suffix='.jsonl.gz') as handle:
+            call_command(
+                'export_representatives', '--format', 'jsonl', '--gzip',
+                '--filter', 'gender=female', '--output', handle.name
+            )
+            records = [json.loads(line) for line in gzip.decompress(handle.read()).splitlines()]
+
+        assert [record['name'] for record in records] == ["نائب الجيزة"]
@@ -0,0 +1,93 @@
+"""
+اختبارات توزيع الاستعلامات المستقلة لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import asyncio
+import threading
+
+import pytest
+from django.db import transaction
+from model_bakery import baker
+from rest_framework.test import APIClient
+
+from content.fanout import agather, run_parallel
+from content.models import Achievement, District, Governorate, News, Representative, RepresentativeImage
+from content.stats import compute_statistics, get_statistics, rebuild_snapshot
+
+
+def thread_name():
+    return threading.current_thread().name
+
+
+def branches(count=3):
+    return [thread_name] * count
+
+
+@pytest.fixture
+def representative():
+    """نائب له عناصر تابعة في كل علاقة"""
+    governorate = baker.make(Governorate, name="القاهرة", code="CAI")
+    district = baker.make(District, governorate=governorate, number=1)
+    representative = baker.make(
+        Representative, name="نائب الاختبار", slug="نائب-الاختبار", district=district,
+        is_active=True, admin_approved=True
+    )
+    baker.make(RepresentativeImage, representative=representative, is_active=True, _quantity=2)
+    baker.make(Achievement, representative=representative, is_active=True)
+    baker.make(News, representative=representative, is_active=True, _quantity=3)
+    return representative
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRunParallel:
+    """اختبارات التوزيع على الـ pool"""
+
+    def test_branches_run_on_pool_threads(self):
+        """اختبار تنفيذ الفروع في threads الـ pool بنفس ترتيب النتائج"""
+        names = run_parallel(*branches())
+
+        assert names[0] == thread_name()
+        assert all(name.startswith('content-fanout') for name in names[1:])
+        assert run_parallel(lambda: 1, lambda: 2, lambda: 3) == [1, 2, 3]
+
+    def test_serial_inside_transaction(self):
+        """اختبار التنفيذ بالتتابع داخل transaction (الاتصالات الأخرى لا ترى تعديلاته)"""
+        with transaction.atomic():
+            assert set(run_parallel(*branches())) == {thread_name()}
+
+    def test_branch_error_is_raised(self):
+        """اختبار رفع استثناء الفرع بعد انتهاء الفروع الأخرى"""
+        def fail():
+            raise ValueError('فرع فاشل')
+
+        with pytest.raises(ValueError):
+            run_parallel(lambda: 1, fail)
+
+    def test_agather(self):
+        """اختبار asyncio.gather على الـ pool في المسار غير المتزامن"""
+        names = asyncio.run(agather(*branches()))
+
+        assert len(names) == 3
+        assert all(name.startswith('content-fanout') for name in names)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCompositeEndpoints:
+    """اختبارات الردود المركبة عند التوزيع الفعلي"""
+
+    def test_statistics(self, representative):
+        """اختبار تطابق الإحصائيات من الاستعلامات المتوازية واللقطة"""
+        rebuild_snapshot()
+
+        assert compute_statistics()['total_representatives'] == 1
+        assert get_statistics() == compute_statistics()
+
+    def test_representative_detail(self, representative):
+        """اختبار صفحة النائب مع جلب علاقاته التابعة بالتوازي"""
+        response = APIClient().get(f'/api/representatives/{representative.slug}/')
+
+        assert response.status_code == 200
+        assert len(response.data['additional_images']) == 2
+        assert len(response.data['achievement_list']) == 1
+        assert len(response.data['news']) == 3
+        assert response.data['events'] == []
@@ -0,0 +1,82 @@
+"""
+اختبارات المسار السريع للـ serializers لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from model_bakery import baker
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+from content.models import Governorate, District, PoliticalParty, Representative
+from content.fast_serializers import FastFieldPlan
+from content.serializers import (
+    GovernorateSerializer, DistrictSerializer, PoliticalPartySerializer,
+    RepresentativeListSerializer, RepresentativeDetailSerializer
+)
+
+
+@pytest.fixture
+def rows():
+    """بيانات متنوعة: علاقات غائبة وصور وقيم فارغة"""
+    governorate = baker.make(Governorate, name="الأقصر", population=None, area=2960.5)
+    district = baker.make(District, name="الدائرة الأولى", governorate=governorate, number=1)
+    party = baker.make(
+        PoliticalParty, name="حزب النور", logo='parties/logos/nour.png', founded_date=date(2011, 6, 12)
+    )
+    baker.make(PoliticalParty, name="حزب بلا شعار")
+    baker.make(
+        Representative, name="سعاد محمد", district=district, party=party, rating=Decimal('4.25'),
+        profile_image='representatives/souad.jpg', solved_complaints=3, received_complaints=4,
+        admin_approved=True
+    )
+    baker.make(Representative, name="مستقل", district=district, party=None, admin_approved=True)
+
+
+def _render(data):
+    return JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+class TestFastSerializers:
+    """اختبارات تطابق المسار السريع مع الـ serializers"""
+
+    @pytest.mark.parametrize('serializer_class, model', [
+        (GovernorateSerializer, Governorate),
+        (DistrictSerializer, District),
+        (PoliticalPartySerializer, PoliticalParty),
+        (RepresentativeListSerializer, Representative),
+    ])
+    def test_output_is_byte_identical(self, rows, serializer_class, model):
+        """اختبار تطابق JSON الناتج حرفياً مع وبدون request"""
+        request = APIRequestFactory().get('/api/representatives/')
+        for context in ({}, {'request': request}):
+            queryset = model.objects.all()
+            expected = _render(serializer_class(queryset, many=True, context=context).data)
+            actual = _render(serializer_class.fast_serialize(serializer_class.fast_values(queryset), context))
+
+            assert actual == expected
+
+    def test_nested_serializers_are_rejected(self):
+        """اختبار رفض الحقول المتداخلة"""
+        with pytest.raises(TypeError):
+            FastFieldPlan(RepresentativeDetailSerializer)
+
+    def test_filter_options_match_serializers(self, rows):
+        """اختبار تطابق خيارات الفلاتر مع ناتج الـ serializers"""
+        expected = {
+            'governorates': GovernorateSerializer(Governorate.objects.all(), many=True).data,
+            'parties': PoliticalPartySerializer(PoliticalParty.objects.all(), many=True).data,
+            'districts': DistrictSerializer(District.objects.all(), many=True).data,
+            'genders': [{'value': 'male', 'label': 'ذكر'}, {'value': 'female', 'label': 'أنثى'}],
+            'statuses': [
+                {'value': 'candidate', 'label': 'مرشح'},
+                {'value': 'elected', 'label': 'منتخب'},
+                {'value': 'former', 'label': 'سابق'},
+            ],
+        }
+
+        response = APIClient().get('/api/filter-options/')
+
+        assert response.content == _render(expected)
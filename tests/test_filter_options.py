@@ -0,0 +1,120 @@
+"""
+اختبارات حزمة خيارات الفلاتر لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import gzip
+import uuid
+
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+from content import filter_options
+from content.models import Governorate, District, PoliticalParty
+from content.renderers import JSONFragment
+
+
+@pytest.fixture
+def reference_data():
+    """محافظتان بدوائرهما وحزب"""
+    cairo = baker.make(Governorate, name="القاهرة", code="CAI")
+    aswan = baker.make(Governorate, name="أسوان", code="ASW")
+    baker.make(District, name="مصر الجديدة", governorate=cairo, number=1)
+    baker.make(District, name="شبرا", governorate=cairo, number=2)
+    baker.make(District, name="كوم أمبو", governorate=aswan, number=1)
+    baker.make(PoliticalParty, name="حزب الوفد")
+    return {'cairo': cairo, 'aswan': aswan}
+
+
+@pytest.mark.django_db
+class TestFilterOptionsBundle:
+    """اختبارات حزمة خيارات الفلاتر"""
+
+    def test_bundle_served_without_queries(self, reference_data, django_assert_num_queries):
+        """اختبار خدمة الحزمة من الذاكرة مع ETag قوي"""
+        client = APIClient()
+        first = client.get('/api/filter-options/')
+
+        with django_assert_num_queries(0):
+            second = client.get('/api/filter-options/')
+
+        data = second.json()
+        assert second.content == first.content
+        assert first['ETag'].startswith('"')
+        assert len(data['districts']) == 3
+        assert data['districts'][0]['governorate_name']
+        assert data['genders'][0] == {'value': 'male', 'label': 'ذكر'}
+
+    def test_not_modified(self, reference_data):
+        """اختبار 304 عند تطابق ETag"""
+        client = APIClient()
+        etag = client.get('/api/filter-options/')['ETag']
+
+        response = client.get('/api/filter-options/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_reference_edit_invalidates_bundle(self, reference_data):
+        """اختبار إبطال الحزمة عند تعديل دائرة"""
+        client = APIClient()
+        etag = client.get('/api/filter-options/')['ETag']
+
+        district = District.objects.get(name="شبرا")
+        district.name = "شبرا الخيمة"
+        district.save()
+        response = client.get('/api/filter-options/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert "شبرا الخيمة" in [item['name'] for item in response.json()['districts']]
+
+    def test_lazy_districts(self, reference_data):
+        """اختبار تحميل دوائر كل محافظة على حدة"""
+        client = APIClient()
+        bundle = client.get('/api/filter-options/', {'districts': 'lazy'}).json()
+        cairo_url = bundle['district_chunks'][str(reference_data['cairo'].id)]
+
+        response = client.get(cairo_url)
+
+        assert 'districts' not in bundle
+        assert sorted(item['name'] for item in response.json()) == ["شبرا", "مصر الجديدة"]
+        assert response['ETag']
+
+    def test_unknown_governorate_chunk(self, reference_data):
+        """اختبار محافظة غير موجودة"""
+        response = APIClient().get(f'/api/filter-options/districts/{uuid.uuid4()}/')
+
+        assert response.status_code == 404
+
+    def test_lists_encoded_once(self, reference_data, monkeypatch):
+        """اختبار تحويل قائمتي المحافظات والأحزاب مرة واحدة وإدراجهما في الحزمتين"""
+        fragments = []
+
+        class RecordingFragment(JSONFragment):
+            def __init__(self, content):
+                super().__init__(content)
+                fragments.append(self.content)
+
+        monkeypatch.setattr(filter_options, 'JSONFragment', RecordingFragment)
+        bundle = filter_options.build_bundle()
+
+        governorates, parties = fragments
+        for content, _ in (bundle['full'][None], bundle['lazy'][None]):
+            assert b'"governorates":' + governorates in content
+            assert b'"parties":' + parties in content
+
+    def test_compressed_bundle_keeps_strong_etag(self, reference_data):
+        """اختبار الحزمة المضغوطة مسبقاً مع ETag قوي لكل ترميز"""
+        for number in range(3, 40):
+            baker.make(District, name=f"دائرة رقم {number}", governorate=reference_data['cairo'], number=number)
+        client = APIClient()
+        plain = client.get('/api/filter-options/')
+
+        response = client.get('/api/filter-options/', HTTP_ACCEPT_ENCODING='gzip')
+        not_modified = client.get(
+            '/api/filter-options/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag']
+        )
+
+        assert response['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(response.content) == plain.content
+        assert response['ETag'] == plain['ETag'][:-1] + '-gzip"'
+        assert 'Accept-Encoding' in response['Vary']
+        assert not_modified.status_code == 304
@@ -0,0 +1,161 @@
+"""
+اختبارات نسخ الصور لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import io
+import os
+
+import pytest
+from model_bakery import baker
+from PIL import Image
+from rest_framework.test import APIClient
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from content.models import Governorate, District, PoliticalParty, Representative, News
+
+
+def image_upload(name='photo.png', size=(2000, 1000), mode='RGBA', image_format='PNG', exif=None):
+    buffer = io.BytesIO()
+    image = Image.new(mode, size, (200, 30, 30, 128) if mode == 'RGBA' else (200, 30, 30))
+    image.save(buffer, image_format, **({'exif': exif} if exif else {}))
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def district():
+    return baker.make(District, governorate=baker.make(Governorate))
+
+
+def make_representative(district, **kwargs):
+    return Representative.objects.create(
+        name="صاحب صورة", gender='male', district=district, admin_approved=True, **kwargs
+    )
+
+
+@pytest.mark.django_db
+class TestImageVariants:
+    """اختبارات توليد نسخ الصور"""
+
+    def test_variants_generated_after_commit(self, district, django_capture_on_commit_callbacks):
+        """اختبار توليد النسخ بعد الحفظ وليس أثناءه"""
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            representative = make_representative(district, profile_image=image_upload())
+        assert Representative.objects.get(pk=representative.pk).image_variants == {}
+
+        for callback in callbacks:
+            callback()
+
+        stored = Representative.objects.get(pk=representative.pk)
+        variants = stored.image_variants['profile_image']
+        assert variants['source'] == stored.profile_image.name
+        assert (variants['thumb']['width'], variants['thumb']['height']) == (160, 160)
+        assert (variants['card']['width'], variants['card']['height']) == (480, 240)
+        assert variants['full']['width'] == 1600
+        with default_storage.open(variants['card']['webp']) as handle:
+            assert Image.open(handle).format == 'WEBP'
+        with default_storage.open(variants['thumb']['jpeg']) as handle:
+            assert Image.open(handle).mode == 'RGB'
+
+    def test_small_images_are_not_upscaled(self, district, django_capture_on_commit_callbacks):
+        """اختبار عدم تكبير الصور الصغيرة"""
+        with django_capture_on_commit_callbacks(execute=True):
+            representative = make_representative(district, profile_image=image_upload(size=(100, 80)))
+
+        variants = Representative.objects.get(pk=representative.pk).image_variants['profile_image']
+        assert {(entry['width'], entry['height']) for key, entry in variants.items() if key != 'source'} == {
+            (80, 80), (100, 80)
+        }
+
+    def test_exif_orientation_applied(self, district, django_capture_on_commit_callbacks):
+        """اختبار تدوير الصورة حسب EXIF"""
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        upload = image_upload('photo.jpg', size=(1000, 500), mode='RGB', image_format='JPEG', exif=exif)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            representative = make_representative(district, profile_image=upload)
+
+        card = Representative.objects.get(pk=representative.pk).image_variants['profile_image']['card']
+        assert (card['width'], card['height']) == (240, 480)
+
+    def test_replacing_image_drops_old_variants(self, district, django_capture_on_commit_callbacks, media_root):
+        """اختبار حذف نسخ الصورة القديمة وتوليد نسخ الجديدة"""
+        with django_capture_on_commit_callbacks(execute=True):
+            representative = make_representative(district, profile_image=image_upload('first.png'))
+        old_paths = [
+            entry['webp'] for key, entry in
+            Representative.objects.get(pk=representative.pk).image_variants['profile_image'].items()
+            if key != 'source'
+        ]
+
+        representative = Representative.objects.get(pk=representative.pk)
+        with django_capture_on_commit_callbacks(execute=True):
+            representative.profile_image = image_upload('second.png')
+            representative.save()
+
+        variants = Representative.objects.get(pk=representative.pk).image_variants['profile_image']
+        assert 'second' in variants['thumb']['webp']
+        assert not any(os.path.exists(media_root / path) for path in old_paths)
+
+    def test_variants_in_api(self, district, django_capture_on_commit_callbacks):
+        """اختبار خريطة النسخ وsrcset في القائمة والتفاصيل"""
+        with django_capture_on_commit_callbacks(execute=True):
+            representative = make_representative(district, profile_image=image_upload())
+            baker.make(News, representative=representative, image=image_upload('news.png'))
+        client = APIClient()
+
+        listed = client.get('/api/representatives/').json()['results'][0]['profile_image_variants']
+        detail = client.get(f'/api/representatives/{representative.slug}/').json()
+
+        assert listed['thumb']['webp'].startswith('http://testserver/media/')
+        assert listed['srcset']['webp'].endswith('1600w')
+        assert detail['profile_image_variants'] == listed
+        assert detail['banner_image_variants'] is None
+        assert detail['news'][0]['image_variants']['card']['jpeg'].endswith('.jpg')
+
+    def test_backfill_command(self, district):
+        """اختبار توليد النسخ للصور الموجودة"""
+        representative = make_representative(district, profile_image=image_upload())
+
+        call_command('generate_image_variants', stdout=io.StringIO())
+
+        assert 'profile_image' in Representative.objects.get(pk=representative.pk).image_variants
+
+
+@pytest.mark.django_db
+class TestImageNormalization:
+    """اختبارات توحيد الصور الأصلية في مهمة Celery"""
+
+    def test_jpeg_normalized(self, district, django_capture_on_commit_callbacks, media_root):
+        """اختبار تطبيق الاتجاه وحذف EXIF وتصغير الأبعاد"""
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        exif[0x010F] = 'PhoneMaker'
+        upload = image_upload('phone.jpg', size=(3000, 1500), mode='RGB', image_format='JPEG', exif=exif)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            representative = make_representative(district, profile_image=upload)
+
+        stored = Representative.objects.get(pk=representative.pk)
+        with default_storage.open(stored.profile_image.name) as handle:
+            image = Image.open(handle)
+            assert image.size == (1280, 2560)
+            assert not image.getexif()
+        assert stored.profile_image.name != representative.profile_image.name
+        assert not os.path.exists(media_root / representative.profile_image.name)
+
+    def test_every_image_field_is_normalized(self, django_capture_on_commit_callbacks):
+        """اختبار توحيد صور النماذج التي لا نسخ لها مع الحفاظ على الشفافية"""
+        with django_capture_on_commit_callbacks(execute=True):
+            party = PoliticalParty.objects.create(name="حزب", logo=image_upload('logo.png', size=(3000, 3000)))
+
+        with default_storage.open(PoliticalParty.objects.get(pk=party.pk).logo.name) as handle:
+            image = Image.open(handle)
+            assert (image.format, image.mode, image.size) == ('PNG', 'RGBA', (2560, 2560))
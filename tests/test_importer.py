@@ -0,0 +1,218 @@
+"""
+اختبارات الاستيراد المجمع لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import io
+import json
+import tempfile
+
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from content.importer import import_file
+from content.models import (
+    Governorate, District, PoliticalParty, Representative, PlatformStatsSnapshot
+)
+
+CSV_HEADER = 'name,name_en,gender,governorate,district,district_number,party,status,email\n'
+
+
+@pytest.fixture
+def reference_data():
+    """محافظة بدائرتين وحزب"""
+    cairo = baker.make(Governorate, name="القاهرة", name_en="Cairo", code="CAI")
+    baker.make(District, name="مصر الجديدة", governorate=cairo, number=1)
+    baker.make(District, name="شبرا", governorate=cairo, number=2)
+    baker.make(PoliticalParty, name="حزب الوفد", abbreviation="WAFD")
+    return cairo
+
+
+@pytest.fixture
+def admin_client():
+    """عميل بمستخدم من فريق الإدارة"""
+    client = APIClient()
+    client.force_authenticate(baker.make(User, is_staff=True))
+    return client
+
+
+def csv_stream(*lines):
+    return io.StringIO(CSV_HEADER + ''.join(line + '\n' for line in lines))
+
+
+@pytest.mark.django_db
+class TestRepresentativeImporter:
+    """اختبارات الاستيراد على دفعات"""
+
+    def test_import_csv(self, reference_data):
+        """اختبار استيراد CSV مع حل الأسماء من الخرائط"""
+        stream = csv_stream(
+            'أحمد محمد,,ذكر,القاهرة,مصر الجديدة,,حزب الوفد,,',
+            'سارة علي,Sara Ali,female,Cairo,,2,WAFD,منتخب,sara@example.com',
+        )
+
+        report = import_file(stream, 'csv')
+
+        assert report.as_dict()['created'] == 2
+        assert report.failed == 0
+        ahmed = Representative.objects.get(name="أحمد محمد")
+        sara = Representative.objects.get(slug="sara-ali")
+        assert ahmed.district.name == "مصر الجديدة"
+        assert ahmed.party.name == "حزب الوفد"
+        assert ahmed.gender == 'male'
+        assert ahmed.name_normalized == "احمد محمد"
+        assert sara.district.name == "شبرا"
+        assert sara.status == 'elected'
+        assert PlatformStatsSnapshot.objects.get().total_representatives == 2
+
+    def test_queries_do_not_grow_with_rows(self, reference_data, django_assert_max_num_queries):
+        """اختبار أن عدد الاستعلامات لكل دفعة لا لكل صف"""
+        lines = [f'مرشح رقم {index},,male,القاهرة,شبرا,,,,' for index in range(200)]
+
+        with django_assert_max_num_queries(40):
+            report = import_file(csv_stream(*lines), 'csv', batch_size=100)
+
+        assert report.created == 200
+
+    def test_row_errors(self, reference_data):
+        """اختبار أخطاء الصفوف دون إيقاف الاستيراد"""
+        stream = csv_stream(
+            'نائب صحيح,,male,القاهرة,شبرا,,,,',
+            'دائرة مجهولة,,male,القاهرة,الزمالك,,,,',
+            ',,unknown,القاهرة,شبرا,,,,',
+            'نائب صحيح,,male,القاهرة,شبرا,,,,',
+        )
+
+        report = import_file(stream, 'csv')
+
+        errors = {error['line']: error['errors'] for error in report.errors}
+        assert report.created == 1
+        assert report.failed == 3
+        assert 'district' in errors[3]
+        assert set(errors[4]) == {'name', 'gender'}
+        assert errors[5] == {'name': ['الاسم مكرر في الملف']}
+
+    def test_existing_names_and_update(self, reference_data):
+        """اختبار رفض الأسماء الموجودة أو تحديثها مع update_existing"""
+        existing = baker.make(
+            Representative, name="نائب قديم", slug="old", district=District.objects.get(number=1)
+        )
+        line = 'نائب قديم,,female,القاهرة,شبرا,,,منتخب,'
+
+        rejected = import_file(csv_stream(line), 'csv')
+        updated = import_file(csv_stream(line), 'csv', update_existing=True)
+
+        existing.refresh_from_db()
+        assert rejected.failed == 1
+        assert updated.updated == 1
+        assert existing.status == 'elected'
+        assert existing.district.name == "شبرا"
+        assert existing.slug == "old"
+
+    def test_update_keeps_columns_missing_from_file(self, reference_data):
+        """اختبار أن التحديث من ملف ببعض الأعمدة لا يمس الأعمدة الأخرى"""
+        party = PoliticalParty.objects.get()
+        existing = baker.make(
+            Representative, name="نائب قديم", slug="old", district=District.objects.get(number=1),
+            party=party, gender='female', status='elected', profession="طبيبة", bio="سيرة النائبة"
+        )
+        stream = io.StringIO('name,email\nنائب قديم,new@example.com\n')
+
+        report = import_file(stream, 'csv', update_existing=True)
+
+        existing.refresh_from_db()
+        assert report.updated == 1
+        assert existing.email == 'new@example.com'
+        assert (existing.gender, existing.status) == ('female', 'elected')
+        assert (existing.profession, existing.bio) == ("طبيبة", "سيرة النائبة")
+        assert existing.district.number == 1
+        assert existing.party == party
+        assert "طبيبه" in existing.search_text
+
+    def test_new_row_requires_district(self, reference_data):
+        """اختبار رفض إنشاء نائب من ملف دون أعمدة الدائرة"""
+        report = import_file(io.StringIO('name,gender\nنائب جديد,male\n'), 'csv')
+
+        assert report.created == 0
+        assert report.errors == [{'line': 2, 'errors': {'district': ['هذا الحقل مطلوب']}}]
+
+    def test_duplicate_slugs_get_suffixes(self, reference_data):
+        """اختبار حجز روابط فريدة لنفس الاسم الإنجليزي"""
+        baker.make(Representative, name="محمد علي", slug="mohamed-ali", district=District.objects.first())
+        stream = csv_stream(
+            'محمد علي حسن,Mohamed Ali,male,القاهرة,شبرا,,,,',
+            'محمد علي محمود,Mohamed Ali,male,القاهرة,شبرا,,,,',
+        )
+
+        import_file(stream, 'csv', batch_size=1)
+
+        slugs = set(Representative.objects.values_list('slug', flat=True))
+        assert slugs == {'mohamed-ali', 'mohamed-ali-2', 'mohamed-ali-3'}
+
+    def test_import_jsonl_dry_run(self, reference_data):
+        """اختبار JSONL مع سطر غير صالح والتحقق دون حفظ"""
+        stream = io.StringIO(
+            json.dumps({'name': 'نائب', 'gender': 'male', 'district': 'شبرا'}, ensure_ascii=False)
+            + '\n{broken\n'
+        )
+
+        report = import_file(stream, 'jsonl', dry_run=True)
+
+        assert report.created == 1
+        assert report.errors == [{'line': 2, 'errors': {'non_field_errors': ['سطر غير صالح']}}]
+        assert not Representative.objects.exists()
+
+
+@pytest.mark.django_db
+class TestImportEntryPoints:
+    """اختبارات أمر الإدارة وواجهة الاستيراد"""
+
+    def test_management_command(self, reference_data):
+        """اختبار أمر import_representatives"""
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', encoding='utf-8') as handle:
+            handle.write(CSV_HEADER + 'نائب من الأمر,,male,القاهرة,شبرا,,,,\n')
+            handle.flush()
+            out = io.StringIO()
+            call_command('import_representatives', handle.name, stdout=out)
+
+        assert Representative.objects.filter(name="نائب من الأمر").exists()
+        assert '1 جديد' in out.getvalue()
+
+    def test_import_api(self, reference_data, admin_client):
+        """اختبار رفع ملف ومتابعة حالة المهمة"""
+        client = admin_client
+        upload = SimpleUploadedFile(
+            'candidates.csv', (CSV_HEADER + 'نائب من الواجهة,,male,القاهرة,شبرا,,,,\n').encode('utf-8')
+        )
+
+        response = client.post('/api/representatives/import/', {'file': upload}, format='multipart')
+        job = client.get(response.data['status_url']).json()
+
+        assert response.status_code == 202
+        assert job['status'] == 'completed'
+        assert job['report']['created'] == 1
+        assert Representative.objects.filter(name="نائب من الواجهة").exists()
+
+    def test_import_api_rejects_unknown_format(self, admin_client):
+        """اختبار رفض صيغة غير مدعومة"""
+        upload = SimpleUploadedFile('candidates.xlsx', b'data')
+
+        response = admin_client.post('/api/representatives/import/', {'file': upload}, format='multipart')
+
+        assert response.status_code == 400
+
+    def test_import_api_requires_staff(self, reference_data):
+        """اختبار رفض الاستيراد من الزوار والمستخدمين من خارج الإدارة"""
+        upload = SimpleUploadedFile('candidates.csv', (CSV_HEADER + 'نائب دخيل,,male,القاهرة,شبرا,,,,\n').encode('utf-8'))
+        client = APIClient()
+
+        anonymous = client.post('/api/representatives/import/', {'file': upload}, format='multipart')
+        client.force_authenticate(baker.make(User, is_staff=False))
+        upload.seek(0)
+        member = client.post('/api/representatives/import/', {'file': upload}, format='multipart')
+
+        assert anonymous.status_code in (401, 403)
+        assert member.status_code == 403
+        assert not Representative.objects.filter(name="نائب دخيل").exists()
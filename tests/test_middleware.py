@@ -0,0 +1,64 @@
+"""
+اختبارات الـ Middleware لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+from asgiref.sync import iscoroutinefunction
+from django.http import HttpResponse
+from django.test import RequestFactory
+from model_bakery import baker
+from rest_framework.test import APIClient
+from content.middleware import CompressionMiddleware, accepted_encodings
+from content.models import Governorate, District, Representative
+
+
+@pytest.fixture
+def many_representatives():
+    """قائمة كبيرة بما يكفي للضغط"""
+    district = baker.make(District, governorate=baker.make(Governorate), number=1)
+    baker.make(Representative, district=district, admin_approved=True, _quantity=15)
+
+
+@pytest.mark.django_db
+class TestCompressionMiddleware:
+    """اختبارات ضغط الاستجابات"""
+
+    def test_large_json_is_gzipped(self, many_representatives):
+        """اختبار ضغط الاستجابات الكبيرة"""
+        response = APIClient().get('/api/representatives/', HTTP_ACCEPT_ENCODING='gzip, deflate')
+
+        assert response['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response['Vary']
+        assert response['ETag'].startswith('W/"')
+        assert len(json.loads(gzip.decompress(response.content))['results']) == 15
+
+    def test_small_or_unaccepted_not_compressed(self, many_representatives):
+        """اختبار عدم ضغط الاستجابات الصغيرة أو بدون Accept-Encoding"""
+        client = APIClient()
+
+        assert not client.get('/health/', HTTP_ACCEPT_ENCODING='gzip').has_header('Content-Encoding')
+        assert not client.get('/api/representatives/').has_header('Content-Encoding')
+        assert not client.get(
+            '/api/representatives/', HTTP_ACCEPT_ENCODING='gzip;q=0'
+        ).has_header('Content-Encoding')
+
+    def test_accepted_encodings(self):
+        """اختبار قراءة Accept-Encoding"""
+        assert accepted_encodings('br;q=1.0, gzip;q=0.5, identity;q=0') == {'br', 'gzip'}
+
+    def test_async_chain(self):
+        """اختبار عمل الـ middleware غير متزامن تحت ASGI دون تحويل السلسلة"""
+        body = json.dumps({'items': ['نائب'] * 500}).encode('utf-8')
+
+        async def get_response(request):
+            return HttpResponse(body, content_type='application/json')
+        middleware = CompressionMiddleware(get_response)
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+
+        assert iscoroutinefunction(middleware)
+        response = asyncio.run(middleware(request))
+        assert gzip.decompress(response.content) == body
@@ -0,0 +1,165 @@
+"""
+اختبارات الترقيم لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+from decimal import Decimal
+
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+from content.models import Governorate, District, Representative, FAQ
+from content import pagination
+from content.pagination import COUNT_STRATEGIES, cached_count, estimated_count, exact_count
+
+
+@pytest.fixture
+def representatives():
+    """سبعة نواب بتقييمات متساوية جزئياً لاختبار كسر التساوي"""
+    governorate = baker.make(Governorate, name="القاهرة")
+    district = baker.make(District, governorate=governorate, number=1)
+    ratings = [Decimal('4.50'), Decimal('4.50'), Decimal('4.00'), Decimal('3.00'),
+               Decimal('3.00'), Decimal('3.00'), Decimal('1.00')]
+    return [
+        baker.make(
+            Representative, name=f"نائب {index}", name_en=f"Rep {index}", district=district,
+            rating=rating, is_distinguished=index == 6, admin_approved=True
+        )
+        for index, rating in enumerate(ratings)
+    ]
+
+
+def _walk(client, url, params):
+    """تتبع روابط next حتى النهاية"""
+    pages = []
+    response = client.get(url, params)
+    while True:
+        data = response.json()
+        pages.append(data)
+        if not data['next']:
+            return pages
+        response = client.get(data['next'])
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """اختبارات الترقيم بالمؤشر"""
+
+    def test_walks_default_ordering_without_gaps(self, representatives):
+        """اختبار تغطية كل الصفوف بترتيب القائمة الافتراضي"""
+        client = APIClient()
+        pages = _walk(client, '/api/representatives/', {'pagination': 'cursor', 'page_size': 3})
+        cursor_names = [item['name'] for page in pages for item in page['results']]
+
+        offset_names = [
+            item['name'] for item in
+            client.get('/api/representatives/', {'page_size': 100}).json()['results']
+        ]
+
+        assert len(pages) == 3
+        assert cursor_names == offset_names
+        assert cursor_names[0] == "نائب 6"
+        assert 'count' not in pages[0]
+
+    def test_insert_during_walk_does_not_duplicate(self, representatives):
+        """اختبار عدم تكرار الصفوف عند الإضافة أثناء التصفح"""
+        client = APIClient()
+        first = client.get('/api/representatives/', {'pagination': 'cursor', 'page_size': 3}).json()
+        baker.make(
+            Representative, name="نائب جديد", district=representatives[0].district,
+            rating=Decimal('5.00'), admin_approved=True
+        )
+        second = client.get(first['next']).json()
+
+        first_names = {item['name'] for item in first['results']}
+        assert not first_names & {item['name'] for item in second['results']}
+
+    def test_previous_link_returns_same_page(self, representatives):
+        """اختبار الرجوع للصفحة السابقة"""
+        client = APIClient()
+        first = client.get('/api/representatives/', {'pagination': 'cursor', 'page_size': 3}).json()
+        second = client.get(first['next']).json()
+        back = client.get(second['previous']).json()
+
+        assert back['results'] == first['results']
+        assert first['previous'] is None
+
+    def test_opt_in_count_and_invalid_cursor(self, representatives):
+        """اختبار العدد الاختياري ورفض المؤشر غير الصالح"""
+        client = APIClient()
+        response = client.get('/api/representatives/', {'pagination': 'cursor', 'include_count': 'true'})
+
+        assert response.json()['count'] == 7
+        assert client.get('/api/representatives/', {'cursor': 'not-a-cursor'}).status_code == 404
+
+    def test_faq_cursor_pagination(self):
+        """اختبار الترقيم بالمؤشر في الأسئلة الشائعة"""
+        for order in range(5):
+            baker.make(FAQ, question=f"سؤال {order}", order=order)
+
+        pages = _walk(APIClient(), '/api/faq/', {'pagination': 'cursor', 'page_size': 2})
+
+        assert [item['order'] for page in pages for item in page['results']] == [0, 1, 2, 3, 4]
+
+    def test_search_cursor_pagination(self, representatives):
+        """اختبار الترقيم بالمؤشر في واجهة البحث"""
+        pages = _walk(APIClient(), '/api/search/', {'q': 'نائب', 'pagination': 'cursor', 'page_size': 4})
+
+        assert [len(page['representatives']) for page in pages] == [4, 3]
+
+
+@pytest.mark.django_db
+class TestCountStrategies:
+    """اختبارات طرق حساب العدد الكلي"""
+
+    def test_exact_and_cached_counts(self, representatives):
+        """اختبار العد الدقيق والعد المخزن"""
+        queryset = Representative.objects.filter(rating__gte=3)
+
+        assert exact_count(queryset) == (6, True)
+        assert cached_count(queryset) == (6, True)
+        assert cached_count(queryset) == (6, False)
+
+    def test_cached_count_follows_writes(self, representatives):
+        """اختبار تغير مفتاح العد المخزن بعد التعديل"""
+        queryset = Representative.objects.all()
+        cached_count(queryset)
+        baker.make(Representative, district=representatives[0].district, admin_approved=True)
+
+        assert cached_count(queryset) == (8, True)
+
+    def test_estimate_falls_back_without_postgres(self, representatives):
+        """اختبار رجوع التقدير إلى العد المخزن على SQLite"""
+        assert estimated_count(Representative.objects.all()) == (7, True)
+
+    def test_response_flags_inexact_count(self, representatives, monkeypatch):
+        """اختبار علم count_exact والتصفح بعد آخر صفحة مقدرة"""
+        monkeypatch.setattr(pagination, 'COUNT_STRATEGY', 'estimate')
+        monkeypatch.setitem(COUNT_STRATEGIES, 'estimate', lambda queryset: (3, False))
+        client = APIClient()
+
+        response = client.get('/api/representatives/', {'page_size': 2, 'page': 3})
+
+        assert response.json()['count'] == 3
+        assert response.json()['count_exact'] is False
+        assert len(response.json()['results']) == 2
+        assert response.json()['next'] is not None
+        last = client.get(response.json()['next']).json()
+        assert len(last['results']) == 1
+        assert last['next'] is None
+
+    def test_list_follows_count_strategy_setting(self, representatives, monkeypatch):
+        """اختبار اتباع قائمة النواب لطريقة العد من CONTENT_COUNT_STRATEGY"""
+        monkeypatch.setattr(pagination, 'COUNT_STRATEGY', 'exact')
+        monkeypatch.setitem(COUNT_STRATEGIES, 'estimate', lambda queryset: (3, False))
+
+        data = APIClient().get('/api/representatives/').json()
+
+        assert data['count'] == 7
+        assert data['count_exact'] is True
+
+    def test_search_reports_count_exact(self, representatives):
+        """اختبار علم count_exact في واجهة البحث"""
+        response = APIClient().get('/api/search/', {'q': 'نائب', 'page_size': 5})
+
+        assert response.json()['count_exact'] is True
+        assert response.json()['has_next'] is True
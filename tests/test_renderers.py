@@ -0,0 +1,67 @@
+"""
+اختبارات محول JSON لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import pickle
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+from content import renderers
+from content.renderers import FastJSONRenderer, JSONFragment, dumps
+
+
+SAMPLE = {
+    'name': 'القاهرة',
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'rating': Decimal('4.50'),
+    'created_at': datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+    'items': [1, 2.5, None, True],
+}
+
+
+class TestFastJSONRenderer:
+    """اختبارات المحول السريع"""
+
+    def test_matches_drf_renderer(self):
+        """اختبار تطابق الناتج مع JSONRenderer في DRF"""
+        assert FastJSONRenderer().render(SAMPLE) == JSONRenderer().render(SAMPLE)
+
+    def test_arabic_is_not_escaped(self):
+        """اختبار كتابة النص العربي دون \\u"""
+        assert dumps({'name': 'نائب'}) == '{"name":"نائب"}'.encode('utf-8')
+
+    def test_fragments_are_spliced(self):
+        """اختبار إدراج الأجزاء الجاهزة كما هي"""
+        fragment = JSONFragment('[{"name":"الأقصر"}]')
+
+        content = dumps({'governorates': fragment, 'nested': [fragment], 'count': 1})
+
+        assert content == '{"governorates":[{"name":"الأقصر"}],"nested":[[{"name":"الأقصر"}]],"count":1}'.encode('utf-8')
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """اختبار العمل دون orjson"""
+        expected = dumps({'data': SAMPLE, 'fragment': JSONFragment(b'{"a":1}')})
+        monkeypatch.setattr(renderers, 'orjson', None)
+        monkeypatch.setattr(renderers, 'NATIVE_FRAGMENTS', False)
+
+        assert dumps({'data': SAMPLE, 'fragment': JSONFragment(b'{"a":1}')}) == expected
+
+    def test_fragment_with_other_renderers(self):
+        """اختبار قبول محول DRF الأصلي للأجزاء وتخزينها بـ pickle"""
+        fragment = pickle.loads(pickle.dumps(JSONFragment('{"a":1}')))
+
+        assert JSONRenderer().render({'x': fragment}) == b'{"x":{"a":1}}'
+
+    def test_indent_request(self):
+        """اختبار طلب التنسيق"""
+        content = FastJSONRenderer().render(
+            {'x': JSONFragment('[1]')}, 'application/json; indent=2', {}
+        )
+
+        assert content == b'{\n  "x": [\n    1\n  ]\n}'
+
+    def test_none_renders_empty(self):
+        """اختبار عدم كتابة شيء لـ None"""
+        assert FastJSONRenderer().render(None) == b''
@@ -0,0 +1,164 @@
+"""
+اختبارات محرك البحث لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+from content.models import Governorate, District, PoliticalParty, Representative
+from content.search import (
+    normalize_arabic, search_representatives, update_search_index,
+    word_similarity, NGramIndex, fuzzy_search_representatives
+)
+
+
+@pytest.fixture
+def candidates():
+    """مرشحون في محافظتين"""
+    cairo = baker.make(Governorate, name="القاهرة", code="CAI")
+    alex = baker.make(Governorate, name="الإسكندرية", code="ALX")
+    heliopolis = baker.make(District, name="مصر الجديدة", governorate=cairo, number=1)
+    montaza = baker.make(District, name="المنتزه", governorate=alex, number=1)
+    party = baker.make(PoliticalParty, name="حزب المستقبل")
+
+    return {
+        'ahmed': baker.make(
+            Representative, name="أحمد إبراهيم", name_en="Ahmed Ibrahim", district=heliopolis,
+            party=party, profession="مهندس", admin_approved=True
+        ),
+        'fatma': baker.make(
+            Representative, name="فاطمة مصطفى", name_en="Fatma Mostafa", district=montaza,
+            profession="طبيبة", bio="عملت مع أحمد في المستشفى", admin_approved=True
+        ),
+        'hidden': baker.make(
+            Representative, name="أحمد غير معتمد", name_en="Ahmed Hidden", district=montaza,
+            admin_approved=False
+        ),
+    }
+
+
+class TestNormalizeArabic:
+    """اختبارات تطبيع النص العربي"""
+
+    def test_strips_tashkeel_and_tatweel(self):
+        """اختبار حذف التشكيل والتطويل"""
+        assert normalize_arabic("مُحَمَّـــد") == "محمد"
+
+    def test_unifies_letter_forms(self):
+        """اختبار توحيد الألف والياء والتاء المربوطة والهمزات"""
+        assert normalize_arabic("أحمد إيمان آمنة مصطفى مؤمن رئيس") == "احمد ايمان امنه مصطفي مومن رييس"
+
+    def test_lowercases_and_drops_punctuation(self):
+        """اختبار تحويل الحروف الصغيرة وحذف علامات الترقيم"""
+        assert normalize_arabic("Ahmed, Ibrahim!") == "ahmed ibrahim"
+        assert normalize_arabic(None) == ''
+
+
+@pytest.mark.django_db
+class TestSearchRepresentatives:
+    """اختبارات البحث"""
+
+    def _search(self, query):
+        queryset = Representative.objects.filter(is_active=True, admin_approved=True)
+        return list(search_representatives(queryset, query).values_list('name', flat=True))
+
+    def test_search_ignores_hamza_and_tashkeel(self, candidates):
+        """اختبار مطابقة الاسم رغم اختلاف الهمزة والتشكيل"""
+        assert "أحمد إبراهيم" in self._search("اَحمد ابراهيم")
+
+    def test_search_across_weighted_fields(self, candidates):
+        """اختبار البحث في المحافظة والحزب والمهنة"""
+        assert self._search("الاسكندريه") == ["فاطمة مصطفى"]
+        assert self._search("المستقبل") == ["أحمد إبراهيم"]
+        assert self._search("طبيبه") == ["فاطمة مصطفى"]
+
+    def test_all_terms_must_match(self, candidates):
+        """اختبار اشتراط مطابقة كل الكلمات"""
+        assert self._search("احمد مهندس") == ["أحمد إبراهيم"]
+
+    def test_empty_query(self, candidates):
+        """اختبار استعلام فارغ بعد التطبيع"""
+        assert self._search("!!") == []
+
+    def test_index_follows_related_renames(self, candidates):
+        """اختبار إعادة الفهرسة عند تغيير اسم المحافظة"""
+        governorate = Governorate.objects.get(name="القاهرة")
+        governorate.name = "العاصمة"
+        governorate.save()
+
+        assert self._search("العاصمه") == ["أحمد إبراهيم"]
+
+    def test_rebuild_index(self, candidates):
+        """اختبار إعادة بناء الفهرس بعد تعديلات جماعية"""
+        Representative.objects.filter(name="فاطمة مصطفى").update(profession="محامية")
+        update_search_index()
+
+        assert self._search("محاميه") == ["فاطمة مصطفى"]
+
+
+class TestTrigramSimilarity:
+    """اختبارات التشابه بالثلاثيات"""
+
+    def test_word_similarity_matches_pg_trgm(self):
+        """اختبار تطابق النتيجة مع word_similarity في pg_trgm"""
+        assert word_similarity('word', 'two words') == pytest.approx(0.8)
+        assert word_similarity('احمد', 'احمد ابراهيم') == 1.0
+        assert word_similarity('', 'احمد') == 0.0
+
+    def test_ngram_index_tolerates_typos(self):
+        """اختبار إيجاد الاسم رغم الخطأ الإملائي"""
+        index = NGramIndex()
+        index.add(1, 'احمد ابراهيم')
+        index.add(2, 'فاطمه مصطفي')
+
+        results = index.search('ابرهيم', threshold=0.4)
+
+        assert [key for key, _ in results] == [1]
+
+
+@pytest.mark.django_db
+class TestFuzzySearch:
+    """اختبارات البحث التقريبي"""
+
+    def test_misspelled_name_is_found(self, candidates):
+        """اختبار إيجاد النائب باسم به خطأ إملائي"""
+        queryset = Representative.objects.filter(admin_approved=True)
+        results = list(fuzzy_search_representatives(queryset, "احمد ابرهيم"))
+
+        assert [rep.name for rep in results] == ["أحمد إبراهيم"]
+        assert results[0].similarity >= 0.6
+
+    def test_list_filter_fuzzy_mode(self, candidates):
+        """اختبار فلتر الاسم التقريبي في قائمة النواب"""
+        client = APIClient()
+        exact = client.get('/api/representatives/', {'name': 'احمد ابرهيم'})
+        fuzzy = client.get('/api/representatives/', {'name': 'احمد ابرهيم', 'fuzzy': '1'})
+
+        assert exact.json()['count'] == 0
+        assert [item['name'] for item in fuzzy.json()['results']] == ["أحمد إبراهيم"]
+
+    def test_search_view_fuzzy(self, candidates):
+        """اختبار البحث التقريبي في واجهة البحث"""
+        response = APIClient().get('/api/search/', {'q': 'Ahmd Ibrahim', 'fuzzy': 'true'})
+
+        assert [item['name'] for item in response.json()['representatives']] == ["أحمد إبراهيم"]
+
+
+@pytest.mark.django_db
+class TestSearchView:
+    """اختبارات واجهة البحث"""
+
+    def test_search_endpoint_returns_results(self, candidates):
+        """اختبار استجابة البحث مع نتائج"""
+        response = APIClient().get('/api/search/', {'q': 'أحمد'})
+
+        assert response.status_code == 200
+        names = [item['name'] for item in response.json()['representatives']]
+        assert set(names) == {"أحمد إبراهيم", "فاطمة مصطفى"}
+        assert response.json()['total_count'] == 2
+
+    def test_search_requires_query(self):
+        """اختبار رفض البحث بدون كلمة"""
+        response = APIClient().get('/api/search/')
+
+        assert response.status_code == 400
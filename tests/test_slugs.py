@@ -0,0 +1,74 @@
+"""
+اختبارات حجز روابط النواب لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+from content import slugs
+from content.models import Governorate, District, Representative
+from content.slugs import allocate_slugs, base_slug
+
+
+@pytest.fixture
+def district():
+    return baker.make(District, governorate=baker.make(Governorate))
+
+
+@pytest.mark.django_db
+class TestSlugAllocation:
+    """اختبارات توليد الروابط الفريدة"""
+
+    def test_base_slug(self):
+        """اختبار الرابط الأساسي من الاسم الإنجليزي أو العربي"""
+        assert base_slug("أحمد علي", "Ahmed Ali") == 'ahmed-ali'
+        assert base_slug("أَحمد علي!") == 'أحمد-علي'
+        assert base_slug("!!!") == 'representative'
+
+    def test_same_name_gets_suffix(self, district):
+        """اختبار نائبين بنفس الاسم العربي"""
+        first = Representative.objects.create(name="محمد علي", gender='male', district=district)
+        second = Representative.objects.create(name="محمد علي", gender='male', district=district)
+
+        assert first.slug == 'محمد-علي'
+        assert second.slug == 'محمد-علي-2'
+
+    def test_batch_allocation(self, district, django_assert_num_queries):
+        """اختبار حجز دفعة باستعلامين مع التكرار داخل الدفعة"""
+        baker.make(Representative, name="أ", slug='ali', district=district)
+        baker.make(Representative, name="ب", slug='ali-2', district=district)
+        baker.make(Representative, name="ج", slug='omar-2', district=district)
+
+        with django_assert_num_queries(2):
+            allocated = allocate_slugs(['ali', 'omar', 'omar', 'ali', 'sara'])
+
+        assert allocated == ['ali-3', 'omar', 'omar-3', 'ali-4', 'sara']
+
+    def test_retry_when_another_writer_wins(self, district, monkeypatch):
+        """اختبار إعادة الحفظ إذا سبق كاتب آخر إلى نفس الرابط"""
+        baker.make(Representative, name="سابق", slug='karim', district=district)
+        real_taken_slugs = slugs.taken_slugs
+        calls = []
+
+        def stale_taken_slugs(bases):
+            calls.append(bases)
+            # أول قراءة لا ترى رابط الكاتب الآخر بعد
+            return set() if len(calls) == 1 else real_taken_slugs(bases)
+        monkeypatch.setattr(slugs, 'taken_slugs', stale_taken_slugs)
+
+        representative = Representative.objects.create(
+            name="كريم", name_en="Karim", gender='male', district=district
+        )
+
+        assert representative.slug == 'karim-2'
+
+    def test_create_api_returns_slug(self, district):
+        """اختبار إرجاع الرابط المحجوز من واجهة الإنشاء"""
+        client = APIClient()
+        data = {'name': 'هدى سالم', 'name_en': 'Hoda Salem', 'gender': 'female', 'district': district.id}
+        baker.make(Representative, name="أخرى", slug='hoda-salem', district=district)
+
+        response = client.post('/api/representatives/create/', data, format='json')
+
+        assert response.status_code == 201
+        assert response.data['slug'] == 'hoda-salem-2'
@@ -0,0 +1,177 @@
+"""
+اختبارات الإحصائيات لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import pytest
+from decimal import Decimal
+from io import StringIO
+from model_bakery import baker
+from rest_framework.test import APIClient
+from django.core.management import call_command
+from content.models import (
+    Governorate, District, PoliticalParty, Representative,
+    PlatformStatsSnapshot, GovernorateStatsSnapshot
+)
+from content.stats import compute_statistics, get_statistics
+
+
+@pytest.fixture
+def populated_platform():
+    """بيانات منصة صغيرة للإحصائيات"""
+    cairo = baker.make(Governorate, name="القاهرة", code="CAI")
+    giza = baker.make(Governorate, name="الجيزة", code="GIZ")
+    baker.make(Governorate, name="أسوان", code="ASW")
+    cairo_district = baker.make(District, governorate=cairo, number=1)
+    giza_district = baker.make(District, governorate=giza, number=1)
+    baker.make(PoliticalParty, name="حزب المستقبل")
+
+    baker.make(
+        Representative, name="مرشح أول", district=cairo_district, gender='male',
+        status='candidate', rating=Decimal('4.0'), solved_complaints=5,
+        received_complaints=10, is_distinguished=True
+    )
+    baker.make(
+        Representative, name="نائبة ثانية", district=cairo_district, gender='female',
+        status='elected', rating=Decimal('3.0'), solved_complaints=7,
+        received_complaints=7
+    )
+    baker.make(
+        Representative, name="نائب سابق", district=giza_district, gender='male',
+        status='former', rating=Decimal('2.0'), solved_complaints=1,
+        received_complaints=3
+    )
+    baker.make(
+        Representative, name="مرشح غير نشط", district=giza_district, gender='male',
+        status='candidate', rating=Decimal('5.0'), solved_complaints=100,
+        received_complaints=100, is_active=False
+    )
+
+
+@pytest.mark.django_db
+class TestComputeStatistics:
+    """اختبارات محرك الإحصائيات"""
+
+    def test_totals_and_breakdowns(self, populated_platform):
+        """اختبار الإجماليات والتقسيمات"""
+        data = compute_statistics()
+
+        assert data['total_representatives'] == 3
+        assert data['status_stats'] == {'candidate': 1, 'elected': 1, 'former': 1}
+        assert data['gender_stats'] == {'male': 2, 'female': 1}
+        assert data['total_distinguished'] == 1
+        assert data['total_governorates'] == 3
+        assert data['total_districts'] == 2
+        assert data['total_parties'] == 1
+        assert data['average_rating'] == Decimal('3.00')
+
+    def test_complaints_are_summed(self, populated_platform):
+        """اختبار جمع الشكاوى وليس عدّ الصفوف"""
+        data = compute_statistics()
+
+        assert data['total_solved_complaints'] == 13
+        assert data['total_received_complaints'] == 20
+
+    def test_governorate_stats_skip_empty(self, populated_platform):
+        """اختبار استبعاد المحافظات بلا نواب"""
+        data = compute_statistics()
+
+        assert data['governorate_stats'] == [
+            {'name': "الجيزة", 'count': 1},
+            {'name': "القاهرة", 'count': 2},
+        ]
+
+    def test_constant_query_count(self, populated_platform, django_assert_max_num_queries):
+        """اختبار أن عدد الاستعلامات ثابت ولا يتبع عدد المحافظات"""
+        for index in range(5):
+            baker.make(Governorate, name=f"محافظة {index}", code=f"G{index}")
+
+        with django_assert_max_num_queries(4):
+            compute_statistics()
+
+    def test_empty_platform(self):
+        """اختبار الإحصائيات بدون بيانات"""
+        data = compute_statistics()
+
+        assert data['total_representatives'] == 0
+        assert data['total_solved_complaints'] == 0
+        assert data['average_rating'] == 0.0
+        assert data['governorate_stats'] == []
+
+
+@pytest.mark.django_db
+class TestStatisticsSnapshot:
+    """اختبارات لقطة الإحصائيات المحدثة تدريجياً"""
+
+    def test_snapshot_matches_direct_computation(self, populated_platform):
+        """اختبار تطابق اللقطة مع الحساب المباشر"""
+        assert get_statistics() == compute_statistics()
+
+    def test_snapshot_follows_updates(self, populated_platform):
+        """اختبار تحديث اللقطة عند تعديل النواب"""
+        get_statistics()
+        representative = Representative.objects.get(name="مرشح أول")
+        representative.status = 'elected'
+        representative.gender = 'female'
+        representative.rating = Decimal('5.0')
+        representative.solved_complaints = 9
+        representative.save()
+
+        inactive = Representative.objects.get(name="مرشح غير نشط")
+        inactive.is_active = True
+        inactive.save()
+
+        assert get_statistics() == compute_statistics()
+
+    def test_snapshot_follows_district_move(self, populated_platform):
+        """اختبار نقل العدد عند تغيير دائرة أو محافظة"""
+        get_statistics()
+        representative = Representative.objects.get(name="نائب سابق")
+        representative.district = District.objects.get(governorate__name="القاهرة")
+        representative.save()
+
+        district = District.objects.get(governorate__name="القاهرة")
+        district.governorate = Governorate.objects.get(name="أسوان")
+        district.save()
+
+        assert get_statistics() == compute_statistics()
+
+    def test_snapshot_follows_deletes(self, populated_platform):
+        """اختبار تحديث اللقطة عند الحذف"""
+        get_statistics()
+        Representative.objects.get(name="نائبة ثانية").delete()
+        Governorate.objects.get(name="الجيزة").delete()
+        PoliticalParty.objects.all().delete()
+
+        assert get_statistics() == compute_statistics()
+
+    def test_snapshot_read_is_constant(self, populated_platform, django_assert_num_queries):
+        """اختبار أن القراءة من اللقطة لا تمسح جدول النواب"""
+        get_statistics()
+
+        with django_assert_num_queries(2):
+            get_statistics()
+
+    def test_rebuild_command(self, populated_platform):
+        """اختبار أمر إعادة البناء بعد تعديلات لا تطلق signals"""
+        get_statistics()
+        Representative.objects.update(solved_complaints=0)
+        GovernorateStatsSnapshot.objects.all().delete()
+
+        call_command('rebuild_stats_snapshot', stdout=StringIO())
+
+        assert PlatformStatsSnapshot.objects.count() == 1
+        assert get_statistics() == compute_statistics()
+
+
+@pytest.mark.django_db
+class TestStatisticsView:
+    """اختبارات واجهة الإحصائيات"""
+
+    def test_statistics_endpoint(self, populated_platform):
+        """اختبار استجابة واجهة الإحصائيات"""
+        response = APIClient().get('/api/statistics/')
+
+        assert response.status_code == 200
+        assert response.data['total_representatives'] == 3
+        assert response.data['average_rating'] == '3.00'
+        assert response.data['total_solved_complaints'] == 13
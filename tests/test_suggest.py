@@ -0,0 +1,90 @@
+"""
+اختبارات الاقتراحات أثناء الكتابة لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+from content.models import Governorate, District, PoliticalParty, Representative
+from content.suggest import SuggestionIndex
+
+
+@pytest.fixture
+def directory():
+    """نواب ومحافظة ودائرة وحزب"""
+    cairo = baker.make(Governorate, name="القاهرة", name_en="Cairo", code="CAI")
+    district = baker.make(District, name="مصر الجديدة", governorate=cairo, number=1)
+    baker.make(PoliticalParty, name="حزب المستقبل", name_en="Future Party")
+    return {
+        'ahmed': baker.make(
+            Representative, name="أحمد إبراهيم", name_en="Ahmed Ibrahim", district=district,
+            admin_approved=True
+        ),
+        'ibrahim': baker.make(
+            Representative, name="إبراهيم سالم", name_en="Ibrahim Salem", district=district,
+            admin_approved=True
+        ),
+        'hidden': baker.make(
+            Representative, name="أحمد مخفي", name_en="Ahmed Hidden", district=district,
+            admin_approved=False
+        ),
+    }
+
+
+class TestSuggestionIndex:
+    """اختبارات فهرس البادئات"""
+
+    def _index(self):
+        return SuggestionIndex([
+            {'type': 'district', 'name': 'الأحمدية', 'slug': None},
+            {'type': 'representative', 'name': 'محمد أحمد', 'slug': 'mohamed-ahmed'},
+            {'type': 'representative', 'name': 'أحمد علي', 'name_en': 'Ahmed Ali', 'slug': 'ahmed-ali'},
+        ])
+
+    def test_prefix_start_ranks_before_inner_word(self):
+        """اختبار تقديم مطابقة بداية الاسم على مطابقة كلمة داخله"""
+        names = [entry['name'] for entry in self._index().search('احم')]
+
+        assert names == ['أحمد علي', 'محمد أحمد']
+
+    def test_english_names_and_limit(self):
+        """اختبار البحث بالاسم الإنجليزي وحد النتائج"""
+        index = self._index()
+
+        assert [entry['slug'] for entry in index.search('AHM')] == ['ahmed-ali']
+        assert len(index.search('ا', limit=1)) == 1
+        assert index.search('  ') == []
+
+
+@pytest.mark.django_db
+class TestSuggestView:
+    """اختبارات واجهة الاقتراحات"""
+
+    def test_suggest_returns_names_slugs_and_districts(self, directory):
+        """اختبار إرجاع الاسم والرابط والدائرة للنواب المعتمدين فقط"""
+        response = APIClient().get('/api/search/suggest/', {'q': 'احمد'})
+
+        assert response.status_code == 200
+        suggestions = response.json()['suggestions']
+        assert [item['name'] for item in suggestions] == ["أحمد إبراهيم"]
+        assert suggestions[0]['slug'] == directory['ahmed'].slug
+        assert suggestions[0]['district'] == "مصر الجديدة"
+        assert suggestions[0]['governorate'] == "القاهرة"
+
+    def test_suggest_covers_places_and_parties(self, directory):
+        """اختبار اقتراح المحافظات والأحزاب"""
+        client = APIClient()
+
+        assert client.get('/api/search/suggest/', {'q': 'cai'}).json()['suggestions'][0]['type'] == 'governorate'
+        assert client.get('/api/search/suggest/', {'q': 'المستق'}).json()['suggestions'][0]['type'] == 'party'
+
+    def test_index_rebuilt_after_changes(self, directory, monkeypatch):
+        """اختبار إعادة بناء الفهرس بعد تغير أجيال النماذج"""
+        monkeypatch.setattr('content.suggest.LOCAL_CACHE_RECHECK', 0)
+        client = APIClient()
+        client.get('/api/search/suggest/', {'q': 'احمد'})
+
+        baker.make(Representative, name="أحمد جديد", district=directory['ahmed'].district, admin_approved=True)
+        response = client.get('/api/search/suggest/', {'q': 'احمد'})
+
+        assert len(response.json()['suggestions']) == 2
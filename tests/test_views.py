@@ -0,0 +1,101 @@
+"""
+اختبارات الـ Views لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import pytest
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework.test import APIClient
+from content.models import (
+    Governorate, District, PoliticalParty, Representative,
+    RepresentativeImage, Achievement, News, Event
+)
+
+
+@pytest.fixture
+def profile():
+    """نائب باسم عربي فقط مع عناصر تابعة نشطة وغير نشطة"""
+    governorate = baker.make(Governorate, name="القاهرة")
+    district = baker.make(District, name="مصر الجديدة", governorate=governorate, number=1)
+    party = baker.make(PoliticalParty, name="حزب المستقبل")
+    representative = baker.make(
+        Representative, name="محمود حسن", name_en="", district=district, party=party,
+        admin_approved=True
+    )
+    baker.make(RepresentativeImage, representative=representative, _quantity=2)
+    baker.make(RepresentativeImage, representative=representative, is_active=False)
+    baker.make(Achievement, representative=representative, _quantity=3)
+    baker.make(News, representative=representative, _quantity=Representative.LATEST_NEWS_LIMIT + 2)
+    baker.make(Event, representative=representative, admin_approved=True, event_date=timezone.now())
+    baker.make(Event, representative=representative, admin_approved=False, event_date=timezone.now())
+    return representative
+
+
+@pytest.mark.django_db
+class TestRepresentativeDetail:
+    """اختبارات صفحة النائب"""
+
+    def test_profile_loads_in_fixed_queries(self, profile, django_assert_num_queries):
+        """اختبار تحميل الصفحة بعدد ثابت من الاستعلامات"""
+        # استعلام updated_at للـ ETag ثم النائب و4 علاقات تابعة
+        with django_assert_num_queries(6):
+            response = APIClient().get(f'/api/representatives/{profile.slug}/')
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['governorate_name'] == "القاهرة"
+        assert data['party_name'] == "حزب المستقبل"
+        assert len(data['additional_images']) == 2
+        assert len(data['achievement_list']) == 3
+        assert len(data['news']) == Representative.LATEST_NEWS_LIMIT
+        assert [event['admin_approved'] for event in data['events']] == [True]
+
+    def test_arabic_slug_route(self, profile):
+        """اختبار الرابط العربي للصفحة الشخصية"""
+        response = APIClient().get(f'/{profile.slug}/')
+
+        assert profile.slug == "محمود-حسن"
+        assert response.status_code == 200
+        assert response.json()['name'] == "محمود حسن"
+
+    def test_unapproved_profile_not_found(self, profile):
+        """اختبار إخفاء النائب غير المعتمد"""
+        profile.admin_approved = False
+        profile.save()
+
+        assert APIClient().get(f'/{profile.slug}/').status_code == 404
+
+
+@pytest.mark.django_db
+class TestRepresentativeListQueries:
+    """اختبارات استعلامات قائمة النواب"""
+
+    def test_list_page_does_not_query_per_row(self, django_assert_max_num_queries):
+        """اختبار عدم تنفيذ استعلام لكل صف وعدم جلب الأعمدة الكبيرة"""
+        for number in range(1, 6):
+            district = baker.make(District, number=number)
+            baker.make(
+                Representative, district=district, party=baker.make(PoliticalParty),
+                bio="سيرة " * 100, admin_approved=True
+            )
+
+        # ترويسات التحقق + العدد + الصفحة
+        with django_assert_max_num_queries(3) as captured:
+            response = APIClient().get('/api/representatives/')
+
+        assert len(response.json()['results']) == 5
+        assert all(item['governorate_name'] for item in response.json()['results'])
+        assert not any('"bio"' in query['sql'] for query in captured.captured_queries)
+
+    def test_search_page_does_not_query_per_row(self, django_assert_max_num_queries):
+        """اختبار استعلامات صفحة البحث"""
+        for number in range(1, 4):
+            baker.make(
+                Representative, name=f"نائب {number}", district=baker.make(District, number=number),
+                party=baker.make(PoliticalParty), admin_approved=True
+            )
+
+        with django_assert_max_num_queries(2):
+            response = APIClient().get('/api/search/', {'q': 'نائب'})
+
+        assert response.json()['total_count'] == 3
@@ -0,0 +1,132 @@
+"""
+اختبارات تسخين الـ cache لخدمة المحتوى - منصة نائبك.كوم
+"""
+
+import asyncio
+import threading
+
+import pytest
+from model_bakery import baker
+from rest_framework.test import APIClient
+from content import tasks, warming
+from content.cache import reset_cache_stats, cache_stats
+from content.models import Governorate, District, Representative, PlatformStatsSnapshot
+
+
+@pytest.fixture
+def representatives():
+    cairo = baker.make(Governorate, name="القاهرة", is_active=True)
+    giza = baker.make(Governorate, name="الجيزة", is_active=True)
+    return [
+        baker.make(
+            Representative, name=f"نائب {index}", slug=f'rep-{index}', is_active=True, admin_approved=True,
+            district=baker.make(District, governorate=governorate, number=index)
+        )
+        for index, governorate in enumerate([cairo, giza, cairo], start=1)
+    ]
+
+
+def public_client():
+    """عميل بنفس المضيف والبروتوكول الذي تُسخن له الاستجابات"""
+    return APIClient(HTTP_HOST=warming.WARM_HOST, **{'wsgi.url_scheme': 'https' if warming.WARM_SECURE else 'http'})
+
+
+@pytest.mark.django_db
+class TestCacheWarming:
+    """اختبارات تسخين المسارات الأكثر طلباً"""
+
+    def test_warmed_routes_served_from_cache(self, representatives, django_assert_num_queries):
+        """اختبار أن المسارات المسخنة تُقرأ من الـ cache دون استعلامات"""
+        warming.warm_caches()
+        client = public_client()
+        reset_cache_stats()
+
+        with django_assert_num_queries(0):
+            assert client.get('/api/statistics/').status_code == 200
+            assert client.get('/api/representatives/').status_code == 200
+            assert client.get('/api/representatives/', {'governorate': 'الجيزة'}).status_code == 200
+            assert client.get('/api/filter-options/').status_code == 200
+
+        assert cache_stats()['misses'] == 0
+
+    def test_top_representatives_by_traffic(self, representatives, django_assert_num_queries):
+        """اختبار ترتيب النواب بالزيارات وتسخين صفحاتهم فقط"""
+        client = public_client()
+        for slug, visits in [('rep-2', 3), ('rep-3', 1)]:
+            for _ in range(visits):
+                client.get(f'/api/representatives/{slug}/')
+        warming.traffic.flush()
+
+        assert warming.top_representatives(1) == ['rep-2']
+
+        from django.core.cache import cache
+        cache.clear()
+        warming.traffic.clear()
+        warming.traffic.hit('rep-2')
+        warming.traffic.flush()
+        warming.warm_caches(top=1)
+
+        # طلبات التسخين لا تُحسب زيارات
+        assert warming.top_representatives() == ['rep-2']
+        with django_assert_num_queries(0):
+            client.get('/api/representatives/rep-2/')
+        reset_cache_stats()
+        client.get('/api/representatives/rep-1/')
+        assert cache_stats()['misses'] == 1
+
+    def test_missing_slugs_not_counted(self, representatives):
+        """اختبار أن روابط النواب غير الموجودة لا تُحسب زيارات"""
+        client = public_client()
+        for slug in ['rep-1', 'no-such-rep', 'another-junk-slug']:
+            client.get(f'/api/representatives/{slug}/')
+        warming.traffic.flush()
+
+        assert warming.top_representatives() == ['rep-1']
+
+    def test_counter_capped_between_flushes(self, monkeypatch):
+        """اختبار دمج العداد مبكراً عند بلوغ حده وحفظ الأكثر زيارة فقط"""
+        monkeypatch.setattr(warming, 'TRAFFIC_TRACKED', 3)
+        counter = warming.TrafficCounter(flush_interval=3600)
+        for slug in ['a', 'a', 'b', 'c', 'd', 'e']:
+            counter.hit(slug)
+
+        assert len(counter._counts) < 3
+        counter.flush()
+        assert warming.top_representatives()[0] == 'a'
+        assert len(warming.top_representatives()) == 3
+
+    def test_async_hit_flushes_off_event_loop(self, monkeypatch):
+        """اختبار أن دمج العدادات من المسار غير المتزامن يتم خارج حلقة الأحداث"""
+        counter = warming.TrafficCounter(flush_interval=0)
+        flushed_on = []
+        monkeypatch.setattr(counter, 'flush', lambda: flushed_on.append(threading.current_thread()))
+
+        async def visit():
+            await counter.ahit('rep-1')
+            return threading.current_thread()
+
+        loop_thread = asyncio.run(visit())
+
+        assert flushed_on and flushed_on[0] is not loop_thread
+
+    def test_decay_traffic(self):
+        """اختبار تنصيف العدادات وحذف ما نزل عن زيارة واحدة"""
+        for slug, visits in [('a', 8), ('b', 1)]:
+            for _ in range(visits):
+                warming.traffic.hit(slug)
+        warming.traffic.flush()
+
+        warming.decay_traffic()
+
+        assert warming.top_representatives() == ['a']
+
+    def test_rebuild_stats_snapshot_task(self, representatives):
+        """اختبار إعادة بناء لقطة الإحصائيات في المهمة الدورية"""
+        PlatformStatsSnapshot.objects.all().delete()
+
+        tasks.rebuild_stats_snapshot.delay()
+
+        snapshot = PlatformStatsSnapshot.objects.get(pk=PlatformStatsSnapshot.SINGLETON_ID)
+        assert snapshot.total_representatives == 3
+        response = APIClient().get('/api/statistics/')
+        assert response.json()['total_representatives'] == 3